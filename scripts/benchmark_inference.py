@@ -0,0 +1,183 @@
+"""Benchmark de l'inférence : latences p50/p95/p99, débit et pic mémoire.
+
+Couvre le chargement du modèle, `predict_single` (pipeline et scoreur
+compilé), `predict_batch` pour plusieurs tailles de lot et l'aller-retour
+complet `/predict` via le client de test Flask. Le rapport JSON est comparé à
+une baseline ; le script échoue (code 1) en cas de régression au-delà de la
+tolérance.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+from credit_g_ml.benchmarking import (  # noqa: E402
+    BenchmarkResult,
+    build_report,
+    compare_to_baseline,
+    load_report,
+    measure,
+    write_report,
+)
+from credit_g_ml.compiled import compile_pipeline  # noqa: E402
+from credit_g_ml.config import RANDOM_STATE  # noqa: E402
+from credit_g_ml.inference import (  # noqa: E402
+    DEFAULT_MODEL_PATH,
+    load_model,
+    predict_batch,
+    predict_single,
+)
+from credit_g_ml.metadata import load_categorical_values  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-path", type=Path, default=DEFAULT_MODEL_PATH)
+    parser.add_argument(
+        "--output", type=Path, default=REPORTS_DIR / "benchmark_inference.json"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=REPORTS_DIR / "benchmark_baseline.json"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Régression tolérée (0.2 = 20 %%)"
+    )
+    parser.add_argument("--n-calls", type=int, default=300)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000]
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Enregistre ce rapport comme nouvelle baseline",
+    )
+    return parser.parse_args()
+
+
+def make_payloads(
+    categorical_values: dict[str, list[str]], n: int, seed: int = RANDOM_STATE
+) -> list[dict]:
+    """Génère des payloads valides et variés (évite de ne mesurer qu'un cas)."""
+    rng = np.random.default_rng(seed)
+    columns = {
+        "duration": rng.integers(4, 72, n),
+        "credit_amount": rng.uniform(250, 18000, n).round(0),
+        "installment_commitment": rng.integers(1, 5, n),
+        "residence_since": rng.integers(1, 5, n),
+        "age": rng.integers(19, 75, n),
+        "existing_credits": rng.integers(1, 5, n),
+        "num_dependents": rng.integers(1, 3, n),
+    }
+    for col, values in categorical_values.items():
+        columns[col] = rng.choice(values, n)
+    return [
+        {col: values[i].item() for col, values in columns.items()} for i in range(n)
+    ]
+
+
+def run_benchmarks(
+    model_path: Path, n_calls: int, batch_sizes: list[int]
+) -> list[BenchmarkResult]:
+    results = [
+        measure("model_load", lambda: load_model(model_path), n_calls=5, warmup=1)
+    ]
+
+    pipeline = load_model(model_path)
+    categorical_values = load_categorical_values(model_path, pipeline=pipeline)
+    payloads = make_payloads(categorical_values, max(max(batch_sizes), n_calls))
+    cycle = itertools.cycle(payloads)
+
+    results.append(
+        measure(
+            "predict_single", lambda: predict_single(pipeline, next(cycle)), n_calls
+        )
+    )
+    scorer = compile_pipeline(pipeline)
+    results.append(
+        measure(
+            "predict_single_compiled",
+            lambda: predict_single(scorer, next(cycle)),
+            n_calls,
+        )
+    )
+
+    for size in batch_sizes:
+        batch = payloads[:size]
+        results.append(
+            measure(
+                f"predict_batch_{size}",
+                lambda batch=batch: predict_batch(pipeline, batch),
+                n_calls=max(5, min(n_calls, 100_000 // size)),
+                rows_per_call=size,
+            )
+        )
+
+    # Aller-retour HTTP complet, cache de prédictions désactivé
+    os.environ["MODEL_PATH"] = str(model_path)
+    os.environ["PREDICTION_CACHE_SIZE"] = "0"
+    from api.app import app
+
+    client = app.test_client()
+    headers = {"X-API-TOKEN": os.getenv("API_TOKEN", "")}
+    results.append(
+        measure(
+            "api_predict",
+            lambda: client.post("/predict", json=next(cycle), headers=headers),
+            n_calls,
+        )
+    )
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    results = run_benchmarks(args.model_path, args.n_calls, args.batch_sizes)
+
+    import sklearn
+
+    report = build_report(
+        results, {"sklearn": sklearn.__version__, "model_path": str(args.model_path)}
+    )
+    write_report(report, args.output)
+
+    print(f"{'benchmark':<26}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rows/s':>14}")
+    for r in results:
+        print(
+            f"{r.name:<26}{r.p50_ms:>10.3f}{r.p95_ms:>10.3f}{r.p99_ms:>10.3f}"
+            f"{r.rows_per_s:>14,.0f}"
+        )
+    print(f"Rapport écrit dans : {args.output}")
+
+    if args.save_baseline:
+        write_report(report, args.baseline)
+        print(f"Baseline enregistrée dans : {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("Pas de baseline : comparaison ignorée (--save-baseline pour en créer).")
+        return
+
+    regressions = compare_to_baseline(
+        report, load_report(args.baseline), args.tolerance
+    )
+    if regressions:
+        print("Régressions de performance :")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print(f"Aucune régression au-delà de {args.tolerance:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
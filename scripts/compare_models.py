@@ -0,0 +1,83 @@
+"""Compare les familles de modèles (AUC, entraînement, latence, débit, taille).
+
+Écrit reports/model_comparison.json et indique le modèle recommandé : meilleur
+AUC parmi ceux dont la latence unitaire p95 respecte `--latency-budget-ms`.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+from credit_g_ml.comparison import (  # noqa: E402
+    build_comparison_report,
+    compare_model,
+    select_model,
+    write_comparison_report,
+)
+from credit_g_ml.data_loading import load_local_credit_g  # noqa: E402
+from credit_g_ml.modeling import MODEL_BUILDERS  # noqa: E402
+from credit_g_ml.preprocessing import train_test_split_credit_g  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output", type=Path, default=REPORTS_DIR / "model_comparison.json"
+    )
+    parser.add_argument(
+        "--latency-budget-ms",
+        type=float,
+        default=None,
+        help="Latence unitaire p95 maximale acceptée",
+    )
+    parser.add_argument("--n-calls", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    df = load_local_credit_g()
+    X_train, X_test, y_train, y_test = train_test_split_credit_g(df)
+
+    results = []
+    for name, build in MODEL_BUILDERS.items():
+        result = compare_model(
+            name,
+            build(),
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            n_calls=args.n_calls,
+            batch_size=args.batch_size,
+        )
+        results.append(result)
+        print(
+            f"{name:<24} AUC {result.roc_auc:.4f} | fit {result.train_time_s:6.2f} s"
+            f" | p50 {result.single_p50_ms:6.2f} ms"
+            f" | p95 {result.single_p95_ms:6.2f} ms"
+            f" | {result.batch_rows_per_s:>10,.0f} lignes/s"
+            f" | {result.artifact_bytes / 1024:7.1f} Ko"
+        )
+
+    recommended = select_model(results, max_p95_ms=args.latency_budget_ms)
+    report = build_comparison_report(
+        results,
+        recommended,
+        metadata={"latency_budget_ms": args.latency_budget_ms, "n_rows": len(df)},
+    )
+    write_comparison_report(report, args.output)
+    print(f"Modèle recommandé : {recommended.name}")
+    print(f"Rapport sauvegardé dans : {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,19 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
 sys.path.append(str(SRC_DIR))
 
-from credit_g_ml.data_loading import save_raw_credit_g  # type: ignore  # noqa: E402
+from credit_g_ml.data_loading import (  # type: ignore  # noqa: E402
+    build_processed_credit_g,
+    save_raw_credit_g,
+)
 
 
 def main() -> None:
     path = save_raw_credit_g()
     print(f"Dataset credit-g téléchargé et sauvegardé dans: {path}")
 
+    processed_path = build_processed_credit_g(path.name, force=True)
+    print(f"Version typée (Parquet) sauvegardée dans: {processed_path}")
+
 
 if __name__ == "__main__":
     main()
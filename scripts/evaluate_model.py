@@ -0,0 +1,115 @@
+"""Rapport d'évaluation d'un modèle entraîné (reports/evaluation_<modèle>.json).
+
+Le jeu de test (même découpage que l'entraînement) est scoré une seule fois ;
+ses scores sont sauvegardés à côté du rapport. Métriques : ROC AUC, KS, Brier,
+lift du premier décile et matrice de confusion, avec intervalles de confiance
+bootstrap, puis validation croisée stratifiée répétée sur le jeu
+d'entraînement.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+from credit_g_ml.data_loading import load_local_credit_g  # noqa: E402
+from credit_g_ml.evaluation import (  # noqa: E402
+    build_evaluation_report,
+    cross_validate_metrics,
+    metrics_table,
+    score_holdout,
+    write_evaluation_report,
+)
+from credit_g_ml.inference import (  # noqa: E402
+    DEFAULT_MODEL_PATH,
+    load_model,
+    model_fingerprint,
+)
+from credit_g_ml.preprocessing import train_test_split_credit_g  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-path", type=Path, default=DEFAULT_MODEL_PATH)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Rapport JSON (défaut : reports/evaluation_<modèle>.json)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--n-resamples", type=int, default=2000)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--cv-splits", type=int, default=5)
+    parser.add_argument(
+        "--cv-repeats", type=int, default=3, help="Répétitions (0 : sans CV)"
+    )
+    parser.add_argument(
+        "--n-jobs", type=int, default=-1, help="Processus parallèles (-1 : tous)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    model_name = args.model_path.stem.removesuffix("_pipeline")
+    output = args.output or REPORTS_DIR / f"evaluation_{model_name}.json"
+
+    pipeline = load_model(args.model_path)
+    df = load_local_credit_g()
+    X_train, X_test, y_train, y_test = train_test_split_credit_g(df)
+
+    start = time.perf_counter()
+    scores = score_holdout(pipeline, X_test, y_test)
+    print(f"Jeu de test scoré en {time.perf_counter() - start:.2f} s")
+
+    cross_validation = None
+    if args.cv_repeats > 0:
+        cross_validation = cross_validate_metrics(
+            pipeline,
+            X_train,
+            y_train,
+            n_splits=args.cv_splits,
+            n_repeats=args.cv_repeats,
+            threshold=args.threshold,
+            n_jobs=args.n_jobs,
+        )
+        print(
+            f"Validation croisée : {args.cv_splits} folds x {args.cv_repeats} "
+            f"en {cross_validation['wall_time_s']:.1f} s"
+        )
+
+    report = build_evaluation_report(
+        scores,
+        threshold=args.threshold,
+        n_resamples=args.n_resamples,
+        confidence=args.confidence,
+        n_jobs=args.n_jobs,
+        cross_validation=cross_validation,
+        metadata={
+            "model_path": str(args.model_path),
+            "model_version": model_fingerprint(args.model_path),
+        },
+    )
+    write_evaluation_report(report, output)
+    scores_path = output.with_suffix(".scores.csv")
+    scores.to_frame().to_csv(scores_path, index=False)
+
+    print(
+        f"Bootstrap : {args.n_resamples} rééchantillonnages "
+        f"en {report['bootstrap']['wall_time_s']:.2f} s"
+    )
+    print("\n".join(metrics_table(report)))
+    print(f"Rapport sauvegardé dans : {output}")
+    print(f"Scores du jeu de test sauvegardés dans : {scores_path}")
+
+
+if __name__ == "__main__":
+    main()
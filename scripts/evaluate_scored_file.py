@@ -0,0 +1,92 @@
+"""Évaluation en flux de fichiers scorés (CSV / Parquet) plus gros que la mémoire.
+
+Lit seulement les colonnes score et issue, par blocs, et écrit un rapport JSON
+(AUC et KS approchés avec leur borne d'erreur, Brier, calibration) et les
+graphiques ROC / calibration en PNG.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+REPORTS_DIR = PROJECT_ROOT / "reports"
+
+from credit_g_ml.config import TARGET_COL  # noqa: E402
+from credit_g_ml.streaming_evaluation import (  # noqa: E402
+    DEFAULT_CALIBRATION_BINS,
+    DEFAULT_N_BINS,
+    evaluate_scored_files,
+    plot_evaluation,
+    write_streaming_report,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "inputs", type=Path, nargs="+", help="Fichiers scorés (.csv, .parquet)"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=REPORTS_DIR / "streaming_evaluation.json"
+    )
+    parser.add_argument(
+        "--plots-dir", type=Path, default=REPORTS_DIR, help="Dossier des PNG"
+    )
+    parser.add_argument("--score-column", default="probability_bad")
+    parser.add_argument(
+        "--outcome-column",
+        default=TARGET_COL,
+        help='Issue observée ("bad"/"good", ou 1/0)',
+    )
+    parser.add_argument("--positive-label", default="bad")
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument(
+        "--n-bins",
+        type=int,
+        default=DEFAULT_N_BINS,
+        help="Intervalles des histogrammes (précision de l'AUC et du KS)",
+    )
+    parser.add_argument(
+        "--calibration-bins", type=int, default=DEFAULT_CALIBRATION_BINS
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    start = time.perf_counter()
+    evaluator = evaluate_scored_files(
+        args.inputs,
+        score_column=args.score_column,
+        outcome_column=args.outcome_column,
+        positive_label=args.positive_label,
+        chunk_size=args.chunk_size,
+        n_bins=args.n_bins,
+    )
+    report = evaluator.report(calibration_bins=args.calibration_bins)
+    elapsed = time.perf_counter() - start
+
+    write_streaming_report(report, args.output)
+    plots = plot_evaluation(report, args.plots_dir)
+
+    print(
+        f"{report['n_rows']:,} lignes évaluées en {elapsed:.1f} s "
+        f"({report['n_skipped']:,} ignorées)"
+    )
+    print(
+        f"ROC AUC {report['roc_auc']:.4f} (± {report['roc_auc_error_bound']:.1e}) | "
+        f"KS {report['ks']:.4f} (± {report['ks_error_bound']:.1e}) | "
+        f"Brier {report['brier']:.4f}"
+    )
+    print(f"Rapport sauvegardé dans : {args.output}")
+    print(f"Graphiques : {', '.join(str(p) for p in plots)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Script de scoring d'un fichier (CSV / Parquet) par blocs, en parallèle."""
+
+import argparse
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+from credit_g_ml.bulk_scoring import score_file  # noqa: E402
+from credit_g_ml.inference import DEFAULT_MODEL_PATH  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", type=Path, help="Fichier à scorer (.csv, .parquet)")
+    parser.add_argument("output", type=Path, help="Fichier CSV de sortie")
+    parser.add_argument("--model-path", type=Path, default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processus (défaut : nb de cœurs)"
+    )
+    parser.add_argument(
+        "--id-column", default=None, help="Colonne recopiée dans la sortie"
+    )
+    parser.add_argument("--threshold", type=float, default=None)
+    parser.add_argument(
+        "--explain",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Ajoute les K features les plus contributives (modèle linéaire)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore la progression existante"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    start = time.perf_counter()
+    summary = score_file(
+        args.input,
+        args.output,
+        model_path=args.model_path,
+        chunk_size=args.chunk_size,
+        n_workers=args.workers,
+        id_column=args.id_column,
+        threshold=args.threshold,
+        resume=not args.restart,
+        explain_top_k=args.explain,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"Scoring terminé : {asdict(summary)}")
+    if summary.rows_scored:
+        print(f"Débit : {summary.rows_scored / elapsed:,.0f} lignes/s")
+    print(f"Résultats dans : {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Entraînement incrémental (hors mémoire) sur un fichier CSV ou Parquet.
+
+Exemple :
+    python scripts/train_incremental.py data/processed/credit_g.parquet \
+        --chunk-size 100000 --epochs 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import joblib
+
+# Ajout de src au PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+sys.path.append(str(SRC_DIR))
+
+from credit_g_ml.config import MODELS_DIR  # noqa: E402
+from credit_g_ml.incremental import train_incremental  # noqa: E402
+from credit_g_ml.metadata import (  # noqa: E402
+    categorical_values_from_pipeline,
+    save_categorical_values,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input_path", type=Path, help="Fichier CSV ou Parquet")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=MODELS_DIR / "sgd_logistic_pipeline.joblib",
+        help="Pipeline entraîné (joblib)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=1e-4, help="Régularisation L2")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    start = time.perf_counter()
+    pipeline = train_incremental(
+        args.input_path,
+        chunk_size=args.chunk_size,
+        n_epochs=args.epochs,
+        alpha=args.alpha,
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(pipeline, args.output)
+    metadata_path = save_categorical_values(
+        categorical_values_from_pipeline(pipeline), args.output
+    )
+
+    print(f"Entraînement terminé en {time.perf_counter() - start:.1f} s")
+    print(f"Modèle sauvegardé dans : {args.output}")
+    print(f"Métadonnées sauvegardées dans : {metadata_path}")
+
+
+if __name__ == "__main__":
+    main()
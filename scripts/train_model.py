@@ -1,9 +1,11 @@
 """Script d'entraînement du modèle credit risk."""
 
+import argparse
 import sys
 from pathlib import Path
 
 import joblib
+import sklearn
 
 # Ajout de src au PYTHONPATH
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -11,24 +13,78 @@ SRC_DIR = PROJECT_ROOT / "src"
 sys.path.append(str(SRC_DIR))
 
 REPORTS_DIR = PROJECT_ROOT / "reports"
-roc_path = REPORTS_DIR / "roc_curve_logistic_regression.png"
+leaderboard_path = REPORTS_DIR / "search_leaderboard_logistic_regression.csv"
 
+from credit_g_ml.categories import build_category_dictionary  # noqa: E402
+from credit_g_ml.compiled import export_pipeline  # noqa: E402
 from credit_g_ml.config import MODELS_DIR  # noqa: E402
 from credit_g_ml.data_loading import load_local_credit_g  # noqa: E402
+from credit_g_ml.drift import (  # noqa: E402
+    build_reference_profile,
+    save_reference_profile,
+)
 from credit_g_ml.evaluation import plot_roc_curve  # noqa: E402
+from credit_g_ml.inference import model_fingerprint  # noqa: E402
+from credit_g_ml.metadata import (  # noqa: E402
+    compute_categorical_values,
+    save_categorical_values,
+)
 from credit_g_ml.modeling import (  # noqa: E402
-    build_logistic_regression_pipeline,
+    MODEL_BUILDERS,
     train_and_evaluate,
 )
 from credit_g_ml.preprocessing import train_test_split_credit_g  # noqa: E402
+from credit_g_ml.tuning import (  # noqa: E402
+    search_logistic_regression,
+    write_leaderboard,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model",
+        choices=sorted(MODEL_BUILDERS),
+        default="logistic_regression",
+        help="Famille de modèle à entraîner",
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Recherche d'hyperparamètres en validation croisée avant l'entraînement",
+    )
+    parser.add_argument("--cv", type=int, default=5, help="Nombre de folds")
+    parser.add_argument(
+        "--n-jobs", type=int, default=-1, help="Processus parallèles (-1 : tous)"
+    )
+    args = parser.parse_args()
+    if args.search and args.model != "logistic_regression":
+        parser.error("--search n'est disponible que pour logistic_regression")
+    return args
 
 
 def main() -> None:
+    args = parse_args()
     df = load_local_credit_g()
 
     X_train, X_test, y_train, y_test = train_test_split_credit_g(df)
 
-    pipeline = build_logistic_regression_pipeline()
+    params = {}
+    if args.search:
+        # Recherche sur le train uniquement : le test reste un hold-out
+        result = search_logistic_regression(
+            X_train, y_train, cv=args.cv, n_jobs=args.n_jobs
+        )
+        write_leaderboard(result.leaderboard, leaderboard_path)
+        params = result.best_params
+        print(
+            f"Recherche terminée en {result.wall_time_s:.1f} s "
+            f"({len(result.leaderboard)} candidats x {args.cv} folds)"
+        )
+        print(f"Meilleurs paramètres : {params} (ROC AUC CV {result.best_score:.4f})")
+        print(f"Classement sauvegardé dans : {leaderboard_path}")
+
+    pipeline = MODEL_BUILDERS[args.model](**params)
     metrics = train_and_evaluate(
         pipeline,
         X_train,
@@ -38,12 +94,47 @@ def main() -> None:
     )
 
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    model_path = MODELS_DIR / "logistic_regression_pipeline.joblib"
+    model_path = MODELS_DIR / f"{args.model}_pipeline.joblib"
     joblib.dump(pipeline, model_path)
+    categorical_values = compute_categorical_values(df)
+    # Dictionnaire des codes catégoriels (repli : modalité la plus fréquente)
+    categories = build_category_dictionary(df)
+    metadata_path = save_categorical_values(
+        categorical_values, model_path, dictionary=categories
+    )
+    # Référence de la surveillance de dérive en service : le jeu d'entraînement
+    drift_profile = build_reference_profile(X_train)
+    drift_path = save_reference_profile(drift_profile, model_path)
 
     print(f"Modèle sauvegardé dans : {model_path}")
+    print(
+        f"Métadonnées sauvegardées dans : {metadata_path} "
+        f"(dictionnaire {categories.version})"
+    )
+    print(f"Profil de dérive sauvegardé dans : {drift_path}")
+
+    # Artefact de serving sans scikit-learn (modèle linéaire uniquement),
+    # vérifié sur le jeu de test
+    if args.model == "logistic_regression":
+        scorer_path, max_diff = export_pipeline(
+            pipeline,
+            MODELS_DIR / "logistic_regression_scorer.json",
+            X_test,
+            metadata={
+                "sklearn_version": sklearn.__version__,
+                "source_model": model_fingerprint(model_path),
+            },
+        )
+        save_categorical_values(categorical_values, scorer_path, dictionary=categories)
+        save_reference_profile(drift_profile, scorer_path)
+        print(
+            f"Scoreur compilé sauvegardé dans : {scorer_path} "
+            f"(écart max {max_diff:.1e})"
+        )
+
     print(f"Métriques finales : {metrics}")
 
+    roc_path = REPORTS_DIR / f"roc_curve_{args.model}.png"
     plot_roc_curve(pipeline, X_test, y_test, output_path=roc_path)
 
 
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, g, jsonify, render_template, request
 from pydantic import ValidationError
 
 from api.demo_profiles import DEMO_PROFILES
-from api.schemas import CreditRiskRequest, CreditRiskResponse
-from credit_g_ml.inference import load_model, predict_single
-from credit_g_ml.metadata import get_categorical_values
+from api.model_store import ModelStore
+from api.schemas import (
+    BatchItemError,
+    BatchItemResult,
+    CreditRiskBatchResponse,
+    CreditRiskRequest,
+    CreditRiskResponse,
+)
+from api.validation import credit_risk_validator, unknown_category_error
+from credit_g_ml import config
+from credit_g_ml.batching import BatcherOverloadedError, MicroBatcher
+from credit_g_ml.caching import PredictionCache
+from credit_g_ml.categories import UNKNOWN_POLICIES, CategoryDictionary
+from credit_g_ml.drift import DriftMonitor, load_reference_profile
+from credit_g_ml.explain import DEFAULT_TOP_K, explain_batch
+from credit_g_ml.inference import PredictionResult, predict_batch, predict_single
+from credit_g_ml.metadata import load_categorical_values, load_category_dictionary
+from credit_g_ml.telemetry import REGISTRY, is_enabled, render_value, stage_timer
+from credit_g_ml.thresholds import (
+    CostMatrix,
+    risk_level,
+    risk_level_counts,
+    sweep_thresholds,
+)
 
 API_TOKEN = os.getenv("API_TOKEN")
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "10000"))
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 UI_DIR = PROJECT_ROOT / "ui"
 
@@ -29,14 +54,330 @@ MODEL_PATH = Path(
     )
 )
 
-_pipeline: Any | None = None
+# Scoreur compilé (NumPy pur) à la place du pipeline scikit-learn
+USE_COMPILED_SCORER = os.getenv("USE_COMPILED_SCORER", "0") == "1"
+
+# Cache des prédictions (0 pour désactiver), invalidé à chaque changement de modèle
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", "3600"))
+
+prediction_cache: PredictionCache[PredictionResult] = PredictionCache(
+    maxsize=PREDICTION_CACHE_SIZE, ttl_seconds=PREDICTION_CACHE_TTL
+)
+
+# Micro-batching : regroupe les /predict concurrents en un appel vectorisé
+MICROBATCH_ENABLED = os.getenv("MICROBATCH_ENABLED", "0") == "1"
+MICROBATCH_MAX_BATCH_SIZE = int(os.getenv("MICROBATCH_MAX_BATCH_SIZE", "32"))
+MICROBATCH_MAX_WAIT_MS = float(os.getenv("MICROBATCH_MAX_WAIT_MS", "2"))
+MICROBATCH_MAX_QUEUE_SIZE = int(os.getenv("MICROBATCH_MAX_QUEUE_SIZE", "10000"))
+MICROBATCH_ENQUEUE_TIMEOUT_MS = float(os.getenv("MICROBATCH_ENQUEUE_TIMEOUT_MS", "0"))
+
+# Seuils de p(bad) des niveaux de risque "medium" et "high"
+RISK_MEDIUM_CUTOFF = float(
+    os.getenv("RISK_MEDIUM_CUTOFF", str(config.RISK_MEDIUM_CUTOFF))
+)
+RISK_HIGH_CUTOFF = float(os.getenv("RISK_HIGH_CUTOFF", str(config.RISK_HIGH_CUTOFF)))
+
+# Explications (?explain=true) : nombre de features renvoyées par défaut / au plus
+EXPLAIN_TOP_K = int(os.getenv("EXPLAIN_TOP_K", str(DEFAULT_TOP_K)))
+EXPLAIN_MAX_TOP_K = 20
+
+# Surveillance de la dérive des requêtes (profil `<modèle>.drift.json`)
+DRIFT_MONITOR_ENABLED = os.getenv("DRIFT_MONITOR_ENABLED", "1") == "1"
+DRIFT_REFRESH_SECONDS = float(os.getenv("DRIFT_REFRESH_SECONDS", "60"))
+
+# Modalités catégorielles absentes du dictionnaire du modèle : refusées (422),
+# comptées puis ignorées par le modèle, ou remplacées par la modalité de repli
+CATEGORY_UNKNOWN_POLICY = os.getenv("CATEGORY_UNKNOWN_POLICY", "count")
+if CATEGORY_UNKNOWN_POLICY not in UNKNOWN_POLICIES:
+    raise ValueError(
+        f"CATEGORY_UNKNOWN_POLICY invalide: {CATEGORY_UNKNOWN_POLICY!r} "
+        f"(attendu : {', '.join(UNKNOWN_POLICIES)})"
+    )
+
+# Chargement du modèle au démarrage et rechargement à chaud
+EAGER_MODEL_LOAD = os.getenv("EAGER_MODEL_LOAD", "1") == "1"
+MODEL_WATCH_INTERVAL = float(os.getenv("MODEL_WATCH_INTERVAL", "0"))
+
+model_store = ModelStore(
+    MODEL_PATH,
+    use_compiled=USE_COMPILED_SCORER,
+    warmup_payload=DEMO_PROFILES["medium"],
+)
+
+
+# Métriques HTTP (les durées par étape sont dans credit_g_ml.telemetry)
+HTTP_REQUESTS = REGISTRY.counter(
+    "credit_risk_http_requests_total",
+    "Requêtes HTTP traitées.",
+    labelnames=("endpoint", "method", "status"),
+)
+HTTP_DURATION = REGISTRY.histogram(
+    "credit_risk_http_request_duration_seconds",
+    "Durée totale des requêtes HTTP.",
+    labelnames=("endpoint",),
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "credit_risk_http_requests_in_flight",
+    "Requêtes HTTP en cours de traitement.",
+    labelnames=("endpoint",),
+)
+UNKNOWN_CATEGORIES = REGISTRY.counter(
+    "credit_risk_unknown_categories_total",
+    "Valeurs catégorielles absentes du dictionnaire du modèle.",
+    labelnames=("feature",),
+)
 
 
 def get_pipeline():
-    global _pipeline
-    if _pipeline is None:
-        _pipeline = load_model(MODEL_PATH)
-    return _pipeline
+    return model_store.current().scorer
+
+
+micro_batcher: MicroBatcher[dict[str, Any], PredictionResult] | None = (
+    MicroBatcher(
+        lambda payloads: predict_batch(
+            model_store.current().scorer,
+            payloads,
+            categories=get_category_dictionary(),
+        ),
+        max_batch_size=MICROBATCH_MAX_BATCH_SIZE,
+        max_wait_ms=MICROBATCH_MAX_WAIT_MS,
+        max_queue_size=MICROBATCH_MAX_QUEUE_SIZE,
+        enqueue_timeout_ms=MICROBATCH_ENQUEUE_TIMEOUT_MS,
+    )
+    if MICROBATCH_ENABLED
+    else None
+)
+
+
+_drift_lock = threading.Lock()
+# (version du modèle, moniteur) : None si le modèle n'a pas de profil
+_drift_state: tuple[str, DriftMonitor | None] | None = None
+
+
+def get_drift_monitor() -> DriftMonitor | None:
+    """Moniteur de dérive du modèle courant (recréé quand le modèle change)."""
+    global _drift_state
+    if not DRIFT_MONITOR_ENABLED:
+        return None
+    version = model_store.current().version
+    state = _drift_state
+    if state is not None and state[0] == version:
+        return state[1]
+    with _drift_lock:
+        if _drift_state is None or _drift_state[0] != version:
+            model = model_store.current()
+            try:
+                profile = load_reference_profile(model.path)
+            except FileNotFoundError:
+                monitor = None
+            else:
+                monitor = DriftMonitor(
+                    profile, refresh_interval_s=DRIFT_REFRESH_SECONDS
+                )
+            _drift_state = (model.version, monitor)
+        return _drift_state[1]
+
+
+_categories_lock = threading.Lock()
+# (version du modèle, dictionnaire) : None si les vocabulaires sont introuvables
+_categories_state: tuple[str, CategoryDictionary | None] | None = None
+
+
+def get_category_dictionary() -> CategoryDictionary | None:
+    """Dictionnaire des codes catégoriels du modèle courant (relu s'il change)."""
+    global _categories_state
+    version = model_store.current().version
+    state = _categories_state
+    if state is not None and state[0] == version:
+        return state[1]
+    with _categories_lock:
+        if _categories_state is None or _categories_state[0] != version:
+            model = model_store.current()
+            try:
+                dictionary = load_category_dictionary(model.path, pipeline=model.scorer)
+            except (FileNotFoundError, ValueError):
+                dictionary = None
+            _categories_state = (model.version, dictionary)
+        return _categories_state[1]
+
+
+def _check_categories(
+    payloads: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+    """Applique `CATEGORY_UNKNOWN_POLICY` aux payloads validés.
+
+    Retourne (payloads à scorer, erreurs par index) : avec "reject", les
+    lignes ayant une modalité inconnue sont retirées et renvoyées en erreur ;
+    avec "other", la modalité est remplacée par celle de repli. Les modalités
+    inconnues sont comptées dans tous les cas.
+    """
+    dictionary = get_category_dictionary()
+    if dictionary is None:
+        return payloads, {}
+    with stage_timer("categories"):
+        if len(payloads) == 1:
+            unknown = [(0, f, v) for f, v in dictionary.find_unknown(payloads[0])]
+        else:
+            # Détection seule : le lot est encodé une fois, au scoring
+            unknown = dictionary.find_unknown_rows(payloads)
+    if not unknown:
+        return payloads, {}
+
+    for _, feature, _ in unknown:
+        UNKNOWN_CATEGORIES.inc(feature=feature)
+    if CATEGORY_UNKNOWN_POLICY == "count":
+        return payloads, {}
+    if CATEGORY_UNKNOWN_POLICY == "reject":
+        errors: dict[int, list[dict[str, Any]]] = {}
+        for i, feature, value in unknown:
+            allowed = dictionary.values[dictionary.features.index(feature)]
+            errors.setdefault(i, []).append(
+                unknown_category_error(feature, value, allowed)
+            )
+        return [p for i, p in enumerate(payloads) if i not in errors], errors
+
+    fallback = dict(zip(dictionary.features, dictionary.other, strict=True))
+    payloads = list(payloads)
+    for i, feature, _ in unknown:
+        payloads[i] = payloads[i] | {feature: fallback[feature]}
+    return payloads, {}
+
+
+def _observe(payloads: list[dict[str, Any]]) -> None:
+    """Compte les payloads validés dans le moniteur de dérive (s'il existe).
+
+    Appelé avant `_check_categories` : les modalités inconnues restent visibles
+    dans le taux de modalités inconnues, quelle que soit la politique.
+    """
+    monitor = get_drift_monitor()
+    if monitor is None:
+        return
+    with stage_timer("drift"):
+        if len(payloads) == 1:
+            monitor.observe(payloads[0])
+        else:
+            monitor.observe_batch(payloads)
+
+
+def _score(payload: dict[str, Any]) -> PredictionResult:
+    """Prédiction d'un payload validé, servie par le cache si possible."""
+    # Une seule lecture du modèle courant : cohérent même pendant un rechargement
+    model = model_store.current()
+
+    def compute() -> PredictionResult:
+        if micro_batcher is not None:
+            return micro_batcher.predict(payload)
+        return predict_single(model.scorer, payload)
+
+    return prediction_cache.get_or_compute(model.version, payload, compute)
+
+
+def _score_batch(payloads: list[dict[str, Any]]) -> list[PredictionResult]:
+    """Prédiction d'un lot : seules les lignes absentes du cache sont scorées."""
+    model = model_store.current()
+
+    with stage_timer("cache"):
+        results = [prediction_cache.get(model.version, p) for p in payloads]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        computed = predict_batch(
+            model.scorer,
+            [payloads[i] for i in missing],
+            categories=get_category_dictionary(),
+        )
+        for i, result in zip(missing, computed, strict=True):
+            results[i] = result
+            prediction_cache.put(model.version, payloads[i], result)
+    return results
+
+
+def _explain_top_k() -> int | None:
+    """Nombre de features à expliquer demandé (`?explain=true&top_k=3`), ou None.
+
+    Lève ValueError si les paramètres sont invalides.
+    """
+    explain = request.args.get("explain", "").lower()
+    if explain in ("", "0", "false", "no"):
+        return None
+    if explain not in ("1", "true", "yes"):
+        raise ValueError("explain doit valoir true ou false")
+    top_k = int(request.args.get("top_k", EXPLAIN_TOP_K))
+    if not 1 <= top_k <= EXPLAIN_MAX_TOP_K:
+        raise ValueError(f"top_k doit être compris entre 1 et {EXPLAIN_MAX_TOP_K}")
+    return top_k
+
+
+def _explain(payloads: list[dict[str, Any]], top_k: int) -> list[list[dict]]:
+    """Contributions par feature (calcul vectorisé, hors cache des prédictions)."""
+    with stage_timer("explain"):
+        explanations = explain_batch(model_store.current().scorer, payloads, top_k)
+    return [[c._asdict() for c in row] for row in explanations]
+
+
+def _explanation_error(e: ValueError):
+    return jsonify({"error": "explain_not_supported", "details": str(e)}), 400
+
+
+def _risk_level(probability_bad: float) -> str:
+    return risk_level(probability_bad, RISK_MEDIUM_CUTOFF, RISK_HIGH_CUTOFF)
+
+
+def _is_authorized() -> bool:
+    # Sécurité minimale par token
+    if not API_TOKEN:
+        return True
+    client_token = request.headers.get("X-API-TOKEN")
+    return bool(client_token) and client_token == API_TOKEN
+
+
+def get_categorical_options() -> dict[str, list[str]]:
+    """Vocabulaires catégoriels de l'UI (fichier de métadonnées du modèle).
+
+    Mis en cache par `load_categorical_values` et relus si le modèle change ;
+    à défaut de fichier de métadonnées, ils sont lus dans le pipeline.
+    """
+    try:
+        return load_categorical_values(MODEL_PATH)
+    except FileNotFoundError:
+        model = model_store.current()
+        return load_categorical_values(model.path, pipeline=model.scorer)
+
+
+_pages_lock = threading.Lock()
+# (version du modèle, {page: (HTML, ETag)}) : vidé quand le modèle change
+_pages_state: tuple[str, dict[tuple[str, ...], tuple[str, str]]] | None = None
+
+
+def _cached_page(key: tuple[str, ...], render: Callable[[], str]) -> Response:
+    """Page HTML rendue une fois par version du modèle, servie avec un ETag.
+
+    Un client qui renvoie l'ETag (`If-None-Match`) reçoit un 304 sans corps ;
+    `Cache-Control: no-cache` l'oblige à revalider, donc à voir le nouveau
+    rendu après un changement de modèle. Sans modèle chargeable, la page est
+    rendue à chaque appel.
+    """
+    global _pages_state
+    try:
+        version = model_store.current().version
+    except FileNotFoundError:
+        return Response(render(), mimetype="text/html")
+
+    with _pages_lock:
+        if _pages_state is None or _pages_state[0] != version:
+            _pages_state = (version, {})
+        page = _pages_state[1].get(key)
+    if page is None:
+        html = render()
+        page = (html, hashlib.sha256(html.encode("utf-8")).hexdigest()[:32])
+        with _pages_lock:
+            if _pages_state[0] == version:
+                _pages_state[1][key] = page
+
+    response = Response(page[0], mimetype="text/html")
+    response.set_etag(page[1])
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 
 DEFAULT_FORM = {
@@ -64,57 +405,383 @@ DEFAULT_FORM = {
 }
 
 
+def _endpoint_label() -> str:
+    # Gabarit de route (ex. /demo/<level>) : cardinalité bornée
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+
+@app.before_request
+def _start_request_metrics():
+    if is_enabled():
+        g.metrics_start = time.perf_counter()
+        HTTP_IN_FLIGHT.inc(endpoint=_endpoint_label())
+
+
+@app.after_request
+def _record_request_metrics(response):
+    start = g.get("metrics_start")
+    if start is not None:
+        endpoint = _endpoint_label()
+        HTTP_DURATION.observe(time.perf_counter() - start, endpoint=endpoint)
+        HTTP_REQUESTS.inc(
+            endpoint=endpoint, method=request.method, status=str(response.status_code)
+        )
+    return response
+
+
+@app.teardown_request
+def _end_request_metrics(exc):
+    # Exécuté même si la vue lève : la jauge ne dérive pas
+    if g.pop("metrics_start", None) is not None:
+        HTTP_IN_FLIGHT.dec(endpoint=_endpoint_label())
+
+
+@app.errorhandler(BatcherOverloadedError)
+def _overloaded(error):
+    # Délestage : le client peut réessayer, le serveur ne s'empile pas
+    return (
+        jsonify({"error": "overloaded", "details": str(error)}),
+        503,
+        {"Retry-After": "1"},
+    )
+
+
+@app.get("/metrics")
+def metrics():
+    """Exposition Prometheus (format texte)."""
+    cache = prediction_cache.stats()
+    lines = []
+    for key in ("hits", "misses", "evictions", "invalidations"):
+        lines += render_value(
+            f"credit_risk_prediction_cache_{key}_total",
+            f"Cache des prédictions : {key}.",
+            cache[key],
+            kind="counter",
+        )
+    lines += render_value(
+        "credit_risk_prediction_cache_size",
+        "Entrées dans le cache des prédictions.",
+        cache["size"],
+    )
+    if micro_batcher is not None:
+        batching = micro_batcher.stats()
+        lines += render_value(
+            "credit_risk_microbatch_batches_total",
+            "Lots scorés par le micro-batcher.",
+            batching["batches"],
+            kind="counter",
+        )
+        lines += render_value(
+            "credit_risk_microbatch_items_total",
+            "Prédictions scorées par le micro-batcher.",
+            batching["items"],
+            kind="counter",
+        )
+        lines += render_value(
+            "credit_risk_microbatch_queue_size",
+            "Prédictions en attente dans le micro-batcher.",
+            batching["queue_size"],
+        )
+        lines += render_value(
+            "credit_risk_microbatch_rejected_total",
+            "Prédictions refusées (file du micro-batcher pleine).",
+            batching["rejected"],
+            kind="counter",
+        )
+    status = model_store.status()
+    monitor = get_drift_monitor() if status["ready"] else None
+    if monitor is not None:
+        report = monitor.report()
+        lines += render_value(
+            "credit_risk_drift_max_psi",
+            "PSI maximal des features (requêtes servies / entraînement).",
+            report["max_psi"],
+        )
+        lines += render_value(
+            "credit_risk_drift_unseen_category_rate",
+            "Part des valeurs catégorielles absentes du vocabulaire d'entraînement.",
+            report["unseen_rate"],
+        )
+    lines += render_value(
+        "credit_risk_model_ready", "1 si un modèle est chargé.", int(status["ready"])
+    )
+    lines += render_value(
+        "credit_risk_model_reloads_total",
+        "Rechargements du modèle réussis.",
+        status["reloads"],
+        kind="counter",
+    )
+    return Response(
+        REGISTRY.render(lines), mimetype="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/drift")
+def drift():
+    """PSI par feature et taux de modalités inconnues des requêtes servies.
+
+    Recalculé au plus toutes les `DRIFT_REFRESH_SECONDS` (`?refresh=1` force
+    le calcul). Compteurs propres au processus qui répond.
+    """
+    if not _is_authorized():
+        return jsonify({"error": "unauthorized"}), 401
+    monitor = get_drift_monitor()
+    if monitor is None:
+        return jsonify({"error": "drift_monitor_unavailable"}), 404
+    report = monitor.report(force=request.args.get("refresh") == "1")
+    return jsonify({"model_version": model_store.current().version} | report)
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready():
+    # Prêt seulement quand le modèle est chargé et préchauffé (≠ /health : vivant)
+    status = model_store.status()
+    if not status["ready"]:
+        return jsonify({"status": "not_ready"} | status), 503
+    return jsonify({"status": "ready"} | status)
+
+
+@app.post("/admin/reload")
+def admin_reload():
+    if not _is_authorized():
+        return jsonify({"error": "unauthorized"}), 401
+    try:
+        model = model_store.load()
+    except Exception as e:
+        # L'ancien modèle reste servi
+        return jsonify({"error": "reload_failed", "details": str(e)}), 500
+    return jsonify({"status": "reloaded", "model_version": model.version})
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    return jsonify(prediction_cache.stats())
+
+
+@app.get("/batching/stats")
+def batching_stats():
+    if micro_batcher is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True} | micro_batcher.stats())
+
+
 @app.post("/predict")
 def predict():
-    # Sécurité minimale par token
-    if API_TOKEN:
-        client_token = request.headers.get("X-API-TOKEN")
-        if not client_token or client_token != API_TOKEN:
-            return jsonify({"error": "unauthorized"}), 401
+    if not _is_authorized():
+        return jsonify({"error": "unauthorized"}), 401
+    try:
+        top_k = _explain_top_k()
+    except ValueError as e:
+        return jsonify({"error": "invalid_explain", "details": str(e)}), 400
     try:
-        payload = request.get_json(silent=True)
+        with stage_timer("parse_json"):
+            payload = request.get_json(silent=True)
         if payload is None:
             return jsonify({"error": "invalid_json"}), 400
-        req = CreditRiskRequest(**payload)
+        with stage_timer("validation"):
+            req = CreditRiskRequest(**payload)
     except ValidationError as e:
         return jsonify({"error": "validation_error", "details": e.errors()}), 422
     except Exception:
         return jsonify({"error": "invalid_json"}), 400
 
-    pipeline = get_pipeline()
-
-    result = predict_single(pipeline, req.model_dump())
+    # Dérive mesurée sur les valeurs reçues, avant repli des modalités inconnues
+    validated = req.model_dump()
+    _observe([validated])
+    rows, category_errors = _check_categories([validated])
+    if category_errors:
+        return (
+            jsonify({"error": "validation_error", "details": category_errors[0]}),
+            422,
+        )
+    row = rows[0]
+    result = _score(row)
+    explanation = None
+    if top_k is not None:
+        try:
+            explanation = _explain([row], top_k)[0]
+        except ValueError as e:
+            return _explanation_error(e)
 
-    if result.probability_bad >= 0.7:
-        risk_level = "high"
-    elif result.probability_bad >= 0.4:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
+    risk_level = _risk_level(result.probability_bad)
 
     resp = CreditRiskResponse(
         label=result.label,
         probability_bad=result.probability_bad,
         probability_good=result.probability_good,
         risk_level=risk_level,
+        explanation=explanation,
+    )
+    return jsonify(resp.model_dump(exclude_none=True))
+
+
+@app.post("/predict/batch")
+def predict_batch_endpoint():
+    if not _is_authorized():
+        return jsonify({"error": "unauthorized"}), 401
+    try:
+        top_k = _explain_top_k()
+    except ValueError as e:
+        return jsonify({"error": "invalid_explain", "details": str(e)}), 400
+
+    with stage_timer("parse_json"):
+        payloads = request.get_json(silent=True)
+    if not isinstance(payloads, list):
+        return jsonify({"error": "invalid_json"}), 400
+    if len(payloads) > MAX_BATCH_SIZE:
+        return (
+            jsonify({"error": "batch_too_large", "max_batch_size": MAX_BATCH_SIZE}),
+            413,
+        )
+
+    # Validation par colonnes (mêmes contraintes que CreditRiskRequest) : les
+    # lignes invalides n'empêchent pas le scoring des autres, elles sont
+    # renvoyées dans "errors" avec leur index.
+    with stage_timer("validation"):
+        validation = credit_risk_validator.validate(payloads)
+    # Dérive mesurée sur les valeurs reçues, avant repli des modalités inconnues
+    if validation.rows:
+        _observe(validation.rows)
+    valid_rows, category_errors = _check_categories(validation.rows)
+    valid_indices = [
+        index
+        for j, index in enumerate(validation.valid_indices)
+        if j not in category_errors
+    ]
+    errors = [
+        BatchItemError(index=i, details=details)
+        for i, details in sorted(
+            (
+                validation.errors
+                | {validation.valid_indices[j]: d for j, d in category_errors.items()}
+            ).items()
+        )
+    ]
+
+    # Un seul appel au pipeline pour toutes les lignes valides absentes du cache
+    predictions = _score_batch(valid_rows) if valid_rows else []
+    explanations: list[Any] = [None] * len(valid_rows)
+    if top_k is not None and valid_rows:
+        try:
+            explanations = _explain(valid_rows, top_k)
+        except ValueError as e:
+            return _explanation_error(e)
+
+    results = [
+        BatchItemResult(
+            index=i,
+            label=result.label,
+            probability_bad=result.probability_bad,
+            probability_good=result.probability_good,
+            risk_level=_risk_level(result.probability_bad),
+            explanation=explanation,
+        )
+        for i, result, explanation in zip(
+            valid_indices, predictions, explanations, strict=True
+        )
+    ]
+
+    resp = CreditRiskBatchResponse(n_rows=len(payloads), results=results, errors=errors)
+    return jsonify(resp.model_dump(exclude_none=True))
+
+
+@app.post("/portfolio/thresholds")
+def portfolio_thresholds():
+    """Métriques du portefeuille pour tous les seuils de refus.
+
+    Corps JSON : `scores` (p(bad) déjà calculés) ou `rows` (dossiers à scorer),
+    et optionnellement `labels` ("bad"/"good"), `exposures` (par défaut
+    `credit_amount` des dossiers), `lgd`, `costs` ({"false_positive",
+    "false_negative"}) et `grid_size` (points de la courbe renvoyée).
+    """
+    if not _is_authorized():
+        return jsonify({"error": "unauthorized"}), 401
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({"error": "invalid_json"}), 400
+
+    exposures = body.get("exposures")
+    if "rows" in body:
+        rows = body["rows"]
+        if not isinstance(rows, list):
+            return jsonify({"error": "invalid_json"}), 400
+        if len(rows) > MAX_BATCH_SIZE:
+            return (
+                jsonify({"error": "batch_too_large", "max_batch_size": MAX_BATCH_SIZE}),
+                413,
+            )
+        # Même validation que /predict/batch, mais le portefeuille doit être
+        # complet : la moindre ligne invalide refuse la requête.
+        with stage_timer("validation"):
+            validation = credit_risk_validator.validate(rows)
+        valid_rows, category_errors = _check_categories(validation.rows)
+        row_errors = validation.errors | {
+            validation.valid_indices[j]: d for j, d in category_errors.items()
+        }
+        if row_errors:
+            errors = [
+                BatchItemError(index=i, details=details).model_dump()
+                for i, details in sorted(row_errors.items())
+            ]
+            return jsonify({"error": "validation_error", "errors": errors}), 422
+        scores = [r.probability_bad for r in _score_batch(valid_rows)]
+        if exposures is None:
+            exposures = [row["credit_amount"] for row in valid_rows]
+    else:
+        scores = body.get("scores")
+
+    try:
+        if not isinstance(scores, list):
+            raise ValueError("'scores' ou 'rows' attendu (liste)")
+        labels = body.get("labels")
+        labels_bad = None
+        if labels is not None:
+            if not isinstance(labels, list) or not set(labels) <= {"bad", "good"}:
+                raise ValueError('\'labels\' attendu : liste de "bad" / "good"')
+            labels_bad = [label == "bad" for label in labels]
+        grid_size = int(body.get("grid_size", 101))
+        if not 2 <= grid_size <= 1001:
+            raise ValueError("grid_size doit être entre 2 et 1001")
+        sweep = sweep_thresholds(
+            scores,
+            labels_bad=labels_bad,
+            exposures=exposures,
+            lgd=float(body.get("lgd", 1.0)),
+            costs=CostMatrix(**body.get("costs", {})),
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": "invalid_portfolio", "details": str(e)}), 400
+
+    return jsonify(
+        {
+            "n_rows": sweep.n_rows,
+            "observed": sweep.observed,
+            "optimal": sweep.row(sweep.optimal_index),
+            "risk_levels": risk_level_counts(
+                scores, RISK_MEDIUM_CUTOFF, RISK_HIGH_CUTOFF
+            ),
+            "curve": sweep.at([i / (grid_size - 1) for i in range(grid_size)]),
+        }
     )
-    return jsonify(resp.model_dump())
 
 
 @app.get("/")
 def home():
-    categorical_options = get_categorical_values()
-    return render_template(
-        "index.html",
-        api_token=os.getenv("API_TOKEN", ""),
-        categorical_options=categorical_options,
-        form=DEFAULT_FORM,
-    )
+    def render() -> str:
+        return render_template(
+            "index.html",
+            api_token=os.getenv("API_TOKEN", ""),
+            categorical_options=get_categorical_options(),
+            form=DEFAULT_FORM,
+        )
+
+    return _cached_page(("home",), render)
 
 
 @app.post("/ui/predict")
@@ -147,7 +814,7 @@ def ui_predict():
                 error="Validation error",
                 details=e.errors(),
                 form=form_payload,
-                categorical_options=get_categorical_values(),
+                categorical_options=get_categorical_options(),
             ),
             422,
         )
@@ -157,22 +824,29 @@ def ui_predict():
                 "index.html",
                 error=f"Invalid form data: {e}",
                 form=form_payload,
-                categorical_options=get_categorical_values(),
+                categorical_options=get_categorical_options(),
             ),
             400,
         )
 
-    pipeline = get_pipeline()
-
-    result = predict_single(pipeline, req.model_dump())
+    validated = req.model_dump()
+    _observe([validated])
+    rows, category_errors = _check_categories([validated])
+    if category_errors:
+        return (
+            render_template(
+                "index.html",
+                error="Validation error",
+                details=category_errors[0],
+                form=form_payload,
+                categorical_options=get_categorical_options(),
+            ),
+            422,
+        )
+    result = _score(rows[0])
     business_decision = "reject" if result.probability_bad >= threshold else "accept"
 
-    if result.probability_bad >= 0.7:
-        risk_level = "high"
-    elif result.probability_bad >= 0.4:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
+    risk_level = _risk_level(result.probability_bad)
 
     return render_template(
         "index.html",
@@ -185,7 +859,7 @@ def ui_predict():
             "business_decision": business_decision,
         },
         form=req.model_dump() | {"threshold": threshold},
-        categorical_options=get_categorical_values(),
+        categorical_options=get_categorical_options(),
     )
 
 
@@ -194,38 +868,16 @@ def demo(level: str):
     if level not in DEMO_PROFILES:
         return "Unknown demo profile", 404
 
-    threshold = 0.5
-    payload = DEMO_PROFILES[level]
-
-    pipeline = get_pipeline()
-
-    req = CreditRiskRequest(**payload)
-    result = predict_single(pipeline, req.model_dump())
-
-    business_decision = "reject" if result.probability_bad >= threshold else "accept"
+    def render() -> str:
+        result, form = _demo_result(level)
+        return render_template(
+            "index.html",
+            result=result,
+            form=form,
+            categorical_options=get_categorical_options(),
+        )
 
-    if result.probability_bad >= 0.7:
-        risk_level = "high"
-    elif result.probability_bad >= 0.4:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
-
-    categorical_options = get_categorical_values()
-
-    return render_template(
-        "index.html",
-        result={
-            "label": result.label,
-            "probability_bad": result.probability_bad,
-            "probability_good": result.probability_good,
-            "risk_level": risk_level,
-            "threshold": threshold,
-            "business_decision": business_decision,
-        },
-        form=req.model_dump() | {"threshold": threshold},
-        categorical_options=categorical_options,
-    )
+    return _cached_page(("demo", level), render)
 
 
 @app.get("/demo/full/<level>")
@@ -233,37 +885,53 @@ def demo_full(level: str):
     if level not in DEMO_PROFILES:
         return "Unknown demo profile", 404
 
-    threshold = 0.5
-    payload = DEMO_PROFILES[level]
+    def render() -> str:
+        result, _ = _demo_result(level)
+        return render_template("demo_full.html", result=result, current_level=level)
 
-    pipeline = get_pipeline()
+    return _cached_page(("demo_full", level), render)
 
-    req = CreditRiskRequest(**payload)
-    result = predict_single(pipeline, req.model_dump())
 
-    business_decision = "reject" if result.probability_bad >= threshold else "accept"
+def _demo_result(level: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Résultat affiché et formulaire pré-rempli d'un profil de démonstration."""
+    threshold = 0.5
+    req = CreditRiskRequest(**DEMO_PROFILES[level])
+    result = _score(req.model_dump())
 
-    if result.probability_bad >= 0.7:
-        risk_level = "high"
-    elif result.probability_bad >= 0.4:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
+    business_decision = "reject" if result.probability_bad >= threshold else "accept"
 
-    return render_template(
-        "demo_full.html",
-        result={
+    return (
+        {
             "label": result.label,
             "probability_bad": result.probability_bad,
             "probability_good": result.probability_good,
-            "risk_level": risk_level,
+            "risk_level": _risk_level(result.probability_bad),
             "threshold": threshold,
             "business_decision": business_decision,
         },
-        current_level=level,
+        req.model_dump() | {"threshold": threshold},
     )
 
 
+def _startup() -> None:
+    """Charge et préchauffe le modèle avant la 1re requête.
+
+    Vocabulaires, dictionnaire catégoriel et moniteur de dérive sont construits
+    dans la foulée : sous gunicorn (`preload_app`), les workers en héritent par
+    copie sur écriture au lieu de les reconstruire à leur première requête.
+    """
+    if EAGER_MODEL_LOAD and MODEL_PATH.exists():
+        model_store.load()
+        get_categorical_options()
+        get_category_dictionary()
+        get_drift_monitor()
+    if MODEL_WATCH_INTERVAL > 0:
+        model_store.start_watching(MODEL_WATCH_INTERVAL)
+
+
+_startup()
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "5000"))
     app.run(host="0.0.0.0", port=port, debug=False)
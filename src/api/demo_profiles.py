@@ -33,10 +33,10 @@ DEMO_PROFILES = {
         "num_dependents": 1,
         "checking_status": "0<=X<200",
         "credit_history": "existing paid",
-        "purpose": "car (new)",
+        "purpose": "new car",
         "savings_status": "500<=X<1000",
         "employment": "4<=X<7",
-        "personal_status": "female div/dep",
+        "personal_status": "female div/dep/mar",
         "other_parties": "guarantor",
         "property_magnitude": "car",
         "other_payment_plans": "bank",
@@ -63,7 +63,7 @@ DEMO_PROFILES = {
         "property_magnitude": "no known property",
         "other_payment_plans": "stores",
         "housing": "rent",
-        "job": "unemployed",
+        "job": "unemp/unskilled non res",
         "own_telephone": "none",
         "foreign_worker": "yes",
     },
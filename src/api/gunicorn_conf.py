@@ -0,0 +1,59 @@
+"""Configuration gunicorn (serveur de production pré-fork).
+
+    gunicorn -c python:api.gunicorn_conf api.app:app
+
+L'application est importée une seule fois dans le processus maître
+(`preload_app`) : le modèle, ses vocabulaires, son dictionnaire catégoriel et
+le moniteur de dérive y sont construits par `api.app._startup`, puis partagés
+par les workers en copie sur écriture (les compteurs de dérive, modifiés,
+deviennent propres à chaque worker).
+`gc.freeze()` évite que le ramasse-miettes des workers ne touche (et donc ne
+copie) les pages de ces objets.
+
+Variables d'environnement : `PORT`, `WEB_CONCURRENCY` (workers, par défaut un
+par cœur), `GUNICORN_THREADS`, `GUNICORN_TIMEOUT`, `GUNICORN_GRACEFUL_TIMEOUT`,
+`GUNICORN_KEEPALIVE`, `GUNICORN_MAX_REQUESTS`.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+# Délai laissé aux requêtes en cours après SIGTERM avant arrêt forcé
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# Recyclage optionnel des workers (0 : jamais) ; le nouveau worker est forké
+# depuis le maître, le modèle n'est pas rechargé
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+preload_app = True
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    # Après le chargement du modèle dans le maître, avant le premier fork
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from api import app as app_module
+
+    app_module.model_store.after_fork()
+
+
+def worker_exit(server, worker):
+    # Arrêt propre : les prédictions en file du micro-batcher sont servies
+    from api import app as app_module
+
+    app_module.model_store.stop_watching()
+    if app_module.micro_batcher is not None:
+        app_module.micro_batcher.stop()
@@ -0,0 +1,187 @@
+"""Gestion du modèle servi : chargement au démarrage, préchauffage et rechargement.
+
+Le modèle courant est un objet immuable (`LoadedModel`) remplacé en une seule
+affectation : une requête en cours garde la référence qu'elle a lue et termine
+avec l'ancien modèle, les suivantes utilisent le nouveau. Les chargements sont
+sérialisés par un verrou, ce qui évite deux chargements concurrents au premier
+appel.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+from credit_g_ml.compiled import CompiledLogisticScorer, compile_pipeline
+from credit_g_ml.inference import load_scorer, model_fingerprint, predict_single
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    scorer: Any  # Pipeline scikit-learn ou CompiledLogisticScorer
+    version: str
+    path: Path
+    mtime_ns: int | None
+    loaded_at: float
+
+
+class ModelStore:
+    """Modèle servi, thread-safe, rechargeable à chaud."""
+
+    def __init__(
+        self,
+        model_path: Path,
+        use_compiled: bool = False,
+        warmup_payload: Dict[str, Any] | None = None,
+    ) -> None:
+        self.model_path = model_path
+        self.use_compiled = use_compiled
+        self.warmup_payload = warmup_payload
+        self._current: LoadedModel | None = None
+        self._load_lock = threading.Lock()
+        self._watcher: threading.Thread | None = None
+        self._watch_interval_s: float | None = None
+        self._stop_watching = threading.Event()
+        self.reloads = 0
+        self.reload_failures = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._current is not None
+
+    def current(self) -> LoadedModel:
+        """Modèle courant (chargé au premier appel s'il ne l'est pas encore)."""
+        model = self._current
+        if model is not None:
+            return model
+        with self._load_lock:
+            if self._current is None:
+                self._current = self._load()
+            return self._current
+
+    def load(self) -> LoadedModel:
+        """(Re)charge le modèle depuis `model_path` et le substitue atomiquement.
+
+        En cas d'échec (fichier absent, corrompu...), l'ancien modèle reste
+        servi et l'exception est propagée.
+        """
+        with self._load_lock:
+            try:
+                new_model = self._load()
+            except Exception:
+                self.reload_failures += 1
+                raise
+            if self._current is not None:
+                self.reloads += 1
+            self._current = new_model
+            return new_model
+
+    def install(self, scorer: Any, version: str) -> LoadedModel:
+        """Installe un modèle déjà en mémoire (tests, intégration)."""
+        model = LoadedModel(
+            scorer=scorer,
+            version=version,
+            path=self.model_path,
+            mtime_ns=None,
+            loaded_at=time.time(),
+        )
+        with self._load_lock:
+            self._current = model
+        return model
+
+    def reload_if_changed(self) -> bool:
+        """Recharge le modèle si le fichier a changé. Retourne True si rechargé."""
+        try:
+            mtime_ns = self.model_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        current = self._current
+        if current is not None and current.mtime_ns == mtime_ns:
+            return False
+        self.load()
+        return True
+
+    def start_watching(self, interval_s: float) -> None:
+        """Surveille `model_path` et recharge le modèle quand il change."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+        self._watch_interval_s = interval_s
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval_s,), name="model-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def after_fork(self) -> None:
+        """À appeler dans un processus fils (serveur pré-fork).
+
+        Le modèle chargé par le parent est conservé (partagé en copie sur
+        écriture) ; le verrou, qu'un thread du parent a pu laisser pris au
+        moment du fork, est recréé, et la surveillance relancée si elle était
+        active (les threads ne survivent pas au fork).
+        """
+        watching = (
+            self._watch_interval_s is not None and not self._stop_watching.is_set()
+        )
+        self._load_lock = threading.Lock()
+        self._stop_watching = threading.Event()
+        self._watcher = None
+        if watching:
+            self.start_watching(self._watch_interval_s)
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5.0)
+
+    def status(self) -> Dict[str, Any]:
+        model = self._current
+        return {
+            "ready": model is not None,
+            "model_path": str(self.model_path),
+            "model_version": model.version if model else None,
+            "loaded_at": model.loaded_at if model else None,
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+        }
+
+    # ------------------------------------------------------------------
+    def _load(self) -> LoadedModel:
+        start = time.perf_counter()
+        mtime_ns = self.model_path.stat().st_mtime_ns
+        scorer = load_scorer(self.model_path)
+        if self.use_compiled and not isinstance(scorer, CompiledLogisticScorer):
+            scorer = compile_pipeline(scorer)
+        version = model_fingerprint(self.model_path)
+
+        # Préchauffage : la première vraie requête ne paie pas les caches à froid
+        if self.warmup_payload is not None:
+            predict_single(scorer, self.warmup_payload)
+
+        logger.info(
+            "Modèle %s chargé (version %s) en %.0f ms",
+            self.model_path,
+            version,
+            1000 * (time.perf_counter() - start),
+        )
+        return LoadedModel(
+            scorer=scorer,
+            version=version,
+            path=self.model_path,
+            mtime_ns=mtime_ns,
+            loaded_at=time.time(),
+        )
+
+    def _watch(self, interval_s: float) -> None:
+        while not self._stop_watching.wait(interval_s):
+            try:
+                self.reload_if_changed()
+            except Exception:
+                # Fichier en cours d'écriture ou invalide : on garde l'ancien modèle
+                logger.exception("Rechargement du modèle impossible")
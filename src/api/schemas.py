@@ -29,8 +29,32 @@ class CreditRiskRequest(BaseModel):
     foreign_worker: str
 
 
+class FeatureContribution(BaseModel):
+    feature: str
+    value: int | float | str
+    # Contribution au logit de p(bad) : positive = augmente le risque
+    contribution: float
+
+
 class CreditRiskResponse(BaseModel):
     label: str
     probability_bad: float
     probability_good: float
     risk_level: str
+    # Présent seulement avec ?explain=true
+    explanation: list[FeatureContribution] | None = None
+
+
+class BatchItemResult(CreditRiskResponse):
+    index: int
+
+
+class BatchItemError(BaseModel):
+    index: int
+    details: list
+
+
+class CreditRiskBatchResponse(BaseModel):
+    n_rows: int
+    results: list[BatchItemResult]
+    errors: list[BatchItemError]
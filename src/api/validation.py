@@ -0,0 +1,256 @@
+"""Validation colonne par colonne des lots, équivalente à `CreditRiskRequest`.
+
+Valider un lot ligne par ligne avec pydantic coûte un modèle par ligne. Ici,
+chaque champ est vérifié sur toute la colonne à la fois : type exact, puis
+bornes (`ge`, `gt`, `le`, `lt` lues dans `model_fields`) comparées en NumPy.
+Les erreurs ont la forme de `ValidationError.errors()` (type, loc, msg,
+input, ctx, url).
+
+Les lignes qui demanderaient une conversion (ex. "30" ou 30.0 pour un entier,
+booléens, valeurs non scalaires) sont confiées telles quelles au modèle
+pydantic : les conversions et messages restent exactement les siens, et
+ces lignes sont rares en pratique.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+import numpy as np
+from annotated_types import Ge, Gt, Le, Lt
+from pydantic import BaseModel, ValidationError
+from pydantic.version import version_short
+
+from api.schemas import CreditRiskRequest
+
+_ERROR_URL = f"https://errors.pydantic.dev/{version_short()}/v/"
+
+# Contrainte -> (attribut, type d'erreur pydantic, texte du message, comparaison)
+_CONSTRAINTS = {
+    Ge: ("ge", "greater_than_equal", "greater than or equal to", np.greater_equal),
+    Gt: ("gt", "greater_than", "greater than", np.greater),
+    Le: ("le", "less_than_equal", "less than or equal to", np.less_equal),
+    Lt: ("lt", "less_than", "less than", np.less),
+}
+
+_MISSING = object()
+
+# Types acceptés sans conversion, par type de champ
+_EXACT_TYPES = {int: {int}, float: {int, float}, str: {str}}
+
+
+@dataclass(frozen=True)
+class _Bound:
+    name: str  # ge, gt, le, lt
+    error_type: str
+    msg: str
+    ctx_value: Any
+    value: float
+    check: Any  # ufunc : True si la valeur respecte la borne
+
+
+@dataclass(frozen=True)
+class _FieldSpec:
+    name: str
+    kind: type  # int, float ou str
+    bounds: Tuple[_Bound, ...]
+
+
+@dataclass(frozen=True)
+class BatchValidation:
+    valid_indices: List[int]
+    rows: List[Dict[str, Any]]  # équivalent de `model_dump()`, lignes valides
+    errors: Dict[int, List[Dict[str, Any]]]  # index -> erreurs façon pydantic
+
+
+class ColumnarValidator:
+    """Valide des lots de dicts avec les contraintes d'un modèle pydantic plat.
+
+    Champs supportés : `int`, `float` et `str` obligatoires, bornés ou non.
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.model = model
+        self.fields = tuple(
+            _field_spec(name, info) for name, info in model.model_fields.items()
+        )
+
+    def validate(self, payloads: Sequence[Any]) -> BatchValidation:
+        errors: Dict[int, List[Dict[str, Any]]] = {}
+        valid: Dict[int, Dict[str, Any]] = {}
+        for i, payload in enumerate(payloads):
+            if not isinstance(payload, dict):
+                # Erreur de type (ligne qui n'est pas un objet) : celle de pydantic
+                try:
+                    valid[i] = self.model.model_validate(payload).model_dump()
+                except ValidationError as e:
+                    errors[i] = e.errors()
+        dict_rows = [i for i, p in enumerate(payloads) if isinstance(p, dict)]
+        rows = [payloads[i] for i in dict_rows]
+
+        n = len(rows)
+        columns: List[List[Any]] = []
+        needs_model = np.zeros(n, dtype=bool)
+        has_error = np.zeros(n, dtype=bool)
+        to_float = np.zeros(n, dtype=bool)
+        column_errors: List[Tuple[np.ndarray, Any]] = []
+        for spec in self.fields:
+            try:
+                values = list(map(itemgetter(spec.name), rows))
+            except KeyError:
+                values = [row.get(spec.name, _MISSING) for row in rows]
+            columns.append(values)
+            missing, unusual, violations = self._check_column(spec, values)
+            needs_model |= unusual
+            if spec.kind is float:
+                to_float |= np.fromiter((type(v) is int for v in values), bool, n)
+            has_error |= missing
+            for _, failed in violations:
+                has_error |= failed
+            column_errors.append((missing, violations))
+
+        # Lignes correctes : le payload est réutilisé tel quel s'il a déjà la
+        # forme de `model_dump()` (pas de champ en trop, pas d'entier à convertir)
+        names = [spec.name for spec in self.fields]
+        float_fields = [spec.name for spec in self.fields if spec.kind is float]
+        for j in np.flatnonzero(~(needs_model | has_error)).tolist():
+            row = rows[j]
+            if len(row) != len(names):
+                row = {name: row[name] for name in names}
+            elif to_float[j]:
+                row = dict(row)
+            if to_float[j]:
+                for name in float_fields:
+                    row[name] = float(row[name])
+            valid[dict_rows[j]] = row
+
+        # Erreurs colonne par colonne, dans l'ordre des champs (comme pydantic)
+        row_errors: Dict[int, List[Dict[str, Any]]] = {}
+        for spec, values, (missing, violations) in zip(
+            self.fields, columns, column_errors, strict=True
+        ):
+            for j in np.flatnonzero(missing & ~needs_model).tolist():
+                row_errors.setdefault(j, []).append(
+                    {
+                        "type": "missing",
+                        "loc": (spec.name,),
+                        "msg": "Field required",
+                        "input": rows[j],
+                        "url": _ERROR_URL + "missing",
+                    }
+                )
+            for bound, failed in violations:
+                for j in np.flatnonzero(failed & ~needs_model).tolist():
+                    row_errors.setdefault(j, []).append(
+                        _bound_error(spec, bound, values[j])
+                    )
+        for j, details in row_errors.items():
+            errors[dict_rows[j]] = details
+
+        # Conversions et types inattendus : le modèle pydantic fait foi
+        for j in np.flatnonzero(needs_model).tolist():
+            try:
+                valid[dict_rows[j]] = self.model(**rows[j]).model_dump()
+            except ValidationError as e:
+                errors[dict_rows[j]] = e.errors()
+
+        valid_indices = sorted(valid)
+        return BatchValidation(
+            valid_indices=valid_indices,
+            rows=[valid[i] for i in valid_indices],
+            errors=dict(sorted(errors.items())),
+        )
+
+    @staticmethod
+    def _check_column(spec: _FieldSpec, values: List[Any]):
+        """(manquants, à confier au modèle, [(borne, violations)]) d'une colonne."""
+        n = len(values)
+        allowed = _EXACT_TYPES[spec.kind]
+        types = set(map(type, values))
+        if types <= allowed:
+            # Cas courant : toute la colonne a le type attendu
+            exact = np.ones(n, dtype=bool)
+            missing = np.zeros(n, dtype=bool)
+        else:
+            exact = np.fromiter((type(v) in allowed for v in values), bool, n)
+            missing = np.fromiter((v is _MISSING for v in values), bool, n)
+        unusual = ~exact & ~missing
+
+        violations = []
+        if spec.bounds and exact.any():
+            if exact.all():
+                numbers = np.asarray(values, dtype=float)
+            else:
+                numbers = np.fromiter(
+                    (
+                        float(v) if ok else math.nan
+                        for v, ok in zip(values, exact.tolist(), strict=True)
+                    ),
+                    float,
+                    n,
+                )
+            failed = np.zeros(n, dtype=bool)
+            for bound in spec.bounds:
+                # Première borne non respectée seulement (comme pydantic)
+                violated = exact & ~failed & ~bound.check(numbers, bound.value)
+                violations.append((bound, violated))
+                failed |= violated
+        return missing, unusual, violations
+
+
+def _field_spec(name: str, info: Any) -> _FieldSpec:
+    kind = info.annotation
+    if kind not in (int, float, str) or not info.is_required():
+        raise ValueError(f"Champ non supporté par la validation colonnaire: {name}")
+    bounds = []
+    for constraint in info.metadata:
+        if type(constraint) not in _CONSTRAINTS:
+            raise ValueError(f"Contrainte non supportée sur {name}: {constraint!r}")
+        attr, error_type, text, check = _CONSTRAINTS[type(constraint)]
+        value = getattr(constraint, attr)
+        bounds.append(
+            _Bound(
+                name=attr,
+                error_type=error_type,
+                msg=f"Input should be {text} {value}",
+                ctx_value=kind(value),
+                value=float(value),
+                check=check,
+            )
+        )
+    return _FieldSpec(name=name, kind=kind, bounds=tuple(bounds))
+
+
+def _bound_error(spec: _FieldSpec, bound: _Bound, value: Any) -> Dict[str, Any]:
+    return {
+        "type": bound.error_type,
+        "loc": (spec.name,),
+        "msg": bound.msg,
+        "input": value,
+        "ctx": {bound.name: bound.ctx_value},
+        "url": _ERROR_URL + bound.error_type,
+    }
+
+
+def unknown_category_error(
+    feature: str, value: Any, allowed: Sequence[str]
+) -> Dict[str, Any]:
+    """Erreur façon pydantic (`literal_error`) pour une modalité inconnue."""
+    quoted = [repr(v) for v in allowed]
+    expected = (
+        f"{', '.join(quoted[:-1])} or {quoted[-1]}" if len(quoted) > 1 else quoted[0]
+    )
+    return {
+        "type": "literal_error",
+        "loc": (feature,),
+        "msg": f"Input should be {expected}",
+        "input": value,
+        "ctx": {"expected": expected},
+        "url": _ERROR_URL + "literal_error",
+    }
+
+
+credit_risk_validator = ColumnarValidator(CreditRiskRequest)
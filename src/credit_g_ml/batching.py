@@ -0,0 +1,237 @@
+"""Micro-batching des prédictions pour le projet credit_g_ml.
+
+Sous forte concurrence, chaque requête `/predict` paie son propre appel
+scikit-learn, dont le coût fixe dépasse largement le calcul utile. Le
+`MicroBatcher` met les requêtes en file : un thread répartiteur les regroupe
+pendant une courte fenêtre (`max_wait_ms`) ou jusqu'à `max_batch_size`, les
+score en un seul appel vectorisé, puis renvoie à chaque appelant son résultat.
+
+La file est bornée (`max_queue_size`) : quand elle est pleine (répartiteur
+bloqué ou trafic trop fort), `submit` attend au plus `enqueue_timeout_ms`
+puis lève `BatcherOverloadedError` au lieu de bloquer l'appelant.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Sequence, TypeVar
+
+from .telemetry import (
+    MICRO_BATCH_QUEUE_DELAY,
+    MICRO_BATCH_SIZE,
+    MICRO_BATCH_SIZE_BUCKETS,
+    is_enabled,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Bornes supérieures des histogrammes de `stats()` (taille de lot, attente en ms)
+BATCH_SIZE_BUCKETS = MICRO_BATCH_SIZE_BUCKETS
+QUEUE_DELAY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class BatcherOverloadedError(RuntimeError):
+    """File du micro-batcher pleine : la requête est refusée (délestage)."""
+
+
+@dataclass
+class _Pending(Generic[T, R]):
+    item: T
+    future: Future
+    enqueued_at: float
+
+
+class MicroBatcher(Generic[T, R]):
+    """Regroupe des appels unitaires concurrents en lots vectorisés.
+
+    `score_batch` reçoit une liste d'items et doit retourner une liste de
+    résultats de même longueur, dans le même ordre.
+    """
+
+    def __init__(
+        self,
+        score_batch: Callable[[List[T]], Sequence[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 10_000,
+        enqueue_timeout_ms: float = 0.0,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size doit être >= 1")
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000.0
+        self.enqueue_timeout_s = enqueue_timeout_ms / 1000.0
+        self._queue: queue.Queue[_Pending[T, R] | None] = queue.Queue(max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.errors = 0
+        self.rejected = 0
+        self.max_batch_seen = 0
+        self.queue_delay_sum_s = 0.0
+        self.queue_delay_max_s = 0.0
+        self.batch_size_counts = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+        self.queue_delay_counts = [0] * (len(QUEUE_DELAY_BUCKETS_MS) + 1)
+
+    def submit(self, item: T) -> Future:
+        """Met un item en file ; le Future est résolu après le scoring du lot.
+
+        Lève `BatcherOverloadedError` si la file reste pleine plus de
+        `enqueue_timeout_ms`.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        pending = _Pending(item, future, time.perf_counter())
+        try:
+            if self.enqueue_timeout_s > 0:
+                self._queue.put(pending, timeout=self.enqueue_timeout_s)
+            else:
+                self._queue.put_nowait(pending)
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            raise BatcherOverloadedError(
+                f"File de micro-batching pleine ({self._queue.maxsize} items)"
+            ) from None
+        return future
+
+    def predict(self, item: T, timeout: float | None = None) -> R:
+        """Version bloquante de `submit` (utilisée par les vues Flask)."""
+        return self.submit(item).result(timeout=timeout)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Arrête le répartiteur après avoir traité les items déjà en file."""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put(None)
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_s * 1000.0,
+                "queue_size": self._queue.qsize(),
+                "batches": self.batches,
+                "items": self.items,
+                "errors": self.errors,
+                "rejected": self.rejected,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "max_batch_size_seen": self.max_batch_seen,
+                "mean_queue_delay_ms": (
+                    1000.0 * self.queue_delay_sum_s / self.items if self.items else 0.0
+                ),
+                "max_queue_delay_ms": 1000.0 * self.queue_delay_max_s,
+                "batch_size_histogram": _histogram(
+                    BATCH_SIZE_BUCKETS, self.batch_size_counts
+                ),
+                "queue_delay_ms_histogram": _histogram(
+                    QUEUE_DELAY_BUCKETS_MS, self.queue_delay_counts
+                ),
+            }
+
+    # ------------------------------------------------------------------
+    def _ensure_started(self) -> None:
+        # Démarrage paresseux : aussi après un fork (le thread n'existe pas
+        # dans le processus fils).
+        if self._thread is not None and self._pid == os.getpid():
+            if self._thread.is_alive():
+                return
+        with self._lock:
+            if (
+                self._thread is None
+                or self._pid != os.getpid()
+                or not self._thread.is_alive()
+            ):
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name="micro-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = first.enqueued_at + self.max_wait_s
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    pending = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[_Pending[T, R]]) -> None:
+        started = time.perf_counter()
+        delays = [started - p.enqueued_at for p in batch]
+        try:
+            results = self.score_batch([p.item for p in batch])
+            if len(results) != len(batch):
+                raise RuntimeError("score_batch doit retourner un résultat par item")
+        except Exception as e:  # propagé à chaque appelant du lot
+            for p in batch:
+                p.future.set_exception(e)
+            failed = True
+        else:
+            for p, result in zip(batch, results, strict=True):
+                p.future.set_result(result)
+            failed = False
+        self._record(len(batch), delays, failed)
+
+    def _record(self, size: int, delays: List[float], failed: bool) -> None:
+        if is_enabled():
+            # Histogrammes Prometheus (/metrics), en plus des stats JSON
+            MICRO_BATCH_SIZE.observe(size)
+            for delay in delays:
+                MICRO_BATCH_QUEUE_DELAY.observe(delay)
+        with self._stats_lock:
+            self.batches += 1
+            self.items += size
+            self.errors += int(failed)
+            self.max_batch_seen = max(self.max_batch_seen, size)
+            self.batch_size_counts[_bucket(BATCH_SIZE_BUCKETS, size)] += 1
+            for delay in delays:
+                self.queue_delay_sum_s += delay
+                self.queue_delay_max_s = max(self.queue_delay_max_s, delay)
+                bucket = _bucket(QUEUE_DELAY_BUCKETS_MS, delay * 1000.0)
+                self.queue_delay_counts[bucket] += 1
+
+
+def _bucket(bounds: Sequence[float], value: float) -> int:
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            return i
+    return len(bounds)
+
+
+def _histogram(bounds: Sequence[float], counts: List[int]) -> Dict[str, int]:
+    labels = [f"<={b:g}" for b in bounds] + [f">{bounds[-1]:g}"]
+    return dict(zip(labels, counts, strict=True))
@@ -0,0 +1,132 @@
+"""Outils de benchmark de l'inférence pour le projet credit_g_ml.
+
+Mesure de latence (p50 / p95 / p99), de débit (lignes/s) et de pic mémoire,
+écriture d'un rapport JSON et comparaison à une référence (baseline) pour
+détecter les régressions de performance.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+REPORT_FORMAT_VERSION = 1
+
+# Métriques comparées à la baseline : (nom, True si "plus grand = mieux")
+COMPARED_METRICS = [("p50_ms", False), ("p95_ms", False), ("rows_per_s", True)]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    n_calls: int
+    rows_per_call: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    rows_per_s: float
+    peak_mem_mb: float
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    n_calls: int,
+    rows_per_call: int = 1,
+    warmup: int = 3,
+) -> BenchmarkResult:
+    """Chronomètre `n_calls` appels de `fn` après `warmup` appels à blanc.
+
+    Le pic mémoire est mesuré à part (un appel sous tracemalloc) pour ne pas
+    fausser les latences.
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = np.empty(n_calls)
+    for i in range(n_calls):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99]) * 1000.0
+    return BenchmarkResult(
+        name=name,
+        n_calls=n_calls,
+        rows_per_call=rows_per_call,
+        p50_ms=float(p50),
+        p95_ms=float(p95),
+        p99_ms=float(p99),
+        mean_ms=float(timings.mean() * 1000.0),
+        rows_per_s=float(rows_per_call * n_calls / timings.sum()),
+        peak_mem_mb=peak / 2**20,
+    )
+
+
+def build_report(
+    results: List[BenchmarkResult], metadata: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        }
+        | (metadata or {}),
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def write_report(report: Dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[str]:
+    """Retourne la liste des régressions au-delà de `tolerance` (0.2 = 20 %).
+
+    Une latence est en régression si elle dépasse baseline * (1 + tolerance),
+    un débit s'il passe sous baseline * (1 - tolerance). Les benchmarks absents
+    de l'un des deux rapports sont ignorés.
+    """
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = report.get("results", {}).get(name)
+        if current is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            old, new = base[metric], current[metric]
+            if higher_is_better and new < old * (1 - tolerance):
+                regressions.append(
+                    f"{name}.{metric}: {new:.4g} < {old:.4g} (-{1 - new / old:.0%})"
+                )
+            elif not higher_is_better and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{name}.{metric}: {new:.4g} > {old:.4g} (+{new / old - 1:.0%})"
+                )
+    return regressions
@@ -0,0 +1,352 @@
+"""Scoring de fichiers volumineux (CSV / Parquet) pour le projet credit_g_ml.
+
+Le fichier d'entrée est lu par blocs de taille fixe, les blocs sont scorés en
+parallèle par un pool de processus (modèle chargé une fois par processus) et
+les résultats sont écrits au fil de l'eau, dans l'ordre, dans un CSV de sortie.
+
+La mémoire reste bornée (au plus `2 * n_workers` blocs en vol) et le job est
+reprenable : après chaque bloc écrit, un fichier de progression
+(`<sortie>.progress.json`) enregistre le nombre de lignes traitées et la taille
+du fichier de sortie. Une relance repart du dernier bloc terminé.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from .explain import explain_frame
+from .inference import (
+    DEFAULT_MODEL_PATH,
+    load_scorer,
+    model_fingerprint,
+    predict_frame,
+)
+
+OUTPUT_COLUMNS = ["label", "probability_bad"]
+
+_worker_model: Any | None = None
+_worker_threshold: float | None = None
+_worker_explain_top_k: int = 0
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    input_path: str
+    rows_done: int
+    output_bytes: int
+    completed: bool = False
+    # Empreinte du modèle et paramètres du scoring : une reprise doit écrire
+    # des lignes produites exactement comme celles déjà présentes.
+    model_version: str | None = None
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ScoringSummary:
+    rows_scored: int
+    rows_total: int
+    chunks_scored: int
+    resumed_from: int
+
+
+def checkpoint_path_for(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + ".progress.json")
+
+
+def read_checkpoint(output_path: Path) -> Checkpoint | None:
+    path = checkpoint_path_for(output_path)
+    if not path.exists():
+        return None
+    return Checkpoint(**json.loads(path.read_text(encoding="utf-8")))
+
+
+def scoring_settings(
+    threshold: float | None, explain_top_k: int, id_column: str | None
+) -> Dict[str, Any]:
+    """Paramètres qui déterminent le contenu du fichier de sortie."""
+    columns = [id_column or "row_id", *OUTPUT_COLUMNS]
+    for i in range(1, explain_top_k + 1):
+        columns += [f"reason_{i}", f"reason_{i}_contribution"]
+    return {
+        "threshold": threshold,
+        "explain_top_k": explain_top_k,
+        "id_column": id_column,
+        "output_columns": columns,
+    }
+
+
+def _write_checkpoint(output_path: Path, checkpoint: Checkpoint) -> None:
+    # Écriture atomique : le fichier de progression n'est jamais à moitié écrit
+    path = checkpoint_path_for(output_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def iter_chunks(
+    input_path: Path,
+    chunk_size: int,
+    skip_rows: int = 0,
+    columns: List[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Lit un CSV ou un Parquet par blocs de `chunk_size` lignes.
+
+    Les `skip_rows` premières lignes de données sont sautées (reprise) ;
+    `columns` limite la lecture à ces colonnes.
+    """
+    suffixes = [s.lower() for s in input_path.suffixes]
+    if ".parquet" in suffixes:
+        yield from _iter_parquet_chunks(input_path, chunk_size, skip_rows, columns)
+    elif ".csv" in suffixes:
+        # Reprise : un prédicat plutôt qu'une liste d'indices, que pandas
+        # matérialiserait en un ensemble de `skip_rows` entiers.
+        reader = pd.read_csv(
+            input_path,
+            chunksize=chunk_size,
+            skiprows=(lambda i: 0 < i <= skip_rows) if skip_rows else None,
+            usecols=columns,
+        )
+        with reader:
+            yield from reader
+    else:
+        raise ValueError(f"Format d'entrée non supporté: {input_path.name}")
+
+
+def _iter_parquet_chunks(
+    input_path: Path,
+    chunk_size: int,
+    skip_rows: int,
+    columns: List[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - dépend de l'environnement
+        raise ImportError("La lecture Parquet nécessite pyarrow.") from e
+
+    parquet_file = pq.ParquetFile(input_path)
+    to_skip = skip_rows
+    buffer: list[pd.DataFrame] = []
+    buffered = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        df = batch.to_pandas()
+        if to_skip:
+            if to_skip >= len(df):
+                to_skip -= len(df)
+                continue
+            df = df.iloc[to_skip:]
+            to_skip = 0
+        # Les batches pyarrow s'arrêtent aux frontières de row groups :
+        # on les regroupe pour garder des blocs de taille fixe.
+        buffer.append(df)
+        buffered += len(df)
+        while buffered >= chunk_size:
+            merged = pd.concat(buffer, ignore_index=True)
+            yield merged.iloc[:chunk_size]
+            rest = merged.iloc[chunk_size:]
+            buffer = [rest] if len(rest) else []
+            buffered = len(rest)
+    if buffered:
+        yield pd.concat(buffer, ignore_index=True)
+
+
+def _init_worker(
+    model_path: str, threshold: float | None, explain_top_k: int = 0
+) -> None:
+    global _worker_model, _worker_threshold, _worker_explain_top_k
+    _worker_model = load_scorer(Path(model_path))
+    _worker_threshold = threshold
+    _worker_explain_top_k = explain_top_k
+
+
+def _score_chunk(
+    chunk: pd.DataFrame, first_row: int, id_column: str | None
+) -> pd.DataFrame:
+    """Score un bloc dans le processus courant (modèle chargé par _init_worker)."""
+    predictions = predict_frame(_worker_model, chunk, threshold=_worker_threshold)
+    if id_column is not None:
+        if id_column not in chunk.columns:
+            raise ValueError(f"Colonne identifiant absente: {id_column}")
+        ids = chunk[id_column].to_numpy()
+    else:
+        ids = range(first_row, first_row + len(chunk))
+    out = pd.DataFrame({id_column or "row_id": ids})
+    for col in OUTPUT_COLUMNS:
+        out[col] = predictions[col].to_numpy()
+    if _worker_explain_top_k:
+        _add_reasons(out, chunk, _worker_explain_top_k)
+    return out
+
+
+def _add_reasons(out: pd.DataFrame, chunk: pd.DataFrame, top_k: int) -> None:
+    """Ajoute les colonnes `reason_<i>` et `reason_<i>_contribution` (i = 1..k)."""
+    explanation = explain_frame(_worker_model, chunk)
+    top = explanation.top_indices(top_k)
+    contributions = np.take_along_axis(explanation.contributions, top, axis=1)
+    features = np.asarray(explanation.features, dtype=object)
+    for i in range(top.shape[1]):
+        out[f"reason_{i + 1}"] = features[top[:, i]]
+        out[f"reason_{i + 1}_contribution"] = contributions[:, i]
+
+
+def score_file(
+    input_path: Path,
+    output_path: Path,
+    model_path: Path = DEFAULT_MODEL_PATH,
+    chunk_size: int = 50_000,
+    n_workers: int | None = None,
+    id_column: str | None = None,
+    threshold: float | None = None,
+    resume: bool = True,
+    explain_top_k: int = 0,
+) -> ScoringSummary:
+    """Score `input_path` bloc par bloc et écrit les résultats dans `output_path`.
+
+    `n_workers=1` score dans le processus courant ; par défaut, un processus
+    par cœur. Avec `resume=True`, un job interrompu reprend au dernier bloc
+    terminé ; sinon il repart de zéro. Avec `explain_top_k > 0` (modèle
+    linéaire), les principales features de chaque score sont ajoutées.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être > 0")
+    n_workers = n_workers or os.cpu_count() or 1
+
+    model_version = model_fingerprint(model_path)
+    settings = scoring_settings(threshold, explain_top_k, id_column)
+    checkpoint = read_checkpoint(output_path) if resume else None
+    if checkpoint is not None:
+        _check_resumable(checkpoint, input_path, model_version, settings)
+        if not _output_intact(output_path, checkpoint):
+            # Sortie supprimée ou raccourcie : reprendre y ajouterait des
+            # lignes après un trou, on repart de zéro.
+            checkpoint = None
+    if checkpoint is not None and checkpoint.completed:
+        return ScoringSummary(
+            rows_scored=0,
+            rows_total=checkpoint.rows_done,
+            chunks_scored=0,
+            resumed_from=checkpoint.rows_done,
+        )
+
+    rows_done = checkpoint.rows_done if checkpoint else 0
+    resumed_from = rows_done
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # On coupe ce qui a pu être écrit après le dernier bloc validé
+    mode = "r+b" if checkpoint is not None else "wb"
+    chunks_scored = 0
+    with open(output_path, mode) as out:
+        if checkpoint is not None:
+            out.truncate(checkpoint.output_bytes)
+            out.seek(checkpoint.output_bytes)
+        write_header = out.tell() == 0
+
+        def write(scored: pd.DataFrame) -> None:
+            nonlocal rows_done, write_header, chunks_scored
+            out.write(scored.to_csv(index=False, header=write_header).encode("utf-8"))
+            out.flush()
+            os.fsync(out.fileno())
+            write_header = False
+            rows_done += len(scored)
+            chunks_scored += 1
+            _write_checkpoint(
+                output_path,
+                Checkpoint(
+                    str(input_path),
+                    rows_done,
+                    out.tell(),
+                    model_version=model_version,
+                    settings=settings,
+                ),
+            )
+
+        chunks = iter_chunks(input_path, chunk_size, skip_rows=rows_done)
+        first_row = rows_done
+        if n_workers == 1:
+            _init_worker(str(model_path), threshold, explain_top_k)
+            for chunk in chunks:
+                write(_score_chunk(chunk, first_row, id_column))
+                first_row += len(chunk)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(str(model_path), threshold, explain_top_k),
+            ) as pool:
+                # File FIFO bornée : écriture dans l'ordre, mémoire constante
+                pending: deque[Future] = deque()
+                for chunk in chunks:
+                    pending.append(
+                        pool.submit(_score_chunk, chunk, first_row, id_column)
+                    )
+                    first_row += len(chunk)
+                    if len(pending) >= 2 * n_workers:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+
+        final_bytes = out.tell()
+
+    _write_checkpoint(
+        output_path,
+        Checkpoint(
+            str(input_path),
+            rows_done,
+            final_bytes,
+            completed=True,
+            model_version=model_version,
+            settings=settings,
+        ),
+    )
+    return ScoringSummary(
+        rows_scored=rows_done - resumed_from,
+        rows_total=rows_done,
+        chunks_scored=chunks_scored,
+        resumed_from=resumed_from,
+    )
+
+
+def _output_intact(output_path: Path, checkpoint: Checkpoint) -> bool:
+    """True si la sortie contient au moins les octets validés par `checkpoint`."""
+    try:
+        return output_path.stat().st_size >= checkpoint.output_bytes
+    except FileNotFoundError:
+        return False
+
+
+def _check_resumable(
+    checkpoint: Checkpoint,
+    input_path: Path,
+    model_version: str,
+    settings: Dict[str, Any],
+) -> None:
+    """Lève ValueError si la sortie existante a été produite autrement."""
+    if checkpoint.input_path != str(input_path):
+        raise ValueError(
+            f"Le fichier de progression concerne {checkpoint.input_path}, "
+            f"pas {input_path}. Relancer sans reprise."
+        )
+    if checkpoint.model_version != model_version:
+        raise ValueError(
+            f"Le fichier de progression a été produit par le modèle "
+            f"{checkpoint.model_version}, pas {model_version}. "
+            "Relancer sans reprise."
+        )
+    changed = sorted(
+        key
+        for key in settings.keys() | checkpoint.settings.keys()
+        if checkpoint.settings.get(key) != settings.get(key)
+    )
+    if changed:
+        raise ValueError(
+            f"Paramètres de scoring modifiés depuis le début du job: {changed}. "
+            "Relancer sans reprise."
+        )
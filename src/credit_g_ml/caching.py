@@ -0,0 +1,121 @@
+"""Cache des résultats de prédiction pour le projet credit_g_ml.
+
+Cache LRU borné avec expiration (TTL), indexé par un hash canonique du
+payload validé et par l'empreinte du modèle. Quand un autre modèle est
+chargé, le cache est vidé automatiquement.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def canonical_key(payload: Dict[str, Any], *extra: Hashable) -> str:
+    """Hash canonique d'un payload (indépendant de l'ordre des clés)."""
+    canonical = json.dumps(
+        [payload, list(extra)], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PredictionCache(Generic[T]):
+    """Cache LRU + TTL, thread-safe, avec compteurs de hits / misses.
+
+    `maxsize=0` désactive le cache (toutes les requêtes sont des misses).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, T]] = OrderedDict()
+        self._model_version: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, model_version: str, payload: Dict[str, Any], *extra: Hashable):
+        """Retourne le résultat en cache, ou None (compté comme miss)."""
+        key = canonical_key(payload, model_version, *extra)
+        now = self._clock()
+        with self._lock:
+            self._check_version(model_version)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(
+        self, model_version: str, payload: Dict[str, Any], value: T, *extra: Hashable
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+        key = canonical_key(payload, model_version, *extra)
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._check_version(model_version)
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(
+        self,
+        model_version: str,
+        payload: Dict[str, Any],
+        compute: Callable[[], T],
+        *extra: Hashable,
+    ) -> T:
+        """Retourne le résultat en cache, sinon le calcule et le met en cache."""
+        value = self.get(model_version, payload, *extra)
+        if value is None:
+            value = compute()
+            self.put(model_version, payload, value, *extra)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "model_version": self._model_version,
+            }
+
+    def _check_version(self, model_version: str) -> None:
+        # Appelé sous verrou : un autre modèle invalide tout le cache
+        if model_version != self._model_version:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self._model_version = model_version
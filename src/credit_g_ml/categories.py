@@ -0,0 +1,213 @@
+"""Dictionnaire versionné des modalités catégorielles (codes entiers).
+
+Construit à l'entraînement, le dictionnaire fixe pour chaque feature de
+`CATEGORICAL_FEATURES` la liste triée de ses modalités : le code d'une
+modalité est sa position. Le même dictionnaire sert à la validation (modalités
+inconnues) et au scoring, qui travaille alors sur de petits tableaux d'entiers
+plutôt que sur des colonnes de chaînes.
+
+Une modalité inconnue reçoit le code `len(modalités)` ; selon la politique :
+
+- "reject" : le lot est refusé (`UnknownCategoryError`) ;
+- "count" : la valeur est gardée et comptée (le modèle l'ignore, comme
+  `OneHotEncoder(handle_unknown="ignore")`) ;
+- "other" : la valeur est remplacée par la modalité de repli de la feature
+  ("other" si elle existe, sinon la plus fréquente à l'entraînement).
+
+La version (hash du contenu) identifie le dictionnaire : deux modèles dont
+les versions diffèrent n'encodent pas les modalités de la même façon.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from itertools import repeat
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .schemas import CATEGORICAL_FEATURES
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+UNKNOWN_POLICIES = ("reject", "count", "other")
+
+
+class UnknownCategoryError(ValueError):
+    """Modalités inconnues refusées : `unknown` liste (ligne, feature, valeur)."""
+
+    def __init__(self, unknown: List[Tuple[int, str, Any]]) -> None:
+        self.unknown = unknown
+        super().__init__(f"{len(unknown)} modalité(s) inconnue(s): {unknown[:5]}")
+
+
+@dataclass(frozen=True)
+class EncodedCategories:
+    codes: np.ndarray  # (n, n_features), int16
+    unknown: np.ndarray  # (n, n_features), bool : valeur absente du dictionnaire
+
+    def unknown_counts(self, features: Sequence[str]) -> Dict[str, int]:
+        counts = self.unknown.sum(axis=0).tolist()
+        return {f: c for f, c in zip(features, counts, strict=True) if c}
+
+
+@dataclass(frozen=True, eq=False)
+class CategoryDictionary:
+    features: Tuple[str, ...]
+    values: Tuple[Tuple[str, ...], ...]
+    other: Tuple[str, ...]  # modalité de repli par feature (politique "other")
+    version: str = field(init=False)
+    _codes: Tuple[Dict[str, int], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for col, values, other in zip(
+            self.features, self.values, self.other, strict=True
+        ):
+            if other not in values:
+                raise ValueError(f"Modalité de repli inconnue pour {col}: {other!r}")
+        content = json.dumps(
+            [self.features, self.values], ensure_ascii=False, separators=(",", ":")
+        )
+        version = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+        object.__setattr__(self, "version", version)
+        object.__setattr__(
+            self,
+            "_codes",
+            tuple({v: i for i, v in enumerate(values)} for values in self.values),
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Mapping[str, Sequence[str]],
+        other: Mapping[str, str] | None = None,
+    ) -> "CategoryDictionary":
+        """Dictionnaire à partir des vocabulaires (triés) de chaque feature.
+
+        Sans repli explicite : "other" si la modalité existe, sinon la première.
+        """
+        other = other or {}
+        features = tuple(values)
+        sorted_values = tuple(tuple(sorted(values[col])) for col in features)
+        return cls(
+            features=features,
+            values=sorted_values,
+            other=tuple(
+                other.get(col, "other" if "other" in vals else vals[0])
+                for col, vals in zip(features, sorted_values, strict=True)
+            ),
+        )
+
+    def codes_for(self, feature: str) -> Dict[str, int]:
+        """Table {modalité: code} d'une feature."""
+        return self._codes[self.features.index(feature)]
+
+    def find_unknown(self, payload: Mapping[str, Any]) -> List[Tuple[str, Any]]:
+        """(feature, valeur) hors dictionnaire d'un payload (sans NumPy)."""
+        return [
+            (col, payload[col])
+            for col, table in zip(self.features, self._codes, strict=True)
+            if payload[col] not in table
+        ]
+
+    def find_unknown_rows(
+        self, payloads: Sequence[Mapping[str, Any]]
+    ) -> List[Tuple[int, str, Any]]:
+        """(ligne, feature, valeur) hors dictionnaire d'un lot, sans l'encoder.
+
+        Détection colonne par colonne : une colonne entièrement connue (cas
+        courant) coûte une construction d'ensemble.
+        """
+        unknown = []
+        for col, table in zip(self.features, self._codes, strict=True):
+            values = list(map(itemgetter(col), payloads))
+            if set(values) <= table.keys():
+                continue
+            unknown += [(i, col, v) for i, v in enumerate(values) if v not in table]
+        unknown.sort(key=lambda u: (u[0], self.features.index(u[1])))
+        return unknown
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "values": {
+                c: list(v) for c, v in zip(self.features, self.values, strict=True)
+            },
+            "other": dict(zip(self.features, self.other, strict=True)),
+        }
+
+    def encode(
+        self, columns: Mapping[str, Sequence[Any]], policy: str = "count"
+    ) -> EncodedCategories:
+        """Codes entiers (n, n_features) des colonnes catégorielles.
+
+        Une modalité inconnue reçoit le code `len(modalités)`, ou le code de
+        la modalité de repli avec `policy="other"` ; `policy="reject"` lève
+        `UnknownCategoryError`.
+        """
+        if policy not in UNKNOWN_POLICIES:
+            raise ValueError(f"Politique inconnue: {policy!r} ({UNKNOWN_POLICIES})")
+        n = len(columns[self.features[0]]) if self.features else 0
+        codes = np.empty((n, len(self.features)), dtype=np.int16)
+        for j, (col, table) in enumerate(zip(self.features, self._codes, strict=True)):
+            codes[:, j] = np.fromiter(
+                map(table.get, columns[col], repeat(len(table))), np.int16, n
+            )
+        unknown = codes == np.array([len(v) for v in self.values], dtype=np.int16)
+
+        if unknown.any():
+            if policy == "reject":
+                rows, cols = np.nonzero(unknown)
+                raise UnknownCategoryError(
+                    [
+                        (i, self.features[j], columns[self.features[j]][i])
+                        for i, j in zip(rows.tolist(), cols.tolist(), strict=True)
+                    ]
+                )
+            if policy == "other":
+                other_codes = np.array(
+                    [t[o] for t, o in zip(self._codes, self.other, strict=True)],
+                    dtype=np.int16,
+                )
+                codes = np.where(unknown, other_codes, codes)
+        return EncodedCategories(codes=codes, unknown=unknown)
+
+    def encode_payloads(
+        self, payloads: Sequence[Mapping[str, Any]], policy: str = "count"
+    ) -> EncodedCategories:
+        columns = {c: list(map(itemgetter(c), payloads)) for c in self.features}
+        return self.encode(columns, policy)
+
+    def decode(self, codes: np.ndarray) -> Dict[str, List[Any]]:
+        """Inverse de `encode` (None pour un code inconnu)."""
+        columns = {}
+        for j, (col, values) in enumerate(zip(self.features, self.values, strict=True)):
+            lookup = np.array(list(values) + [None], dtype=object)
+            columns[col] = lookup[codes[:, j]].tolist()
+        return columns
+
+
+def build_category_dictionary(df: pd.DataFrame) -> CategoryDictionary:
+    """Dictionnaire des modalités vues dans `df` (jeu d'entraînement).
+
+    Repli : "other" si la modalité existe, sinon la plus fréquente. Lève
+    ValueError si une feature n'a aucune valeur observée.
+    """
+    values: Dict[str, List[str]] = {}
+    other: Dict[str, str] = {}
+    for col in CATEGORICAL_FEATURES:
+        counts = df[col].dropna().astype(str).value_counts()
+        if counts.empty:
+            raise ValueError(f"Aucune modalité observée pour {col} (colonne vide)")
+        values[col] = sorted(counts.index)
+        # Ex aequo : la plus petite modalité, comme SimpleImputer
+        other[col] = (
+            "other"
+            if "other" in counts.index
+            else min(counts.index, key=lambda v, c=counts: (-c[v], v))
+        )
+    return CategoryDictionary.from_values(values, other)
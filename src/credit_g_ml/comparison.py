@@ -0,0 +1,119 @@
+"""Comparaison de familles de modèles : précision contre coût de service.
+
+Pour chaque pipeline candidat : ROC AUC sur le jeu de test, temps
+d'entraînement, latence unitaire (`predict_single`), débit par lot
+(`predict_batch`) et taille de l'artefact joblib. `select_model` choisit le
+meilleur AUC parmi les candidats qui respectent un budget de latence.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import joblib
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import Pipeline
+
+from .benchmarking import measure
+from .inference import predict_batch, predict_frame, predict_single
+
+REPORT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ModelComparison:
+    name: str
+    roc_auc: float
+    train_time_s: float
+    single_p50_ms: float
+    single_p95_ms: float
+    batch_rows_per_s: float
+    artifact_bytes: int
+
+
+def compare_model(
+    name: str,
+    pipeline: Pipeline,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    n_calls: int = 200,
+    batch_size: int = 1000,
+) -> ModelComparison:
+    """Entraîne `pipeline` puis mesure sa précision et son coût de service."""
+    start = time.perf_counter()
+    pipeline.fit(X_train, y_train)
+    train_time_s = time.perf_counter() - start
+
+    p_bad = predict_frame(pipeline, X_test)["probability_bad"]
+    roc_auc = float(roc_auc_score(y_test.astype(str) == "bad", p_bad))
+
+    payloads = X_test.astype(object).to_dict(orient="records")
+    single = measure(
+        f"{name}.predict_single",
+        lambda: predict_single(pipeline, payloads[0]),
+        n_calls=n_calls,
+    )
+    batch = [payloads[i % len(payloads)] for i in range(batch_size)]
+    batched = measure(
+        f"{name}.predict_batch",
+        lambda: predict_batch(pipeline, batch),
+        n_calls=max(n_calls // 20, 3),
+        rows_per_call=batch_size,
+    )
+
+    buffer = io.BytesIO()
+    joblib.dump(pipeline, buffer)
+
+    return ModelComparison(
+        name=name,
+        roc_auc=roc_auc,
+        train_time_s=train_time_s,
+        single_p50_ms=single.p50_ms,
+        single_p95_ms=single.p95_ms,
+        batch_rows_per_s=batched.rows_per_s,
+        artifact_bytes=buffer.getbuffer().nbytes,
+    )
+
+
+def select_model(
+    results: List[ModelComparison], max_p95_ms: float | None = None
+) -> ModelComparison:
+    """Meilleur AUC parmi les modèles dont la latence p95 respecte le budget.
+
+    À AUC égal, le plus rapide. Sans candidat dans le budget, le plus rapide.
+    """
+    if not results:
+        raise ValueError("Aucun modèle à comparer.")
+    eligible = [
+        r for r in results if max_p95_ms is None or r.single_p95_ms <= max_p95_ms
+    ]
+    if not eligible:
+        return min(results, key=lambda r: r.single_p95_ms)
+    return max(eligible, key=lambda r: (r.roc_auc, -r.single_p95_ms))
+
+
+def build_comparison_report(
+    results: List[ModelComparison],
+    recommended: ModelComparison,
+    metadata: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "recommended": recommended.name,
+        "metadata": metadata or {},
+        "models": {r.name: asdict(r) for r in results},
+    }
+
+
+def write_comparison_report(report: Dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
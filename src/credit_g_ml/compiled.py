@@ -0,0 +1,478 @@
+"""Scoreur "compilé" pour le pipeline de régression logistique.
+
+Une fois entraîné, le pipeline (imputation médiane + StandardScaler + OneHotEncoder
++ LogisticRegression) n'est qu'une fonction affine :
+
+- numériques : le scaler est replié dans les coefficients (w / scale) et
+  dans l'intercept (- w * mean / scale) ;
+- catégorielles : une table {modalité: poids} par feature, une modalité
+  inconnue contribuant 0 (comme `handle_unknown="ignore"`). Avec un
+  dictionnaire de codes (`categories.CategoryDictionary`), la table devient un
+  tableau de poids indexé par les codes entiers (`decision_function_codes`).
+
+Le scoreur n'utilise que NumPy : pas de pandas, de ColumnTransformer ni de
+matrice creuse au moment du scoring.
+
+Il s'exporte en un petit fichier JSON versionné (`save_compiled_scorer`), relu
+en quelques millisecondes par `load_compiled_scorer` sans scikit-learn ni
+pickle : le serveur peut alors se passer du pipeline joblib.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import weakref
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+
+    from .categories import CategoryDictionary
+
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_KIND = "logistic_regression"
+
+# Poids par code, par scoreur : (version du dictionnaire, tableaux)
+_CODE_WEIGHTS_CACHE: "weakref.WeakKeyDictionary[Any, Tuple[str, Tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledLogisticScorer:
+    classes: Tuple[str, ...]
+    intercept: float
+    numeric_features: Tuple[str, ...]
+    numeric_fill: np.ndarray  # valeurs d'imputation (médianes)
+    numeric_weights: np.ndarray  # coefficients repliés (coef / scale)
+    categorical_features: Tuple[str, ...]
+    categorical_fill: Tuple[Any, ...]  # valeurs d'imputation (plus fréquentes)
+    category_weights: Tuple[Dict[Any, float], ...]
+    # Moyennes du scaler : référence des contributions numériques (explications)
+    numeric_center: np.ndarray | None = None
+    # Version "Python pur" des paramètres numériques, pour le scoring unitaire
+    _numeric_terms: Tuple[Tuple[str, float, float], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        terms = tuple(
+            zip(
+                self.numeric_features,
+                self.numeric_fill.tolist(),
+                self.numeric_weights.tolist(),
+                strict=True,
+            )
+        )
+        object.__setattr__(self, "_numeric_terms", terms)
+
+    @property
+    def classes_(self) -> np.ndarray:
+        """Même interface que le pipeline scikit-learn."""
+        return np.asarray(self.classes, dtype=object)
+
+    # ------------------------------------------------------------------
+    # Scoring unitaire (dict) : boucle Python pure, sans allocation NumPy
+    # ------------------------------------------------------------------
+    def decision_function_one(self, payload: Mapping[str, Any]) -> float:
+        """Score linéaire (logit de la classe `classes[1]`) pour un dict."""
+        z = self.intercept
+        for name, fill, weight in self._numeric_terms:
+            value = payload[name]
+            if _is_missing(value):
+                value = fill
+            z += weight * float(value)
+        for name, fill, table in zip(
+            self.categorical_features,
+            self.categorical_fill,
+            self.category_weights,
+            strict=True,
+        ):
+            value = payload[name]
+            if _is_missing(value):
+                value = fill
+            z += table.get(value, 0.0)
+        return z
+
+    def predict_proba_one(self, payload: Mapping[str, Any]) -> np.ndarray:
+        """Probabilités [p(classes[0]), p(classes[1])] pour un dict."""
+        p1 = _sigmoid(self.decision_function_one(payload))
+        return np.array([1.0 - p1, p1])
+
+    # ------------------------------------------------------------------
+    # Scoring vectorisé (tableaux NumPy)
+    # ------------------------------------------------------------------
+    def decision_function_arrays(
+        self, numeric: np.ndarray, categorical: np.ndarray
+    ) -> np.ndarray:
+        """Score linéaire pour des tableaux (n, n_num) et (n, n_cat).
+
+        Les colonnes doivent suivre l'ordre de `numeric_features` et
+        `categorical_features`.
+        """
+        numeric, categorical = self._check_arrays(numeric, categorical)
+        numeric = np.where(np.isnan(numeric), self.numeric_fill, numeric)
+        z = numeric @ self.numeric_weights + self.intercept
+
+        for j, (fill, table) in enumerate(
+            zip(self.categorical_fill, self.category_weights, strict=True)
+        ):
+            z += _lookup(categorical[:, j], table, fill)
+        return z
+
+    def code_weights(self, dictionary: "CategoryDictionary") -> Tuple[np.ndarray, ...]:
+        """Poids indexés par les codes de `dictionary`, une feature par tableau.
+
+        Tableaux dans l'ordre de `dictionary.features` ; le dernier élément
+        (code des modalités inconnues) vaut 0. Mis en cache par dictionnaire.
+        """
+        cached = _CODE_WEIGHTS_CACHE.get(self)
+        if cached is not None and cached[0] == dictionary.version:
+            return cached[1]
+        tables = dict(
+            zip(self.categorical_features, self.category_weights, strict=True)
+        )
+        if set(dictionary.features) != set(tables):
+            raise ValueError("Features du dictionnaire et du scoreur différentes.")
+        weights = tuple(
+            np.array([tables[col].get(v, 0.0) for v in values] + [0.0])
+            for col, values in zip(dictionary.features, dictionary.values, strict=True)
+        )
+        _CODE_WEIGHTS_CACHE[self] = (dictionary.version, weights)
+        return weights
+
+    def decision_function_codes(
+        self,
+        numeric: np.ndarray,
+        codes: np.ndarray,
+        dictionary: "CategoryDictionary",
+    ) -> np.ndarray:
+        """Score linéaire à partir des codes entiers (n, n_cat) de `dictionary`.
+
+        Équivalent à `decision_function_arrays` sur les modalités décodées ;
+        les valeurs manquantes n'ont pas de code et doivent être imputées avant.
+        """
+        numeric = np.asarray(numeric, dtype=float)
+        numeric = np.where(np.isnan(numeric), self.numeric_fill, numeric)
+        z = numeric @ self.numeric_weights + self.intercept
+        for j, weights in enumerate(self.code_weights(dictionary)):
+            z += weights[codes[:, j]]
+        return z
+
+    def predict_proba_codes(
+        self,
+        numeric: np.ndarray,
+        codes: np.ndarray,
+        dictionary: "CategoryDictionary",
+    ) -> np.ndarray:
+        """Probabilités (n, 2) à partir des codes entiers de `dictionary`."""
+        p1 = _sigmoid_array(self.decision_function_codes(numeric, codes, dictionary))
+        return np.column_stack([1.0 - p1, p1])
+
+    def contributions_arrays(
+        self, numeric: np.ndarray, categorical: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """Termes du logit par feature, (n, n_num + n_cat), et valeur de base.
+
+        Numériques : coef * valeur standardisée, soit w * (x - moyenne) ;
+        catégorielles : coefficient de la modalité (0 si inconnue). La somme
+        des termes d'une ligne plus la valeur de base redonne exactement son
+        logit. Sans `numeric_center` (artefact ancien), la référence des
+        numériques est la valeur d'imputation.
+        """
+        numeric, categorical = self._check_arrays(numeric, categorical)
+        center = (
+            self.numeric_center
+            if self.numeric_center is not None
+            else self.numeric_fill
+        )
+        numeric = np.where(np.isnan(numeric), self.numeric_fill, numeric)
+
+        terms = np.empty((len(numeric), numeric.shape[1] + categorical.shape[1]))
+        terms[:, : numeric.shape[1]] = (numeric - center) * self.numeric_weights
+        for j, (fill, table) in enumerate(
+            zip(self.categorical_fill, self.category_weights, strict=True)
+        ):
+            terms[:, numeric.shape[1] + j] = _lookup(categorical[:, j], table, fill)
+        base = self.intercept + float(np.dot(self.numeric_weights, center))
+        return terms, base
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Score linéaire pour un DataFrame ou un mapping {colonne: valeurs}."""
+        numeric, categorical = self.to_arrays(X)
+        return self.decision_function_arrays(numeric, categorical)
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Probabilités (n, 2), dans l'ordre de `classes` (comme scikit-learn)."""
+        p1 = _sigmoid_array(self.decision_function(X))
+        return np.column_stack([1.0 - p1, p1])
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Classe prédite (seuil 0 sur le logit, comme LogisticRegression)."""
+        z = self.decision_function(X)
+        return self.classes_[(z > 0).astype(int)]
+
+    # ------------------------------------------------------------------
+    # Sérialisation (JSON, sans pickle)
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Paramètres du scoreur sous forme sérialisable en JSON."""
+        return {
+            "format_version": ARTIFACT_FORMAT_VERSION,
+            "kind": ARTIFACT_KIND,
+            "classes": list(self.classes),
+            "intercept": self.intercept,
+            "numeric": {
+                "features": list(self.numeric_features),
+                "fill": self.numeric_fill.tolist(),
+                "weights": self.numeric_weights.tolist(),
+            }
+            | (
+                {"center": self.numeric_center.tolist()}
+                if self.numeric_center is not None
+                else {}
+            ),
+            "categorical": {
+                "features": list(self.categorical_features),
+                "fill": list(self.categorical_fill),
+                # Paires [modalité, poids] : conserve le type des modalités
+                "weights": [
+                    [[value, weight] for value, weight in table.items()]
+                    for table in self.category_weights
+                ],
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, content: Mapping[str, Any]) -> "CompiledLogisticScorer":
+        """Inverse de `to_dict`. Lève ValueError si le format n'est pas supporté."""
+        version = content.get("format_version")
+        if version != ARTIFACT_FORMAT_VERSION or content.get("kind") != ARTIFACT_KIND:
+            raise ValueError(
+                f"Artefact non supporté (kind={content.get('kind')!r}, "
+                f"format_version={version!r})"
+            )
+        numeric, categorical = content["numeric"], content["categorical"]
+        return cls(
+            classes=tuple(content["classes"]),
+            intercept=float(content["intercept"]),
+            numeric_features=tuple(numeric["features"]),
+            numeric_fill=np.asarray(numeric["fill"], dtype=float),
+            numeric_weights=np.asarray(numeric["weights"], dtype=float),
+            numeric_center=(
+                np.asarray(numeric["center"], dtype=float)
+                if "center" in numeric
+                else None
+            ),
+            categorical_features=tuple(categorical["features"]),
+            categorical_fill=tuple(categorical["fill"]),
+            category_weights=tuple(
+                {value: float(weight) for value, weight in pairs}
+                for pairs in categorical["weights"]
+            ),
+        )
+
+    def _check_arrays(
+        self, numeric: np.ndarray, categorical: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        numeric = np.asarray(numeric, dtype=float)
+        categorical = np.asarray(categorical, dtype=object)
+        if numeric.ndim != 2 or numeric.shape[1] != len(self.numeric_features):
+            raise ValueError(
+                f"Tableau numérique attendu de forme (n, {len(self.numeric_features)})"
+            )
+        if categorical.ndim != 2 or categorical.shape[1] != len(
+            self.categorical_features
+        ):
+            raise ValueError(
+                "Tableau catégoriel attendu de forme "
+                f"(n, {len(self.categorical_features)})"
+            )
+        return numeric, categorical
+
+    def to_arrays(self, X: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Tableaux (numériques, catégoriels) d'un DataFrame ou d'un mapping."""
+        numeric = np.column_stack(
+            [np.asarray(X[c], dtype=float) for c in self.numeric_features]
+        )
+        categorical = np.column_stack(
+            [np.asarray(X[c], dtype=object) for c in self.categorical_features]
+        )
+        return numeric, categorical
+
+
+def compile_pipeline(pipeline: "Pipeline") -> CompiledLogisticScorer:
+    """Compile un pipeline entraîné (build_logistic_regression_pipeline).
+
+    Lève ValueError si la structure du pipeline n'est pas celle attendue.
+    """
+    try:
+        preprocessor = pipeline.named_steps["preprocessor"]
+        model = pipeline.named_steps["model"]
+        fitted = {
+            name: (trans, cols) for name, trans, cols in preprocessor.transformers_
+        }
+        num_pipe, num_cols = fitted["num"]
+        cat_pipe, cat_cols = fitted["cat"]
+        num_imputer = num_pipe.named_steps["imputer"]
+        scaler = num_pipe.named_steps["scaler"]
+        cat_imputer = cat_pipe.named_steps["imputer"]
+        encoder = cat_pipe.named_steps["encoder"]
+    except (AttributeError, KeyError) as e:
+        raise ValueError(f"Structure de pipeline non supportée: {e}") from e
+
+    coef = np.asarray(model.coef_, dtype=float)
+    if coef.shape[0] != 1 or len(model.classes_) != 2:
+        raise ValueError("Seule la classification binaire est supportée.")
+    if getattr(encoder, "drop_idx_", None) is not None or getattr(
+        encoder, "_infrequent_enabled", False
+    ):
+        raise ValueError("OneHotEncoder avec drop/infrequent non supporté.")
+    if remainder := fitted.get("remainder"):
+        if remainder[0] != "drop" and len(remainder[1]) > 0:
+            raise ValueError("ColumnTransformer avec remainder non supporté.")
+
+    coef = coef[0]
+    n_num = len(num_cols)
+    w_num = coef[:n_num]
+
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_num)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_num)
+    numeric_weights = w_num / scale
+    intercept = float(model.intercept_[0] - np.dot(w_num, mean / scale))
+
+    category_weights = []
+    offset = n_num
+    for categories in encoder.categories_:
+        weights = coef[offset : offset + len(categories)]
+        category_weights.append(
+            {_to_python(c): float(w) for c, w in zip(categories, weights, strict=True)}
+        )
+        offset += len(categories)
+    if offset != coef.shape[0]:
+        raise ValueError("Nombre de coefficients incohérent avec le préprocesseur.")
+
+    return CompiledLogisticScorer(
+        classes=tuple(str(c) for c in model.classes_),
+        intercept=intercept,
+        numeric_features=tuple(num_cols),
+        numeric_fill=np.asarray(num_imputer.statistics_, dtype=float),
+        numeric_weights=np.asarray(numeric_weights, dtype=float),
+        numeric_center=np.asarray(mean, dtype=float),
+        categorical_features=tuple(cat_cols),
+        categorical_fill=tuple(_to_python(v) for v in cat_imputer.statistics_),
+        category_weights=tuple(category_weights),
+    )
+
+
+def verify_compiled_scorer(
+    pipeline: "Pipeline",
+    scorer: CompiledLogisticScorer,
+    X: Any,
+    atol: float = 1e-9,
+) -> float:
+    """Vérifie que le scoreur compilé reproduit `pipeline.predict_proba` sur X.
+
+    Retourne l'écart absolu maximal ; lève AssertionError s'il dépasse `atol`.
+    """
+    expected = pipeline.predict_proba(X)
+    actual = scorer.predict_proba(X)
+    max_diff = float(np.max(np.abs(expected - actual))) if len(expected) else 0.0
+    if max_diff > atol:
+        raise AssertionError(
+            f"Écart scoreur compilé / pipeline trop grand: {max_diff:.3e} > {atol:.1e}"
+        )
+    return max_diff
+
+
+def save_compiled_scorer(
+    scorer: CompiledLogisticScorer,
+    path: Path,
+    metadata: Dict[str, Any] | None = None,
+) -> Path:
+    """Écrit le scoreur en JSON (écriture atomique). Retourne le chemin.
+
+    `metadata` (version de scikit-learn, empreinte du pipeline source...) est
+    stocké tel quel et ignoré au chargement.
+    """
+    content = scorer.to_dict() | {"metadata": metadata or {}}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(content, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_compiled_scorer(path: Path) -> CompiledLogisticScorer:
+    """Charge un scoreur exporté par `save_compiled_scorer` (NumPy seulement)."""
+    if not path.exists():
+        raise FileNotFoundError(f"Artefact introuvable: {path}")
+    return CompiledLogisticScorer.from_dict(
+        json.loads(path.read_text(encoding="utf-8"))
+    )
+
+
+def export_pipeline(
+    pipeline: "Pipeline",
+    path: Path,
+    X_check: Any,
+    atol: float = 1e-9,
+    metadata: Dict[str, Any] | None = None,
+) -> Tuple[Path, float]:
+    """Compile, exporte puis relit le pipeline, et vérifie l'artefact relu sur X_check.
+
+    Retourne (chemin, écart max). Lève AssertionError (artefact supprimé) si
+    l'artefact ne reproduit pas les probabilités du pipeline.
+    """
+    save_compiled_scorer(compile_pipeline(pipeline), path, metadata=metadata)
+    try:
+        max_diff = verify_compiled_scorer(
+            pipeline, load_compiled_scorer(path), X_check, atol=atol
+        )
+    except AssertionError:
+        path.unlink(missing_ok=True)
+        raise
+    return path, max_diff
+
+
+def _lookup(values: np.ndarray, table: Dict[Any, float], fill: Any) -> np.ndarray:
+    """Poids de chaque valeur (0 pour une modalité inconnue)."""
+    weights = np.fromiter(
+        map(table.get, values, repeat(math.nan)), dtype=float, count=len(values)
+    )
+    # Seules les valeurs absentes de la table (inconnues ou manquantes) sont revues
+    for i in np.flatnonzero(np.isnan(weights)).tolist():
+        weights[i] = table.get(fill, 0.0) if _is_missing(values[i]) else 0.0
+    return weights
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _to_python(value: Any) -> Any:
+    """Convertit les scalaires NumPy en types Python (clés de dict stables)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+def _sigmoid_array(z: np.ndarray) -> np.ndarray:
+    out = np.empty_like(z, dtype=float)
+    pos = z >= 0
+    out[pos] = 1.0 / (1.0 + np.exp(-z[pos]))
+    e = np.exp(z[~pos])
+    out[~pos] = e / (1.0 + e)
+    return out
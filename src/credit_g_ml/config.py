@@ -10,3 +10,7 @@ MODELS_DIR = PROJECT_ROOT / "models"
 
 RANDOM_STATE = 42
 TARGET_COL = "class"
+
+# Seuils de probabilité de défaut (p(bad)) des niveaux de risque medium / high
+RISK_MEDIUM_CUTOFF = 0.4
+RISK_HIGH_CUTOFF = 0.7
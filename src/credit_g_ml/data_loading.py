@@ -1,24 +1,44 @@
 """Module de chargement des données pour le projet credit_g_ml.
 
 Ce module fournit une fonction pour charger le dataset credit-g via OpenML.
+
+Le CSV brut (`data/raw`) est converti une fois en Parquet typé dans
+`data/processed` : catégorielles en dtype `category`, numériques en types à
+largeur fixe. Le hash du CSV source est stocké dans les métadonnées du fichier
+Parquet ; si le CSV change, le fichier typé est reconstruit au chargement
+suivant.
 """
 
+from __future__ import annotations
+
+import hashlib
 from pathlib import Path
+from typing import Dict, List, Sequence
 
-import openml
 import pandas as pd
 
-from .config import RAW_DATA_DIR, TARGET_COL
+from .config import PROCESSED_DATA_DIR, RAW_DATA_DIR, TARGET_COL
+from .schemas import CATEGORICAL_FEATURES, NUMERIC_FEATURES
 
 DATASET_NAME = "credit-g"
 DATASET_ID = 31  # pour info, mais on utilise surtout le nom
 
+PROCESSED_FILENAME = "credit_g.parquet"
+
+# Clés des métadonnées Parquet décrivant le CSV source
+_SOURCE_SHA256 = b"credit_g_ml.source_sha256"
+_SOURCE_SIZE = b"credit_g_ml.source_size"
+_SOURCE_MTIME_NS = b"credit_g_ml.source_mtime_ns"
+
 
 def fetch_credit_g_dataframe() -> pd.DataFrame:
     """Télécharge le dataset credit-g depuis OpenML et retourne un DataFrame complet.
 
     On fusionne X et y dans un seul DataFrame, avec la colonne cible TARGET_COL.
     """
+    # Import local : openml n'est utile qu'au téléchargement, pas au serving
+    import openml
+
     dataset = openml.datasets.get_dataset(DATASET_NAME)
     X, y, _, _ = dataset.get_data(
         dataset_format="dataframe",
@@ -45,15 +65,129 @@ def save_raw_credit_g(filename: str = "credit_g_raw.csv") -> Path:
     return output_path
 
 
-def load_local_credit_g(filename: str = "credit_g_raw.csv") -> pd.DataFrame:
-    """Charge le dataset credit-g sauvegardé en local dans data/raw/."""
+def load_local_credit_g(
+    filename: str = "credit_g_raw.csv",
+    columns: Sequence[str] | None = None,
+    use_processed: bool = True,
+) -> pd.DataFrame:
+    """Charge le dataset credit-g sauvegardé en local dans data/raw/.
+
+    Par défaut, la lecture passe par le Parquet typé de data/processed/
+    (construit ou reconstruit si besoin). `columns` limite la lecture aux
+    colonnes demandées. Sans pyarrow, ou avec `use_processed=False`, le CSV est
+    lu directement (avec les mêmes types).
+    """
     csv_path = RAW_DATA_DIR / filename
     if not csv_path.exists():
         raise FileNotFoundError(
             f"Le fichier {csv_path} n'existe pas. "
             "Lance d'abord save_raw_credit_g() pour le télécharger."
         )
-    return pd.read_csv(csv_path)
+    columns = list(columns) if columns is not None else None
+
+    if use_processed and _has_pyarrow():
+        return pd.read_parquet(build_processed_credit_g(filename), columns=columns)
+    return _read_typed_csv(csv_path, columns)
+
+
+def processed_path_for(filename: str = "credit_g_raw.csv") -> Path:
+    """Chemin du Parquet typé correspondant à un CSV brut de data/raw/."""
+    if filename == "credit_g_raw.csv":
+        return PROCESSED_DATA_DIR / PROCESSED_FILENAME
+    return PROCESSED_DATA_DIR / (Path(filename).stem + ".parquet")
+
+
+def build_processed_credit_g(
+    filename: str = "credit_g_raw.csv", force: bool = False
+) -> Path:
+    """Convertit le CSV brut en Parquet typé, sauf s'il est déjà à jour.
+
+    Retourne le chemin du fichier Parquet.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    csv_path = RAW_DATA_DIR / filename
+    output_path = processed_path_for(filename)
+    if not force and _is_fresh(output_path, csv_path):
+        return output_path
+
+    table = pa.Table.from_pandas(_read_typed_csv(csv_path), preserve_index=False)
+    stat = csv_path.stat()
+    table = table.replace_schema_metadata(
+        (table.schema.metadata or {})
+        | {
+            _SOURCE_SHA256: _file_sha256(csv_path).encode(),
+            _SOURCE_SIZE: str(stat.st_size).encode(),
+            _SOURCE_MTIME_NS: str(stat.st_mtime_ns).encode(),
+        }
+    )
+
+    # Écriture atomique : un lecteur concurrent ne voit jamais un fichier partiel
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    pq.write_table(table, tmp_path)
+    tmp_path.replace(output_path)
+    return output_path
+
+
+def _is_fresh(parquet_path: Path, csv_path: Path) -> bool:
+    """Le Parquet correspond-il au contenu actuel du CSV ?
+
+    Taille et mtime identiques suffisent ; sinon on compare le hash du contenu
+    (un simple `touch` ne force pas de reconstruction).
+    """
+    import pyarrow.parquet as pq
+
+    if not parquet_path.exists():
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except Exception:  # fichier corrompu ou écrit par autre chose
+        return False
+    if _SOURCE_SHA256 not in metadata:
+        return False
+
+    stat = csv_path.stat()
+    if (
+        metadata.get(_SOURCE_SIZE) == str(stat.st_size).encode()
+        and metadata.get(_SOURCE_MTIME_NS) == str(stat.st_mtime_ns).encode()
+    ):
+        return True
+    return metadata[_SOURCE_SHA256] == _file_sha256(csv_path).encode()
+
+
+def _read_typed_csv(csv_path: Path, columns: List[str] | None = None) -> pd.DataFrame:
+    """Lit le CSV brut avec des types explicites (category, entiers, flottants)."""
+    dtypes: Dict[str, str] = {c: "category" for c in CATEGORICAL_FEATURES}
+    dtypes[TARGET_COL] = "category"
+    df = pd.read_csv(csv_path, usecols=columns, dtype=dtypes)
+
+    for col in NUMERIC_FEATURES:
+        if col in df.columns:
+            df[col] = _narrow_numeric(df[col])
+    return df
+
+
+def _narrow_numeric(series: pd.Series) -> pd.Series:
+    """Plus petit entier possible si les valeurs sont entières, sinon float64."""
+    values = pd.to_numeric(series)
+    if values.notna().all() and (values % 1 == 0).all():
+        return pd.to_numeric(values.astype("int64"), downcast="integer")
+    return values.astype("float64")
+
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,358 @@
+"""Surveillance de la dérive des entrées servies, à mémoire constante.
+
+À l'entraînement, un profil de référence est calculé sur le jeu
+d'entraînement et sauvegardé à côté du modèle (`<modèle>.drift.json`) :
+
+- numériques : bornes de bins fixes (quantiles) et proportions par bin, plus
+  un bin pour les valeurs manquantes ;
+- catégorielles : vocabulaire et proportion de chaque modalité.
+
+En service, `DriftMonitor` compte les requêtes dans ces mêmes bins : quelques
+listes d'entiers de taille fixe, réparties en shards (un verrou par shard,
+attribué à chaque thread à tour de rôle) pour que les mises à jour concurrentes
+ne se bloquent presque jamais. `report` agrège les shards et calcule, au plus une
+fois par `refresh_interval_s`, le PSI de chaque feature et le taux de
+modalités inconnues : `OneHotEncoder(handle_unknown="ignore")` les met à zéro
+sans le signaler, c'est donc ici qu'elles deviennent visibles.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from .schemas import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PROFILE_FORMAT_VERSION = 1
+
+# Seuils usuels du PSI : < 0.1 stable, < 0.25 dérive modérée, sinon forte
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+# Proportion plancher (bins vides) pour que le PSI reste fini
+PSI_EPSILON = 1e-4
+
+
+@dataclass(frozen=True)
+class ReferenceProfile:
+    n_rows: int
+    # Bornes intérieures des bins : len(edges) + 1 bins, puis un bin "manquant"
+    numeric_edges: Dict[str, List[float]]
+    numeric_proportions: Dict[str, List[float]]
+    # Proportions des modalités, puis d'une case "inconnue" (0 par construction)
+    categorical_values: Dict[str, List[str]]
+    categorical_proportions: Dict[str, List[float]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format_version": PROFILE_FORMAT_VERSION,
+            "n_rows": self.n_rows,
+            "numeric": {
+                col: {
+                    "edges": self.numeric_edges[col],
+                    "proportions": self.numeric_proportions[col],
+                }
+                for col in self.numeric_edges
+            },
+            "categorical": {
+                col: {
+                    "categories": self.categorical_values[col],
+                    "proportions": self.categorical_proportions[col],
+                }
+                for col in self.categorical_values
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, content: Dict[str, Any]) -> "ReferenceProfile":
+        """Inverse de `to_dict`. Lève ValueError si le format n'est pas supporté."""
+        version = content.get("format_version")
+        if version != PROFILE_FORMAT_VERSION:
+            raise ValueError(
+                f"Profil de dérive non supporté (format_version={version!r})"
+            )
+        numeric, categorical = content["numeric"], content["categorical"]
+        return cls(
+            n_rows=int(content["n_rows"]),
+            numeric_edges={c: v["edges"] for c, v in numeric.items()},
+            numeric_proportions={c: v["proportions"] for c, v in numeric.items()},
+            categorical_values={c: v["categories"] for c, v in categorical.items()},
+            categorical_proportions={
+                c: v["proportions"] for c, v in categorical.items()
+            },
+        )
+
+
+def build_reference_profile(df: pd.DataFrame, n_bins: int = 10) -> ReferenceProfile:
+    """Profil de référence des features de `df` (jeu d'entraînement).
+
+    Les bornes numériques sont les quantiles de `df` (au plus `n_bins` bins,
+    moins pour les features à peu de valeurs distinctes).
+    """
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+    numeric_edges: Dict[str, List[float]] = {}
+    numeric_proportions: Dict[str, List[float]] = {}
+    for col in NUMERIC_FEATURES:
+        values = df[col].to_numpy(dtype=float)
+        observed = values[~np.isnan(values)]
+        edges = np.unique(np.quantile(observed, quantiles)) if len(observed) else []
+        counts = _bin_counts(values, np.asarray(edges, dtype=float))
+        numeric_edges[col] = [float(e) for e in edges]
+        numeric_proportions[col] = (counts / len(values)).tolist()
+
+    categorical_values: Dict[str, List[str]] = {}
+    categorical_proportions: Dict[str, List[float]] = {}
+    for col in CATEGORICAL_FEATURES:
+        counts = df[col].dropna().astype(str).value_counts()
+        categories = sorted(counts.index)
+        categorical_values[col] = categories
+        categorical_proportions[col] = [
+            float(counts[c]) / len(df) for c in categories
+        ] + [0.0]
+
+    return ReferenceProfile(
+        n_rows=len(df),
+        numeric_edges=numeric_edges,
+        numeric_proportions=numeric_proportions,
+        categorical_values=categorical_values,
+        categorical_proportions=categorical_proportions,
+    )
+
+
+def drift_profile_path_for(model_path: Path) -> Path:
+    """Chemin du profil de référence associé à un modèle."""
+    return model_path.with_suffix(".drift.json")
+
+
+def save_reference_profile(profile: ReferenceProfile, model_path: Path) -> Path:
+    """Écrit le profil à côté du modèle. Retourne le chemin."""
+    path = drift_profile_path_for(model_path)
+    path.write_text(json.dumps(profile.to_dict(), ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def load_reference_profile(model_path: Path) -> ReferenceProfile:
+    """Charge le profil associé au modèle `model_path` (FileNotFoundError sinon)."""
+    path = drift_profile_path_for(model_path)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Profil de dérive introuvable: {path}. "
+            "Relance scripts/train_model.py pour le générer."
+        )
+    return ReferenceProfile.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def population_stability_index(
+    expected: Sequence[float], actual: Sequence[float]
+) -> float:
+    """PSI entre deux distributions (proportions) sur les mêmes bins."""
+    e = np.maximum(np.asarray(expected, dtype=float), PSI_EPSILON)
+    a = np.maximum(np.asarray(actual, dtype=float), PSI_EPSILON)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def psi_status(psi: float) -> str:
+    if psi < PSI_MODERATE:
+        return "stable"
+    if psi < PSI_SIGNIFICANT:
+        return "moderate"
+    return "significant"
+
+
+class _Shard:
+    """Compteurs d'un shard : taille fixe, protégés par leur propre verrou."""
+
+    __slots__ = ("lock", "n", "numeric", "categorical")
+
+    def __init__(self, numeric_sizes: List[int], categorical_sizes: List[int]) -> None:
+        self.lock = threading.Lock()
+        self.n = 0
+        self.numeric = [[0] * size for size in numeric_sizes]
+        self.categorical = [[0] * size for size in categorical_sizes]
+
+
+class DriftMonitor:
+    """Histogrammes des requêtes servies comparés au profil de référence.
+
+    Mémoire constante : `n_shards` jeux de compteurs de la taille des bins,
+    quel que soit le trafic. Les compteurs sont cumulés depuis la création
+    du moniteur (ou le dernier `reset`).
+    """
+
+    def __init__(
+        self,
+        profile: ReferenceProfile,
+        n_shards: int = 16,
+        refresh_interval_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.profile = profile
+        self.refresh_interval_s = refresh_interval_s
+        self._clock = clock
+        self._numeric = [
+            (col, profile.numeric_edges[col]) for col in profile.numeric_edges
+        ]
+        self._categorical = [
+            (col, {v: i for i, v in enumerate(profile.categorical_values[col])})
+            for col in profile.categorical_values
+        ]
+        numeric_sizes = [len(edges) + 2 for _, edges in self._numeric]
+        categorical_sizes = [len(codes) + 1 for _, codes in self._categorical]
+        self._shards = [
+            _Shard(numeric_sizes, categorical_sizes) for _ in range(max(n_shards, 1))
+        ]
+        # Shards attribués aux threads à tour de rôle, à leur premier appel
+        self._next_shard = itertools.count()
+        self._thread_shard = threading.local()
+        self._report_lock = threading.Lock()
+        self._report: Dict[str, Any] | None = None
+        self._report_at = -math.inf
+
+    def _shard(self) -> _Shard:
+        # Un thread retombe toujours sur le même shard : verrou rarement disputé.
+        # (`threading.get_ident()` est une adresse alignée : son modulo ne
+        # répartit pas les threads.)
+        try:
+            return self._thread_shard.shard
+        except AttributeError:
+            # next() sur itertools.count est atomique sous le GIL
+            index = next(self._next_shard) % len(self._shards)
+            self._thread_shard.shard = self._shards[index]
+            return self._thread_shard.shard
+
+    def observe(self, payload: Dict[str, Any]) -> None:
+        """Compte un payload validé (appelé à chaque /predict)."""
+        shard = self._shard()
+        with shard.lock:
+            shard.n += 1
+            for counts, (col, edges) in zip(shard.numeric, self._numeric, strict=True):
+                value = payload.get(col)
+                if value is None or value != value:
+                    counts[-1] += 1
+                else:
+                    counts[bisect_right(edges, value)] += 1
+            for counts, (col, codes) in zip(
+                shard.categorical, self._categorical, strict=True
+            ):
+                counts[codes.get(payload.get(col), -1)] += 1
+
+    def observe_batch(self, payloads: Sequence[Dict[str, Any]]) -> None:
+        """Compte un lot : histogrammes calculés en NumPy puis ajoutés d'un coup."""
+        if not payloads:
+            return
+        numeric_counts = []
+        for col, edges in self._numeric:
+            # None -> NaN : compté comme manquant
+            values = np.array([p.get(col) for p in payloads], dtype=float)
+            numeric_counts.append(
+                _bin_counts(values, np.asarray(edges, dtype=float)).tolist()
+            )
+        categorical_counts = []
+        for col, codes in self._categorical:
+            unseen = len(codes)
+            indices = [codes.get(p.get(col), unseen) for p in payloads]
+            categorical_counts.append(
+                np.bincount(indices, minlength=unseen + 1).tolist()
+            )
+
+        shard = self._shard()
+        with shard.lock:
+            shard.n += len(payloads)
+            for counts, batch in zip(shard.numeric, numeric_counts, strict=True):
+                for i, c in enumerate(batch):
+                    counts[i] += c
+            for counts, batch in zip(
+                shard.categorical, categorical_counts, strict=True
+            ):
+                for i, c in enumerate(batch):
+                    counts[i] += c
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.n = 0
+                for counts in shard.numeric + shard.categorical:
+                    counts[:] = [0] * len(counts)
+        with self._report_lock:
+            self._report = None
+            self._report_at = -math.inf
+
+    def report(self, force: bool = False) -> Dict[str, Any]:
+        """PSI et taux de modalités inconnues, recalculés au plus une fois par
+        `refresh_interval_s` (ou immédiatement avec `force=True`)."""
+        now = self._clock()
+        with self._report_lock:
+            if (
+                not force
+                and self._report is not None
+                and now - self._report_at < self.refresh_interval_s
+            ):
+                return self._report
+
+        report = self._compute_report()
+        with self._report_lock:
+            self._report, self._report_at = report, now
+        return report
+
+    def _snapshot(self):
+        n = 0
+        numeric = [np.zeros(len(edges) + 2) for _, edges in self._numeric]
+        categorical = [np.zeros(len(codes) + 1) for _, codes in self._categorical]
+        for shard in self._shards:
+            with shard.lock:
+                n += shard.n
+                for total, counts in zip(numeric, shard.numeric, strict=True):
+                    total += counts
+                for total, counts in zip(categorical, shard.categorical, strict=True):
+                    total += counts
+        return n, numeric, categorical
+
+    def _compute_report(self) -> Dict[str, Any]:
+        n, numeric, categorical = self._snapshot()
+        features: Dict[str, Dict[str, Any]] = {}
+        if n:
+            for (col, _), counts in zip(self._numeric, numeric, strict=True):
+                psi = population_stability_index(
+                    self.profile.numeric_proportions[col], counts / n
+                )
+                features[col] = {"psi": psi, "status": psi_status(psi)}
+            for (col, _), counts in zip(self._categorical, categorical, strict=True):
+                psi = population_stability_index(
+                    self.profile.categorical_proportions[col], counts / n
+                )
+                features[col] = {
+                    "psi": psi,
+                    "status": psi_status(psi),
+                    "unseen_rate": float(counts[-1] / n),
+                }
+
+        unseen = sum(float(counts[-1]) for counts in categorical)
+        return {
+            "n_observed": n,
+            "reference_rows": self.profile.n_rows,
+            "max_psi": max((f["psi"] for f in features.values()), default=0.0),
+            "unseen_rate": (
+                unseen / (n * len(categorical)) if n and categorical else 0.0
+            ),
+            "features": features,
+            "computed_at": time.time(),
+        }
+
+
+def _bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Effectifs par bin (len(edges) + 1 bins), puis des valeurs manquantes."""
+    missing = np.isnan(values)
+    bins = np.searchsorted(edges, values[~missing], side="right")
+    counts = np.bincount(bins, minlength=len(edges) + 1)
+    return np.append(counts, missing.sum())
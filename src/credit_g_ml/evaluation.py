@@ -1,16 +1,272 @@
 """Module d'évaluation pour le projet credit_g_ml.
 
 Fonctions d'évaluation et de visualisation des performances.
+
+Le jeu de test est scoré une seule fois (`score_holdout`) ; toutes les
+métriques (AUC, KS, Brier, lift, matrice de confusion) sont ensuite calculées
+à partir de ces scores. Les intervalles de confiance bootstrap sont vectorisés :
+un rééchantillonnage est un vecteur de poids (nombre de tirages de chaque
+ligne) et un bloc de rééchantillonnages se calcule en quelques produits
+matriciels sur les scores triés une fois pour toutes. Les blocs sont répartis
+sur les cœurs avec joblib.
 """
 
 from __future__ import annotations
 
+import json
+import math
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-import matplotlib.pyplot as plt
+import joblib
+import numpy as np
 import pandas as pd
-from sklearn.metrics import RocCurveDisplay
-from sklearn.pipeline import Pipeline
+
+from .config import RANDOM_STATE
+from .inference import resolve_class_index
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from sklearn.pipeline import Pipeline
+
+REPORT_FORMAT_VERSION = 1
+
+METRIC_NAMES = (
+    "roc_auc",
+    "ks",
+    "brier",
+    "lift_top_decile",
+    "accuracy",
+    "precision",
+    "recall",
+    "specificity",
+)
+
+# Taille maximale (éléments) d'une matrice de poids bootstrap (n_rééch., n)
+_BOOTSTRAP_BLOCK_ELEMENTS = 2_000_000
+
+
+@dataclass(frozen=True)
+class HoldoutScores:
+    """Scores du jeu de test : p(bad) et vérité terrain (True si "bad")."""
+
+    y_bad: np.ndarray
+    p_bad: np.ndarray
+
+    def __post_init__(self) -> None:
+        if self.y_bad.shape != self.p_bad.shape or self.y_bad.ndim != 1:
+            raise ValueError("y_bad et p_bad doivent être deux vecteurs de même taille")
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"is_bad": self.y_bad.astype(int), "probability_bad": self.p_bad}
+        )
+
+
+def score_holdout(model: Any, X: pd.DataFrame, y: pd.Series) -> HoldoutScores:
+    """Score X une seule fois (`predict_proba`) et retourne p(bad) et la vérité."""
+    index = resolve_class_index(model)
+    if index.bad is None:
+        raise ValueError(f"Classe 'bad' absente du modèle: {index.classes}")
+    proba = np.asarray(model.predict_proba(X))
+    return HoldoutScores(
+        y_bad=np.asarray(y).astype(str) == "bad",
+        p_bad=np.ascontiguousarray(proba[:, index.bad], dtype=float),
+    )
+
+
+def binary_metrics(
+    scores: HoldoutScores, threshold: float = 0.5, top_fraction: float = 0.1
+) -> Dict[str, float]:
+    """Métriques du jeu de test ; "bad" est la classe positive.
+
+    Le label prédit est "bad" dès que p(bad) >= `threshold`. Le lift est celui
+    de la fraction `top_fraction` des dossiers les plus risqués.
+    """
+    weights = np.ones((1, len(scores.p_bad)))
+    metrics = _weighted_metrics(
+        _SortedScores.from_scores(scores), weights, threshold, top_fraction
+    )
+    return {name: float(values[0]) for name, values in metrics.items()}
+
+
+def bootstrap_metrics(
+    scores: HoldoutScores,
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    threshold: float = 0.5,
+    top_fraction: float = 0.1,
+    seed: int = RANDOM_STATE,
+    n_jobs: int | None = -1,
+) -> Dict[str, Tuple[float, float]]:
+    """Intervalles de confiance bootstrap (percentiles) de `binary_metrics`.
+
+    Les rééchantillonnages sont générés et évalués par blocs, au moins un par
+    worker, en parallèle ; chaque bloc a sa propre graine (dérivée de `seed`).
+    Le découpage dépend du nombre de workers : le résultat est reproductible
+    pour `seed` et `n_jobs` donnés. Un rééchantillonnage sans "bad" ou sans
+    "good" est ignoré pour les métriques qui en ont besoin.
+    """
+    if n_resamples < 1:
+        raise ValueError("n_resamples doit être >= 1")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence doit être dans ]0, 1[")
+    sorted_scores = _SortedScores.from_scores(scores)
+    sizes = _bootstrap_block_sizes(
+        n_resamples, len(scores.p_bad), joblib.effective_n_jobs(n_jobs)
+    )
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    blocks = joblib.Parallel(n_jobs=n_jobs)(
+        joblib.delayed(_bootstrap_block)(
+            sorted_scores, size, block_seed, threshold, top_fraction
+        )
+        for size, block_seed in zip(sizes, seeds, strict=True)
+    )
+
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    for name in METRIC_NAMES:
+        values = np.concatenate([b[name] for b in blocks])
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            intervals[name] = (float("nan"), float("nan"))
+            continue
+        low, high = np.quantile(values, [alpha, 1 - alpha])
+        intervals[name] = (float(low), float(high))
+    return intervals
+
+
+def _bootstrap_block_sizes(n_resamples: int, n_rows: int, n_workers: int) -> List[int]:
+    """Tailles des blocs : au moins un par worker, mémoire bornée par bloc."""
+    per_worker = math.ceil(n_resamples / max(n_workers, 1))
+    block = max(1, min(per_worker, _BOOTSTRAP_BLOCK_ELEMENTS // max(n_rows, 1)))
+    return [min(block, n_resamples - start) for start in range(0, n_resamples, block)]
+
+
+def confusion_counts(scores: HoldoutScores, threshold: float = 0.5) -> Dict[str, int]:
+    """Matrice de confusion ("bad" positif) au seuil `threshold`."""
+    predicted = scores.p_bad >= threshold
+    return {
+        "tp": int(np.sum(predicted & scores.y_bad)),
+        "fp": int(np.sum(predicted & ~scores.y_bad)),
+        "fn": int(np.sum(~predicted & scores.y_bad)),
+        "tn": int(np.sum(~predicted & ~scores.y_bad)),
+    }
+
+
+def cross_validate_metrics(
+    pipeline: Pipeline,
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_splits: int = 5,
+    n_repeats: int = 3,
+    threshold: float = 0.5,
+    seed: int = RANDOM_STATE,
+    n_jobs: int | None = -1,
+) -> Dict[str, Any]:
+    """Validation croisée stratifiée répétée (folds évalués en parallèle).
+
+    Chaque fold de validation est scoré une fois et toutes les métriques de
+    `binary_metrics` en sont tirées. Retourne moyenne, écart-type, min et max
+    par métrique.
+    """
+    from sklearn.base import clone
+    from sklearn.model_selection import RepeatedStratifiedKFold, cross_validate
+
+    def scorer(estimator: Any, X_val: pd.DataFrame, y_val: pd.Series):
+        return binary_metrics(score_holdout(estimator, X_val, y_val), threshold)
+
+    cv = RepeatedStratifiedKFold(
+        n_splits=n_splits, n_repeats=n_repeats, random_state=seed
+    )
+    start = time.perf_counter()
+    result = cross_validate(clone(pipeline), X, y, cv=cv, scoring=scorer, n_jobs=n_jobs)
+    wall_time_s = time.perf_counter() - start
+
+    metrics = {}
+    for name in METRIC_NAMES:
+        values = np.asarray(result[f"test_{name}"], dtype=float)
+        metrics[name] = {
+            "mean": float(np.nanmean(values)),
+            "std": float(np.nanstd(values)),
+            "min": float(np.nanmin(values)),
+            "max": float(np.nanmax(values)),
+        }
+    return {
+        "n_splits": n_splits,
+        "n_repeats": n_repeats,
+        "n_rows": len(X),
+        "wall_time_s": wall_time_s,
+        "metrics": metrics,
+    }
+
+
+def build_evaluation_report(
+    scores: HoldoutScores,
+    threshold: float = 0.5,
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = RANDOM_STATE,
+    n_jobs: int | None = -1,
+    cross_validation: Dict[str, Any] | None = None,
+    metadata: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Rapport JSON : métriques du jeu de test, IC bootstrap et validation croisée."""
+    start = time.perf_counter()
+    intervals = bootstrap_metrics(
+        scores,
+        n_resamples=n_resamples,
+        confidence=confidence,
+        threshold=threshold,
+        seed=seed,
+        n_jobs=n_jobs,
+    )
+    bootstrap_time_s = time.perf_counter() - start
+    point = binary_metrics(scores, threshold)
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "metadata": metadata or {},
+        "holdout": {
+            "n_rows": len(scores.p_bad),
+            "n_bad": int(scores.y_bad.sum()),
+            "threshold": threshold,
+            "metrics": {
+                name: {
+                    "value": point[name],
+                    "ci_low": intervals[name][0],
+                    "ci_high": intervals[name][1],
+                }
+                for name in METRIC_NAMES
+            },
+            "confusion": confusion_counts(scores, threshold),
+        },
+        "bootstrap": {
+            "n_resamples": n_resamples,
+            "confidence": confidence,
+            "seed": seed,
+            "wall_time_s": bootstrap_time_s,
+        },
+        "cross_validation": cross_validation,
+    }
+
+
+def write_evaluation_report(report: Dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
+
+
+def metrics_table(report: Dict[str, Any]) -> List[str]:
+    """Lignes lisibles (métrique, valeur, IC) d'un rapport d'évaluation."""
+    lines = []
+    for name, m in report["holdout"]["metrics"].items():
+        lines.append(
+            f"{name:<16} {m['value']:.4f}  [{m['ci_low']:.4f}, {m['ci_high']:.4f}]"
+        )
+    return lines
 
 
 def plot_roc_curve(
@@ -18,12 +274,109 @@ def plot_roc_curve(
     X_test: pd.DataFrame,
     y_test: pd.Series,
     output_path: Path | None = None,
-) -> None:
-    RocCurveDisplay.from_estimator(pipeline, X_test, y_test)
-    plt.title("ROC Curve - Credit Risk Model")
+) -> Figure:
+    """Trace la courbe ROC de `pipeline` sur (X_test, y_test).
+
+    Rendu sans interface graphique (`Figure`, sans pyplot ni `show`) : la figure
+    est écrite dans `output_path` si fourni, et retournée.
+    """
+    # Imports locaux : matplotlib n'est chargé que si l'on trace une figure
+    from matplotlib.figure import Figure
+    from sklearn.metrics import RocCurveDisplay
+
+    fig = Figure()
+    ax = fig.subplots()
+    RocCurveDisplay.from_estimator(pipeline, X_test, y_test, ax=ax)
+    ax.set_title("ROC Curve - Credit Risk Model")
 
     if output_path is not None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, bbox_inches="tight")
+        fig.savefig(output_path, bbox_inches="tight")
+    return fig
+
+
+@dataclass(frozen=True)
+class _SortedScores:
+    """Scores triés par p(bad) décroissant, avec les groupes d'ex aequo."""
+
+    p_bad: np.ndarray
+    y_bad: np.ndarray  # float (0 / 1), dans l'ordre trié
+    group_starts: np.ndarray  # début de chaque groupe de scores égaux
+
+    @classmethod
+    def from_scores(cls, scores: HoldoutScores) -> "_SortedScores":
+        order = np.argsort(-scores.p_bad, kind="stable")
+        p_bad = scores.p_bad[order]
+        starts = np.flatnonzero(np.r_[True, p_bad[1:] != p_bad[:-1]])
+        return cls(
+            p_bad=p_bad, y_bad=scores.y_bad[order].astype(float), group_starts=starts
+        )
+
+
+def _bootstrap_block(
+    scores: _SortedScores,
+    size: int,
+    seed: np.random.SeedSequence,
+    threshold: float,
+    top_fraction: float,
+) -> Dict[str, np.ndarray]:
+    """Métriques de `size` rééchantillonnages (poids = nombre de tirages)."""
+    n = len(scores.p_bad)
+    rng = np.random.default_rng(seed)
+    draws = rng.integers(0, n, size=(size, n))
+    draws += (np.arange(size) * n)[:, None]
+    weights = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n)
+    return _weighted_metrics(scores, weights.astype(float), threshold, top_fraction)
+
+
+def _weighted_metrics(
+    scores: _SortedScores,
+    weights: np.ndarray,
+    threshold: float,
+    top_fraction: float,
+) -> Dict[str, np.ndarray]:
+    """Métriques pour chaque ligne de poids (m, n) : un vecteur (m,) par métrique."""
+    y = scores.y_bad
+    pos_w = weights * y
+    neg_w = weights - pos_w
+    total = weights.sum(axis=1)
+    n_pos = pos_w.sum(axis=1)
+    n_neg = total - n_pos
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # AUC et KS par groupes d'ex aequo (scores décroissants)
+        pos_g = np.add.reduceat(pos_w, scores.group_starts, axis=1)
+        neg_g = np.add.reduceat(neg_w, scores.group_starts, axis=1)
+        cum_pos = np.cumsum(pos_g, axis=1)
+        cum_neg = np.cumsum(neg_g, axis=1)
+        # Un "bad" l'emporte sur les "good" moins bien notés, à moitié sur les ex aequo
+        below = n_neg[:, None] - cum_neg + 0.5 * neg_g
+        roc_auc = np.sum(pos_g * below, axis=1) / (n_pos * n_neg)
+        ks = np.max(np.abs(cum_pos / n_pos[:, None] - cum_neg / n_neg[:, None]), axis=1)
+
+        brier = weights @ (scores.p_bad - y) ** 2 / total
+
+        # Lift : taux de "bad" parmi les `top_fraction` dossiers les plus risqués
+        k = top_fraction * total
+        cum_w = np.cumsum(weights, axis=1)
+        cum_bad = np.cumsum(pos_w, axis=1)
+        rows = np.arange(len(weights))
+        last = np.argmax(cum_w >= k[:, None] - 1e-9, axis=1)
+        bad_in_top = cum_bad[rows, last] - (cum_w[rows, last] - k) * y[last]
+        lift = (bad_in_top / k) / (n_pos / total)
 
-    plt.show()
+        predicted = (scores.p_bad >= threshold).astype(float)
+        tp = pos_w @ predicted
+        fp = neg_w @ predicted
+        tn = n_neg - fp
+        metrics = {
+            "roc_auc": roc_auc,
+            "ks": ks,
+            "brier": brier,
+            "lift_top_decile": lift,
+            "accuracy": (tp + tn) / total,
+            "precision": tp / (tp + fp),
+            "recall": tp / n_pos,
+            "specificity": tn / n_neg,
+        }
+    return {name: np.where(np.isfinite(v), v, np.nan) for name, v in metrics.items()}
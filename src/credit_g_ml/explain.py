@@ -0,0 +1,138 @@
+"""Explications exactes par feature pour les modèles linéaires.
+
+Le logit d'une régression logistique est une somme : intercept + coefficient x
+valeur transformée. En regroupant les colonnes one-hot par feature d'origine,
+la contribution de chaque feature est exacte :
+
+- numérique : coef * (x - moyenne) / écart-type (valeur manquante : médiane) ;
+- catégorielle : coefficient de la modalité (0 pour une modalité inconnue).
+
+Valeur de base + somme des contributions = logit de p(bad). Pas
+d'échantillonnage (contrairement à SHAP) : quelques opérations NumPy sur tout
+un lot, à partir des paramètres du scoreur compilé (voir `compiled`).
+
+Les contributions sont orientées vers "bad" : positive = augmente le risque.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from .compiled import CompiledLogisticScorer, compile_pipeline
+from .schemas import ALL_FEATURES
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.pipeline import Pipeline
+
+DEFAULT_TOP_K = 5
+
+# Compilé une fois par pipeline chargé (clé faible : libéré avec le modèle)
+_EXPLAINER_CACHE: "weakref.WeakKeyDictionary[Any, CompiledLogisticScorer]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class FeatureContribution(NamedTuple):
+    # NamedTuple plutôt que dataclass figée : des milliers par lot, création rapide
+    feature: str
+    value: Any
+    contribution: float
+
+
+@dataclass(frozen=True)
+class Explanation:
+    """Contributions (n, n_features) au logit de p(bad), dans l'ordre `features`."""
+
+    features: Tuple[str, ...]
+    base_value: float
+    contributions: np.ndarray
+
+    def logit_bad(self) -> np.ndarray:
+        return self.base_value + self.contributions.sum(axis=1)
+
+    def top_indices(self, k: int) -> np.ndarray:
+        """Indices (n, k) des features de plus forte contribution absolue."""
+        k = min(k, len(self.features))
+        order = np.argsort(-np.abs(self.contributions), axis=1, kind="stable")
+        return order[:, :k]
+
+
+def linear_explainer(
+    model: Pipeline | CompiledLogisticScorer,
+) -> CompiledLogisticScorer:
+    """Scoreur compilé servant aux explications (mis en cache par modèle).
+
+    Lève ValueError si le modèle n'est pas linéaire (ex. gradient boosting).
+    """
+    if isinstance(model, CompiledLogisticScorer):
+        return model
+    explainer = _EXPLAINER_CACHE.get(model)
+    if explainer is None:
+        try:
+            explainer = compile_pipeline(model)
+        except ValueError as e:
+            raise ValueError(
+                f"Explications disponibles pour les modèles linéaires seulement: {e}"
+            ) from e
+        _EXPLAINER_CACHE[model] = explainer
+    return explainer
+
+
+def explain_frame(
+    model: Pipeline | CompiledLogisticScorer, X: pd.DataFrame | Dict[str, Any]
+) -> Explanation:
+    """Contributions par feature pour un DataFrame (ou un mapping de colonnes)."""
+    explainer = linear_explainer(model)
+    classes = tuple(explainer.classes)
+    if set(classes) != {"bad", "good"}:
+        raise ValueError("Les explications exigent les classes 'bad' et 'good'.")
+
+    terms, base = explainer.contributions_arrays(*explainer.to_arrays(X))
+    # Logit calculé pour classes[1] : on le ramène à p(bad)
+    sign = 1.0 if classes[1] == "bad" else -1.0
+    return Explanation(
+        features=explainer.numeric_features + explainer.categorical_features,
+        base_value=sign * base,
+        contributions=sign * terms,
+    )
+
+
+def explain_batch(
+    model: Pipeline | CompiledLogisticScorer,
+    payloads: Sequence[Dict[str, Any]],
+    top_k: int = DEFAULT_TOP_K,
+) -> List[List[FeatureContribution]]:
+    """Top `top_k` des contributions de chaque payload (un seul calcul vectorisé)."""
+    if not payloads:
+        return []
+    for i, payload in enumerate(payloads):
+        missing = [c for c in ALL_FEATURES if c not in payload]
+        if missing:
+            raise ValueError(f"Features manquantes (ligne {i}): {missing}")
+
+    columns = {c: [payload[c] for payload in payloads] for c in ALL_FEATURES}
+    explanation = explain_frame(model, columns)
+    top = explanation.top_indices(top_k)
+    values = np.take_along_axis(explanation.contributions, top, axis=1).tolist()
+
+    features = explanation.features
+    return [
+        [
+            FeatureContribution(features[j], payload[features[j]], contribution)
+            for j, contribution in zip(row, row_values, strict=True)
+        ]
+        for payload, row, row_values in zip(payloads, top.tolist(), values, strict=True)
+    ]
+
+
+def explain_single(
+    model: Pipeline | CompiledLogisticScorer,
+    payload: Dict[str, Any],
+    top_k: int = DEFAULT_TOP_K,
+) -> List[FeatureContribution]:
+    return explain_batch(model, [payload], top_k)[0]
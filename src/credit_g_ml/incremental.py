@@ -0,0 +1,226 @@
+"""Entraînement incrémental (hors mémoire) pour le projet credit_g_ml.
+
+Pour un dataset trop volumineux pour la RAM, le fichier (CSV ou Parquet) est
+lu par blocs, sans jamais être chargé en entier :
+
+1. une première passe collecte les statistiques du préprocessing : moyenne et
+   variance des numériques (`StandardScaler.partial_fit`), médianes estimées
+   sur un échantillon réservoir, vocabulaires et modalités les plus fréquentes
+   des catégorielles, effectifs des classes ;
+2. les passes suivantes (époques) entraînent un `SGDClassifier` (perte
+   logistique) par `partial_fit`, bloc par bloc.
+
+Le résultat est un `Pipeline` de même structure que
+`build_logistic_regression_pipeline` : `load_model`, `predict_single` et
+`compile_pipeline` le servent sans changement. La mémoire reste bornée par la
+taille des blocs (et de l'échantillon réservoir).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from .bulk_scoring import iter_chunks
+from .config import RANDOM_STATE, TARGET_COL
+from .preprocessing import make_preprocessor
+from .schemas import ALL_FEATURES, CATEGORICAL_FEATURES, NUMERIC_FEATURES
+
+
+@dataclass(frozen=True)
+class StreamingStats:
+    n_rows: int
+    class_counts: Dict[str, int]
+    numeric_medians: np.ndarray
+    numeric_mean: np.ndarray  # après imputation par la médiane
+    numeric_var: np.ndarray  # après imputation par la médiane
+    categorical_values: Dict[str, List[str]]
+    categorical_modes: Dict[str, str]
+
+    @property
+    def class_weight(self) -> Dict[str, float]:
+        """Équivalent de class_weight="balanced" (non supporté par partial_fit)."""
+        n_classes = len(self.class_counts)
+        return {
+            c: self.n_rows / (n_classes * count)
+            for c, count in self.class_counts.items()
+        }
+
+
+class _Reservoir:
+    """Échantillon uniforme de taille bornée d'un flux de valeurs (algorithme R)."""
+
+    def __init__(self, size: int, rng: np.random.Generator) -> None:
+        self.size = size
+        self.rng = rng
+        self.values = np.empty(size)
+        self.seen = 0
+
+    def add(self, values: np.ndarray) -> None:
+        n_fill = min(max(self.size - self.seen, 0), len(values))
+        self.values[self.seen : self.seen + n_fill] = values[:n_fill]
+        rest = values[n_fill:]
+        if len(rest):
+            positions = self.seen + n_fill + np.arange(1, len(rest) + 1)
+            keep = self.rng.random(len(rest)) < self.size / positions
+            slots = self.rng.integers(0, self.size, size=int(keep.sum()))
+            self.values[slots] = rest[keep]
+        self.seen += len(values)
+
+    def median(self) -> float:
+        n = min(self.seen, self.size)
+        return float(np.median(self.values[:n])) if n else np.nan
+
+
+def _clean_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    missing = [c for c in ALL_FEATURES + [TARGET_COL] if c not in chunk.columns]
+    if missing:
+        raise ValueError(f"Colonnes manquantes dans le fichier: {missing}")
+    return chunk[chunk[TARGET_COL].notna()]
+
+
+def fit_streaming_stats(
+    input_path: Path,
+    chunk_size: int = 100_000,
+    sample_size: int = 100_000,
+    random_state: int = RANDOM_STATE,
+) -> StreamingStats:
+    """Première passe : statistiques du préprocessing, bloc par bloc.
+
+    Les médianes sont exactes tant que le fichier compte au plus `sample_size`
+    valeurs non manquantes par colonne, estimées sur un échantillon uniforme
+    au-delà. Moyenne et variance sont exactes et tiennent compte de
+    l'imputation par la médiane.
+    """
+    rng = np.random.default_rng(random_state)
+    scaler = StandardScaler()
+    reservoirs = [_Reservoir(sample_size, rng) for _ in NUMERIC_FEATURES]
+    counts = {c: Counter() for c in CATEGORICAL_FEATURES}
+    class_counts: Counter = Counter()
+    n_rows = 0
+
+    for chunk in iter_chunks(input_path, chunk_size):
+        chunk = _clean_chunk(chunk)
+        if chunk.empty:
+            continue
+        n_rows += len(chunk)
+        class_counts.update(chunk[TARGET_COL].astype(str).value_counts().to_dict())
+
+        numeric = chunk[NUMERIC_FEATURES].to_numpy(dtype=float)
+        scaler.partial_fit(numeric)  # NaN ignorés
+        for j, reservoir in enumerate(reservoirs):
+            column = numeric[:, j]
+            reservoir.add(column[~np.isnan(column)])
+        for col in CATEGORICAL_FEATURES:
+            counts[col].update(chunk[col].dropna().astype(str).value_counts().to_dict())
+
+    if n_rows == 0:
+        raise ValueError(f"Aucune ligne exploitable dans {input_path}")
+
+    medians = np.array([r.median() for r in reservoirs])
+    if np.isnan(medians).any():
+        raise ValueError("Colonne numérique sans aucune valeur renseignée.")
+
+    # Moyenne / variance des valeurs observées -> après imputation : les k
+    # valeurs manquantes valent la médiane (décomposition de la variance)
+    n_obs = np.broadcast_to(scaler.n_samples_seen_, medians.shape).astype(float)
+    n_missing = n_rows - n_obs
+    mean = (n_obs * scaler.mean_ + n_missing * medians) / n_rows
+    var = (
+        n_obs * (scaler.var_ + (scaler.mean_ - mean) ** 2)
+        + n_missing * (medians - mean) ** 2
+    ) / n_rows
+
+    return StreamingStats(
+        n_rows=n_rows,
+        class_counts=dict(sorted(class_counts.items())),
+        numeric_medians=medians,
+        numeric_mean=mean,
+        numeric_var=var,
+        categorical_values={c: sorted(counts[c]) for c in CATEGORICAL_FEATURES},
+        categorical_modes={
+            # Ex aequo : la plus petite modalité, comme SimpleImputer
+            c: min(counts[c], key=lambda v, cnt=counts[c]: (-cnt[v], v))
+            for c in CATEGORICAL_FEATURES
+        },
+    )
+
+
+def build_fitted_preprocessor(stats: StreamingStats, prototype: pd.DataFrame):
+    """ColumnTransformer de `make_preprocessor`, ajusté à partir des statistiques.
+
+    Le préprocesseur est d'abord ajusté sur `prototype` (quelques lignes, pour
+    initialiser les objets scikit-learn) puis ses paramètres sont remplacés
+    par ceux calculés sur tout le fichier.
+    """
+    preprocessor = make_preprocessor(categories=stats.categorical_values)
+    # Prototype sans valeurs manquantes : une colonne entièrement vide serait
+    # écartée par SimpleImputer et fausserait la largeur de la sortie
+    prototype = prototype[ALL_FEATURES].copy()
+    for j, col in enumerate(NUMERIC_FEATURES):
+        prototype[col] = prototype[col].astype(float).fillna(stats.numeric_medians[j])
+    for col in CATEGORICAL_FEATURES:
+        values = prototype[col].astype(object)
+        prototype[col] = values.where(values.notna(), stats.categorical_modes[col])
+    preprocessor.fit(prototype)
+
+    numeric = preprocessor.named_transformers_["num"]
+    numeric.named_steps["imputer"].statistics_ = stats.numeric_medians.copy()
+    scaler = numeric.named_steps["scaler"]
+    scaler.mean_ = stats.numeric_mean.copy()
+    scaler.var_ = stats.numeric_var.copy()
+    scale = np.sqrt(stats.numeric_var)
+    scaler.scale_ = np.where(scale < 10 * np.finfo(float).eps, 1.0, scale)
+    scaler.n_samples_seen_ = stats.n_rows
+
+    categorical = preprocessor.named_transformers_["cat"]
+    categorical.named_steps["imputer"].statistics_ = np.array(
+        [stats.categorical_modes[c] for c in CATEGORICAL_FEATURES], dtype=object
+    )
+    return preprocessor
+
+
+def train_incremental(
+    input_path: Path,
+    chunk_size: int = 100_000,
+    n_epochs: int = 5,
+    alpha: float = 1e-4,
+    sample_size: int = 100_000,
+    random_state: int = RANDOM_STATE,
+) -> Pipeline:
+    """Entraîne un pipeline préprocessing + régression logistique (SGD) en streaming.
+
+    Chaque époque relit le fichier bloc par bloc ; les lignes d'un bloc sont
+    mélangées avant `partial_fit`.
+    """
+    stats = fit_streaming_stats(input_path, chunk_size, sample_size, random_state)
+    prototype = next(iter_chunks(input_path, min(chunk_size, 1000)))
+    preprocessor = build_fitted_preprocessor(stats, _clean_chunk(prototype))
+
+    classes = np.array(sorted(stats.class_counts))
+    model = SGDClassifier(
+        loss="log_loss",
+        alpha=alpha,
+        class_weight=stats.class_weight,
+        random_state=random_state,
+    )
+    rng = np.random.default_rng(random_state)
+    for _ in range(n_epochs):
+        for chunk in iter_chunks(input_path, chunk_size):
+            chunk = _clean_chunk(chunk)
+            if chunk.empty:
+                continue
+            chunk = chunk.iloc[rng.permutation(len(chunk))]
+            X = preprocessor.transform(chunk[ALL_FEATURES])
+            y = chunk[TARGET_COL].astype(str).to_numpy()
+            model.partial_fit(X, y, classes=classes)
+
+    return Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
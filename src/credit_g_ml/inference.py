@@ -1,22 +1,35 @@
 """Module d'inférence pour le projet credit_g_ml.
 
-Chargement du modèle et prédiction unitaire.
+Chargement du modèle, prédiction unitaire et prédiction par lot.
+
+Module importé au démarrage du serveur : pandas et scikit-learn y sont importés
+à la demande, pour que l'import reste léger (démarrage à froid).
 """
 
 from __future__ import annotations
 
+import hashlib
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 
 import joblib
-import pandas as pd
-from sklearn.pipeline import Pipeline
+import numpy as np
 
+from .compiled import CompiledLogisticScorer, load_compiled_scorer
 from .config import MODELS_DIR
 from .schemas import ALL_FEATURES
+from .telemetry import is_enabled, stage_timer
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.pipeline import Pipeline
+
+    from .categories import CategoryDictionary
 
 DEFAULT_MODEL_PATH = MODELS_DIR / "logistic_regression_pipeline.joblib"
+DEFAULT_SCORER_PATH = MODELS_DIR / "logistic_regression_scorer.json"
 
 
 @dataclass(frozen=True)
@@ -26,8 +39,43 @@ class PredictionResult:
     probability_good: float
 
 
+@dataclass(frozen=True)
+class ClassIndex:
+    """Position des classes dans la sortie de `predict_proba`."""
+
+    classes: Tuple[str, ...]
+    bad: int | None
+    good: int | None
+
+
+# Résolu une fois par modèle chargé (clé faible : libéré avec le modèle)
+_CLASS_INDEX_CACHE: "weakref.WeakKeyDictionary[Any, ClassIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def resolve_class_index(model: Pipeline | CompiledLogisticScorer) -> ClassIndex:
+    """Retourne (et met en cache) la position des classes 'bad' et 'good'."""
+    index = _CLASS_INDEX_CACHE.get(model)
+    if index is None:
+        classes = tuple(str(c) for c in model.classes_)
+        index = ClassIndex(
+            classes=classes,
+            bad=classes.index("bad") if "bad" in classes else None,
+            good=classes.index("good") if "good" in classes else None,
+        )
+        _CLASS_INDEX_CACHE[model] = index
+    return index
+
+
 def load_model(model_path: Path = DEFAULT_MODEL_PATH) -> Pipeline:
-    """Charge le pipeline scikit-learn sauvegardé (préprocessing + modèle)."""
+    """Charge le pipeline scikit-learn sauvegardé (préprocessing + modèle).
+
+    La position des classes est résolue dès le chargement.
+    """
+    # Import local : scikit-learn n'est chargé qu'avec le premier modèle
+    from sklearn.pipeline import Pipeline
+
     if not model_path.exists():
         raise FileNotFoundError(
             f"Modèle introuvable: {model_path}. "
@@ -36,33 +84,221 @@ def load_model(model_path: Path = DEFAULT_MODEL_PATH) -> Pipeline:
     model = joblib.load(model_path)
     if not isinstance(model, Pipeline):
         raise TypeError("Le modèle chargé n'est pas un Pipeline scikit-learn.")
+    resolve_class_index(model)
     return model
 
 
-def _to_single_row_dataframe(payload: Dict[str, Any]) -> pd.DataFrame:
-    """Convertit un payload dict en DataFrame 1 ligne, dans l'ordre des features."""
+def load_scorer(model_path: Path) -> Pipeline | CompiledLogisticScorer:
+    """Charge un modèle servable selon son extension.
+
+    `.json` : artefact compilé (NumPy seulement, voir `compiled.save_compiled_scorer`) ;
+    sinon : pipeline scikit-learn sauvegardé avec joblib.
+    """
+    if model_path.suffix.lower() == ".json":
+        scorer = load_compiled_scorer(model_path)
+        resolve_class_index(scorer)
+        return scorer
+    return load_model(model_path)
+
+
+def model_fingerprint(model_path: Path) -> str:
+    """Empreinte (hash du contenu) du fichier modèle : identifie sa version."""
+    with open(model_path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    return digest.hexdigest()[:16]
+
+
+def _check_features(payload: Dict[str, Any]) -> None:
     missing = [c for c in ALL_FEATURES if c not in payload]
     if missing:
         raise ValueError(f"Features manquantes: {missing}")
 
+
+def _to_single_row_dataframe(payload: Dict[str, Any]) -> pd.DataFrame:
+    """Convertit un payload dict en DataFrame 1 ligne, dans l'ordre des features."""
+    _check_features(payload)
+
     # On ne garde que les colonnes attendues (ignore champs en trop)
     row = {c: payload[c] for c in ALL_FEATURES}
+    import pandas as pd
+
     return pd.DataFrame([row], columns=ALL_FEATURES)
 
 
-def predict_single(pipeline: Pipeline, payload: Dict[str, Any]) -> PredictionResult:
-    """Prédit sur une observation (dict)."""
-    X = _to_single_row_dataframe(payload)
+def _check_batch_features(payloads: Sequence[Dict[str, Any]]) -> None:
+    for i, payload in enumerate(payloads):
+        missing = [c for c in ALL_FEATURES if c not in payload]
+        if missing:
+            raise ValueError(f"Features manquantes (ligne {i}): {missing}")
+
+
+def _to_dataframe(payloads: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """Convertit une liste de payloads en DataFrame (1 ligne par payload).
+
+    Le DataFrame est construit colonne par colonne, ce qui évite de passer par
+    une liste de dicts (coûteux pour pandas sur de gros lots).
+    """
+    _check_batch_features(payloads)
+    columns = {c: [payload[c] for payload in payloads] for c in ALL_FEATURES}
+    import pandas as pd
+
+    return pd.DataFrame(columns, columns=ALL_FEATURES)
+
+
+def predict_single(
+    pipeline: Pipeline | CompiledLogisticScorer,
+    payload: Dict[str, Any],
+    threshold: float | None = None,
+) -> PredictionResult:
+    """Prédit sur une observation (dict).
+
+    Le modèle n'est appelé qu'une fois : le label est déduit des probabilités.
+    Sans `threshold`, c'est la classe la plus probable (équivalent à `predict`) ;
+    avec `threshold`, le label vaut "bad" dès que p(bad) >= threshold.
+
+    Avec un scoreur compilé (voir `compiled.compile_pipeline`), le payload est
+    scoré directement, sans construire de DataFrame.
+    """
+    index = resolve_class_index(pipeline)
+
+    if isinstance(pipeline, CompiledLogisticScorer):
+        _check_features(payload)
+        with stage_timer("model"):
+            proba = pipeline.predict_proba_one(payload)
+    else:
+        with stage_timer("dataframe"):
+            X = _to_single_row_dataframe(payload)
+        proba = _predict_proba(pipeline, X)[0]  # [p(class0), p(class1)] selon sklearn
+
+    return _to_result(proba.tolist(), index, threshold)
+
+
+def predict_batch(
+    pipeline: Pipeline | CompiledLogisticScorer,
+    payloads: Sequence[Dict[str, Any]],
+    threshold: float | None = None,
+    categories: CategoryDictionary | None = None,
+) -> List[PredictionResult]:
+    """Prédit sur un lot d'observations (liste de dicts).
+
+    Un seul DataFrame est construit et le pipeline n'est appelé qu'une fois ;
+    le label suit la même règle que `predict_single`.
+
+    Avec un scoreur compilé et un dictionnaire `categories`, les catégorielles
+    sont encodées en codes entiers et scorées sans DataFrame.
+    """
+    if not payloads:
+        return []
+
+    index = resolve_class_index(pipeline)
+    proba = None
+    if categories is not None and isinstance(pipeline, CompiledLogisticScorer):
+        proba = _predict_proba_codes(pipeline, payloads, categories)
+    if proba is None:
+        with stage_timer("dataframe"):
+            X = _to_dataframe(payloads)
+        proba = _predict_proba(pipeline, X)
+
+    return [_to_result(row, index, threshold) for row in proba.tolist()]
+
+
+def predict_frame(
+    pipeline: Pipeline | CompiledLogisticScorer,
+    X: pd.DataFrame,
+    threshold: float | None = None,
+) -> pd.DataFrame:
+    """Prédit sur un DataFrame de features (scoring de fichiers).
+
+    Retourne un DataFrame aligné sur X avec les colonnes `label`,
+    `probability_bad` et `probability_good` ; même règle de label que
+    `predict_single`.
+    """
+    index = resolve_class_index(pipeline)
+    missing = [c for c in ALL_FEATURES if c not in X.columns]
+    if missing:
+        raise ValueError(f"Colonnes manquantes: {missing}")
+
+    proba = _predict_proba(pipeline, X[ALL_FEATURES])
+    zeros = np.zeros(len(X))
+    p_bad = proba[:, index.bad] if index.bad is not None else zeros
+    p_good = proba[:, index.good] if index.good is not None else zeros
+
+    if threshold is None:
+        labels = np.asarray(index.classes, dtype=object)[proba.argmax(axis=1)]
+    else:
+        if index.bad is None or index.good is None:
+            raise ValueError("Un seuil explicite exige les classes 'bad' et 'good'.")
+        labels = np.where(p_bad >= threshold, "bad", "good")
+
+    import pandas as pd
+
+    return pd.DataFrame(
+        {"label": labels, "probability_bad": p_bad, "probability_good": p_good},
+        index=X.index,
+    )
+
+
+def _predict_proba_codes(
+    scorer: CompiledLogisticScorer,
+    payloads: Sequence[Dict[str, Any]],
+    categories: CategoryDictionary,
+) -> np.ndarray | None:
+    """Probabilités via les codes catégoriels, ou None s'il manque des valeurs.
+
+    Une valeur catégorielle manquante n'a pas de code (le scoreur l'impute) :
+    le lot repasse alors par le chemin DataFrame. Seules les lignes ayant une
+    modalité hors dictionnaire sont examinées.
+    """
+    _check_batch_features(payloads)
+    with stage_timer("encode"):
+        numeric = np.array(
+            [[p[c] for c in scorer.numeric_features] for p in payloads], dtype=float
+        )
+        encoded = categories.encode_payloads(payloads)
+    rows, cols = np.nonzero(encoded.unknown)
+    for i, j in zip(rows.tolist(), cols.tolist(), strict=True):
+        value = payloads[i][categories.features[j]]
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+    with stage_timer("model"):
+        return scorer.predict_proba_codes(numeric, encoded.codes, categories)
+
+
+def _predict_proba(
+    pipeline: Pipeline | CompiledLogisticScorer, X: pd.DataFrame
+) -> np.ndarray:
+    """`predict_proba` chronométré par étape (préprocessing, puis modèle).
+
+    Les étapes du pipeline sont appliquées une à une, ce qui équivaut à
+    `pipeline.predict_proba(X)` ; instrumentation désactivée, l'appel est direct.
+    """
+    steps = getattr(pipeline, "steps", None)
+    if steps is None or not is_enabled():
+        with stage_timer("model"):
+            return pipeline.predict_proba(X)
+
+    Xt = X
+    with stage_timer("preprocess"):
+        for _, step in steps[:-1]:
+            if step is not None and step != "passthrough":
+                Xt = step.transform(Xt)
+    with stage_timer("model"):
+        return steps[-1][1].predict_proba(Xt)
 
-    proba = pipeline.predict_proba(X)[0]  # [p(class0), p(class1)] selon sklearn
-    classes = list(pipeline.named_steps["model"].classes_)
 
-    # On veut sortir explicitement p(bad) et p(good) même si l'ordre est inversé
-    proba_map = dict(zip(classes, proba, strict=False))
-    p_bad = float(proba_map.get("bad", 0.0))
-    p_good = float(proba_map.get("good", 0.0))
+def _to_result(
+    proba: List[float], index: ClassIndex, threshold: float | None
+) -> PredictionResult:
+    """Construit le résultat à partir d'une ligne de probabilités."""
+    # On sort explicitement p(bad) et p(good) quel que soit l'ordre des classes
+    p_bad = proba[index.bad] if index.bad is not None else 0.0
+    p_good = proba[index.good] if index.good is not None else 0.0
 
-    # Décision label selon predict (seuil du modèle)
-    label = str(pipeline.predict(X)[0])
+    if threshold is None:
+        label = index.classes[max(range(len(proba)), key=proba.__getitem__)]
+    else:
+        if index.bad is None or index.good is None:
+            raise ValueError("Un seuil explicite exige les classes 'bad' et 'good'.")
+        label = "bad" if p_bad >= threshold else "good"
 
     return PredictionResult(label=label, probability_bad=p_bad, probability_good=p_good)
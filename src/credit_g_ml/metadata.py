@@ -1,22 +1,181 @@
-"""Métadonnées du dataset credit-g (valeurs catégorielles autorisées)."""
+"""Métadonnées du dataset credit-g (valeurs catégorielles autorisées).
+
+Les vocabulaires sont calculés à l'entraînement et sauvegardés dans un petit
+fichier JSON à côté du modèle (`<modèle>.metadata.json`). Le serveur les lit
+une seule fois, sans avoir besoin de `data/raw`, et les relit si le modèle ou
+le fichier de métadonnées change.
+
+Le même fichier porte le dictionnaire des codes catégoriels
+(`categories.CategoryDictionary` : version et modalités de repli).
+"""
 
 from __future__ import annotations
 
-from typing import Dict, List
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from .data_loading import load_local_credit_g
+from .categories import CategoryDictionary
+from .compiled import CompiledLogisticScorer
 from .schemas import CATEGORICAL_FEATURES
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def get_categorical_values() -> Dict[str, List[str]]:
-    """Retourne les valeurs uniques par feature catégorielle.
+METADATA_FORMAT_VERSION = 1
+
+_cache_lock = threading.Lock()
+_cache: Dict[Path, Tuple[Tuple[int | None, int | None], Dict[str, List[str]]]] = {}
 
-    Utilisé pour alimenter les listes déroulantes de l'UI.
-    """
-    df = load_local_credit_g()
 
+def compute_categorical_values(df: pd.DataFrame) -> Dict[str, List[str]]:
+    """Retourne les valeurs uniques (triées) par feature catégorielle de df."""
     values: Dict[str, List[str]] = {}
     for col in CATEGORICAL_FEATURES:
         values[col] = sorted(df[col].dropna().unique().tolist())
 
     return values
+
+
+def get_categorical_values() -> Dict[str, List[str]]:
+    """Retourne les valeurs uniques par feature catégorielle du dataset local.
+
+    Relit les colonnes catégorielles du dataset : à réserver à l'entraînement.
+    Côté serveur, utiliser `load_categorical_values`.
+    """
+    from .data_loading import load_local_credit_g
+
+    return compute_categorical_values(load_local_credit_g(columns=CATEGORICAL_FEATURES))
+
+
+def metadata_path_for(model_path: Path) -> Path:
+    """Chemin du fichier de métadonnées associé à un modèle."""
+    return model_path.with_suffix(".metadata.json")
+
+
+def save_categorical_values(
+    values: Dict[str, List[str]],
+    model_path: Path,
+    dictionary: CategoryDictionary | None = None,
+) -> Path:
+    """Écrit les vocabulaires catégoriels à côté du modèle. Retourne le chemin.
+
+    Le fichier porte aussi la version du dictionnaire des codes construit sur
+    `values`, et ses modalités de repli (celles de `dictionary` s'il est fourni).
+    """
+    path = metadata_path_for(model_path)
+    other = (
+        dict(zip(dictionary.features, dictionary.other, strict=True))
+        if dictionary is not None
+        else None
+    )
+    saved = CategoryDictionary.from_values(values, other)
+    content = {
+        "format_version": METADATA_FORMAT_VERSION,
+        "categorical_values": values,
+        "category_dictionary": {
+            "version": saved.version,
+            "other": dict(zip(saved.features, saved.other, strict=True)),
+        },
+    }
+    path.write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def categorical_values_from_pipeline(pipeline: Any) -> Dict[str, List[str]]:
+    """Reconstruit les vocabulaires depuis l'encodeur d'un pipeline entraîné.
+
+    Solution de repli quand le fichier de métadonnées est absent.
+    """
+    if isinstance(pipeline, CompiledLogisticScorer):
+        return {
+            col: sorted(str(v) for v in table)
+            for col, table in zip(
+                pipeline.categorical_features, pipeline.category_weights, strict=True
+            )
+        }
+
+    try:
+        preprocessor = pipeline.named_steps["preprocessor"]
+        cat_pipe = preprocessor.named_transformers_["cat"]
+        encoder = cat_pipe.named_steps["encoder"]
+        cat_cols = next(
+            cols for name, _, cols in preprocessor.transformers_ if name == "cat"
+        )
+    except (AttributeError, KeyError, StopIteration) as e:
+        raise ValueError(f"Vocabulaires introuvables dans le pipeline: {e}") from e
+
+    # Un encodeur ajusté sur des valeurs manquantes les range dans ses modalités
+    return {
+        col: [str(v) for v in categories if not _is_missing(v)]
+        for col, categories in zip(cat_cols, encoder.categories_, strict=True)
+    }
+
+
+def load_categorical_values(
+    model_path: Path, pipeline: Any | None = None
+) -> Dict[str, List[str]]:
+    """Retourne les vocabulaires catégoriels associés au modèle `model_path`.
+
+    Lecture du fichier de métadonnées (ou, à défaut, du `pipeline` fourni),
+    mise en cache tant que le modèle et ses métadonnées ne changent pas.
+    """
+    sidecar = metadata_path_for(model_path)
+    stamp = (_mtime_ns(model_path), _mtime_ns(sidecar))
+
+    with _cache_lock:
+        cached = _cache.get(model_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    if stamp[1] is not None:
+        content = json.loads(sidecar.read_text(encoding="utf-8"))
+        values = content["categorical_values"]
+    elif pipeline is not None:
+        values = categorical_values_from_pipeline(pipeline)
+    else:
+        raise FileNotFoundError(
+            f"Métadonnées introuvables: {sidecar}. "
+            "Relance scripts/train_model.py pour les générer."
+        )
+
+    with _cache_lock:
+        _cache[model_path] = (stamp, values)
+    return values
+
+
+def load_category_dictionary(
+    model_path: Path, pipeline: Any | None = None
+) -> CategoryDictionary:
+    """Dictionnaire des codes catégoriels associé au modèle `model_path`.
+
+    Construit sur les vocabulaires de `load_categorical_values` ; les modalités
+    de repli sont lues dans le fichier de métadonnées quand il les contient.
+    Lève ValueError si la version enregistrée ne correspond plus aux
+    vocabulaires (fichier modifié à la main).
+    """
+    values = load_categorical_values(model_path, pipeline=pipeline)
+    saved: Dict[str, Any] = {}
+    sidecar = metadata_path_for(model_path)
+    if sidecar.exists():
+        content = json.loads(sidecar.read_text(encoding="utf-8"))
+        saved = content.get("category_dictionary", {})
+    dictionary = CategoryDictionary.from_values(values, saved.get("other"))
+    if saved.get("version", dictionary.version) != dictionary.version:
+        raise ValueError(
+            f"Dictionnaire catégoriel incohérent dans {sidecar}: version "
+            f"{saved['version']} enregistrée, {dictionary.version} recalculée"
+        )
+    return dictionary
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
 
 from .config import RANDOM_STATE, TARGET_COL
 from .schemas import ALL_FEATURES, CATEGORICAL_FEATURES, NUMERIC_FEATURES
@@ -29,11 +30,16 @@ def split_features_target(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
     return X, y
 
 
-def make_preprocessor() -> ColumnTransformer:
+def make_preprocessor(
+    categories: Dict[str, List] | None = None,
+) -> ColumnTransformer:
     """Construit le ColumnTransformer pour le préprocessing.
 
     - Numériques: imputation médiane + standardisation
     - Catégorielles: imputation valeur la plus fréquente + OneHotEncoder
+
+    `categories` fixe les modalités de chaque feature catégorielle (sinon elles
+    sont apprises au fit), par exemple quand elles sont collectées en streaming.
     """
     numeric_transformer = Pipeline(
         steps=[
@@ -47,7 +53,14 @@ def make_preprocessor() -> ColumnTransformer:
             ("imputer", SimpleImputer(strategy="most_frequent")),
             (
                 "encoder",
-                OneHotEncoder(handle_unknown="ignore"),
+                OneHotEncoder(
+                    categories=(
+                        [categories[c] for c in CATEGORICAL_FEATURES]
+                        if categories is not None
+                        else "auto"
+                    ),
+                    handle_unknown="ignore",
+                ),
             ),
         ]
     )
@@ -62,6 +75,43 @@ def make_preprocessor() -> ColumnTransformer:
     return preprocessor
 
 
+def make_tree_preprocessor() -> ColumnTransformer:
+    """Préprocessing minimal pour les modèles à base d'arbres (gradient boosting).
+
+    - Numériques: inchangées (les valeurs manquantes sont gérées par le modèle)
+    - Catégorielles: OrdinalEncoder, une colonne par feature (pas d'expansion
+      one-hot) ; modalités inconnues et manquantes codées NaN
+
+    Les catégorielles sont placées après les numériques : leurs indices sont
+    donnés par `tree_categorical_indices()`.
+    """
+    categorical_transformer = Pipeline(
+        steps=[
+            (
+                "encoder",
+                OrdinalEncoder(
+                    handle_unknown="use_encoded_value",
+                    unknown_value=np.nan,
+                    encoded_missing_value=np.nan,
+                ),
+            ),
+        ]
+    )
+
+    return ColumnTransformer(
+        transformers=[
+            ("num", "passthrough", NUMERIC_FEATURES),
+            ("cat", categorical_transformer, CATEGORICAL_FEATURES),
+        ]
+    )
+
+
+def tree_categorical_indices() -> List[int]:
+    """Indices des colonnes catégorielles en sortie de `make_tree_preprocessor`."""
+    n_num = len(NUMERIC_FEATURES)
+    return list(range(n_num, n_num + len(CATEGORICAL_FEATURES)))
+
+
 def train_test_split_credit_g(
     df: pd.DataFrame,
     test_size: float = 0.2,
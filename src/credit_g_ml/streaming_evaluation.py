@@ -0,0 +1,275 @@
+"""Évaluation en flux de fichiers scorés plus gros que la mémoire.
+
+Les paires (p(bad), issue observée) sont consommées par blocs et réduites à
+des histogrammes fins des scores par classe (`n_bins` intervalles de même
+largeur sur [0, 1]) : la mémoire ne dépend que de `n_bins`, pas du nombre de
+lignes, et deux évaluateurs se fusionnent (`merge`) pour paralléliser sur
+plusieurs fichiers.
+
+Toutes les métriques sont déduites des histogrammes :
+
+- ROC / AUC : deux scores d'un même intervalle sont traités comme ex aequo.
+  Seules les paires ("bad", "good") d'un même intervalle peuvent différer de
+  l'AUC exacte, d'au plus 1/2 chacune : l'erreur est bornée par
+  `sum_b bad_b * good_b / (2 * n_bad * n_good)` (`auc_error_bound`), calculée
+  sur les histogrammes eux-mêmes ;
+- KS : évalué aux bornes des intervalles ; à l'intérieur d'un intervalle,
+  l'écart des répartitions ne peut dépasser celui des bornes que de
+  `min(bad_b / n_bad, good_b / n_good)` (`ks_error_bound`) ;
+- calibration : score moyen (exact, par somme des scores) et taux de "bad"
+  observé par intervalle agrégé ;
+- Brier : exact (somme des erreurs au carré accumulée par bloc).
+
+Les graphiques sont rendus sans interface (`matplotlib.figure.Figure`, sans
+pyplot) directement dans des fichiers.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .bulk_scoring import iter_chunks
+from .config import TARGET_COL
+
+REPORT_FORMAT_VERSION = 1
+DEFAULT_N_BINS = 10_000
+DEFAULT_CALIBRATION_BINS = 10
+# Points de la courbe ROC conservés dans le rapport JSON
+ROC_REPORT_POINTS = 201
+
+
+class StreamingEvaluator:
+    """Histogrammes des scores par classe, alimentés bloc par bloc."""
+
+    def __init__(self, n_bins: int = DEFAULT_N_BINS) -> None:
+        if n_bins < 2:
+            raise ValueError("n_bins doit être >= 2")
+        self.n_bins = n_bins
+        self.bad = np.zeros(n_bins, dtype=np.int64)
+        self.good = np.zeros(n_bins, dtype=np.int64)
+        self.score_sum = np.zeros(n_bins)
+        self.squared_error = 0.0
+        self.n_skipped = 0
+
+    @property
+    def n_bad(self) -> int:
+        return int(self.bad.sum())
+
+    @property
+    def n_good(self) -> int:
+        return int(self.good.sum())
+
+    @property
+    def n_rows(self) -> int:
+        return self.n_bad + self.n_good
+
+    def update(self, p_bad: Any, y_bad: Any) -> None:
+        """Ajoute un bloc : p(bad) dans [0, 1] et issues (True si "bad").
+
+        Les lignes dont le score ou l'issue manque sont ignorées et comptées
+        (`n_skipped`) ; un score hors de [0, 1] lève ValueError.
+        """
+        p_bad = np.asarray(p_bad, dtype=float)
+        y = pd.array(y_bad, dtype="boolean")
+        keep = ~np.isnan(p_bad) & ~np.asarray(y.isna())
+        self.n_skipped += int(len(p_bad) - keep.sum())
+        p_bad = p_bad[keep]
+        y = np.asarray(y[keep], dtype=bool)
+        if len(p_bad) and (p_bad.min() < 0 or p_bad.max() > 1):
+            raise ValueError("Scores attendus dans [0, 1]")
+
+        bins = np.minimum((p_bad * self.n_bins).astype(np.int64), self.n_bins - 1)
+        self.bad += np.bincount(bins[y], minlength=self.n_bins)
+        self.good += np.bincount(bins[~y], minlength=self.n_bins)
+        self.score_sum += np.bincount(bins, weights=p_bad, minlength=self.n_bins)
+        self.squared_error += float(np.sum((p_bad - y) ** 2))
+
+    def merge(self, other: "StreamingEvaluator") -> "StreamingEvaluator":
+        """Ajoute les comptes de `other` (même `n_bins`). Retourne self."""
+        if other.n_bins != self.n_bins:
+            raise ValueError("Évaluateurs de résolutions différentes")
+        self.bad += other.bad
+        self.good += other.good
+        self.score_sum += other.score_sum
+        self.squared_error += other.squared_error
+        self.n_skipped += other.n_skipped
+        return self
+
+    def roc_curve(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(fpr, tpr, seuils) aux bornes des intervalles, seuils décroissants.
+
+        Un dossier est prédit "bad" si son score est >= au seuil.
+        """
+        self._check_both_classes()
+        tpr = np.r_[0.0, np.cumsum(self.bad[::-1]) / self.n_bad]
+        fpr = np.r_[0.0, np.cumsum(self.good[::-1]) / self.n_good]
+        thresholds = np.r_[np.inf, np.arange(self.n_bins - 1, -1, -1) / self.n_bins]
+        return fpr, tpr, thresholds
+
+    def roc_auc(self) -> float:
+        """AUC (trapèzes sur la courbe des histogrammes) ; voir `auc_error_bound`."""
+        fpr, tpr, _ = self.roc_curve()
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    def auc_error_bound(self) -> float:
+        """Écart maximal entre `roc_auc` et l'AUC exacte des scores bruts."""
+        self._check_both_classes()
+        ties = np.dot(self.bad.astype(float), self.good.astype(float))
+        return float(ties / (2 * self.n_bad * self.n_good))
+
+    def ks(self) -> Tuple[float, float]:
+        """(statistique KS, seuil où elle est atteinte) ; voir `ks_error_bound`."""
+        fpr, tpr, thresholds = self.roc_curve()
+        gaps = np.abs(tpr - fpr)
+        best = int(np.argmax(gaps))
+        return float(gaps[best]), float(thresholds[best])
+
+    def ks_error_bound(self) -> float:
+        """Écart maximal entre `ks()[0]` et le KS exact des scores bruts."""
+        self._check_both_classes()
+        return float(np.max(np.minimum(self.bad / self.n_bad, self.good / self.n_good)))
+
+    def brier(self) -> float:
+        return self.squared_error / self.n_rows if self.n_rows else float("nan")
+
+    def calibration_curve(
+        self, n_bins: int = DEFAULT_CALIBRATION_BINS
+    ) -> List[Dict[str, float]]:
+        """Score moyen et taux de "bad" observé par intervalle de largeur 1/n_bins.
+
+        Les intervalles vides sont omis.
+        """
+        groups = np.arange(self.n_bins) * n_bins // self.n_bins
+        bad = np.bincount(groups, weights=self.bad, minlength=n_bins)
+        count = bad + np.bincount(groups, weights=self.good, minlength=n_bins)
+        score_sum = np.bincount(groups, weights=self.score_sum, minlength=n_bins)
+        return [
+            {
+                "bin_low": i / n_bins,
+                "bin_high": (i + 1) / n_bins,
+                "n_rows": int(count[i]),
+                "mean_predicted": float(score_sum[i] / count[i]),
+                "observed_rate": float(bad[i] / count[i]),
+            }
+            for i in range(n_bins)
+            if count[i]
+        ]
+
+    def report(
+        self, calibration_bins: int = DEFAULT_CALIBRATION_BINS
+    ) -> Dict[str, Any]:
+        """Rapport JSON : métriques, bornes d'erreur, calibration et ROC réduite."""
+        ks, ks_threshold = self.ks()
+        fpr, tpr, thresholds = self.roc_curve()
+        # Courbe ROC réduite pour le rapport (les histogrammes restent exacts)
+        keep = np.unique(
+            np.linspace(0, len(fpr) - 1, ROC_REPORT_POINTS).round().astype(int)
+        )
+        return {
+            "format_version": REPORT_FORMAT_VERSION,
+            "n_rows": self.n_rows,
+            "n_bad": self.n_bad,
+            "n_skipped": self.n_skipped,
+            "n_bins": self.n_bins,
+            "roc_auc": self.roc_auc(),
+            "roc_auc_error_bound": self.auc_error_bound(),
+            "ks": ks,
+            "ks_threshold": ks_threshold,
+            "ks_error_bound": self.ks_error_bound(),
+            "brier": self.brier(),
+            "calibration": self.calibration_curve(calibration_bins),
+            "roc_curve": {
+                "fpr": fpr[keep].tolist(),
+                "tpr": tpr[keep].tolist(),
+                # Premier seuil infini : rien n'est prédit "bad"
+                "thresholds": [None, *thresholds[keep][1:].tolist()],
+            },
+        }
+
+    def _check_both_classes(self) -> None:
+        if self.n_bad == 0 or self.n_good == 0:
+            raise ValueError("Les deux classes doivent être présentes")
+
+
+def outcome_to_bad(values: pd.Series, positive_label: str = "bad") -> pd.Series:
+    """Issue observée -> booléen "bad" (manquant conservé).
+
+    Colonne numérique ou booléenne : 1 / True = "bad" ; sinon, comparaison
+    texte avec `positive_label`.
+    """
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values.astype("Float64").eq(1)
+    return values.astype("string").eq(positive_label)
+
+
+def evaluate_scored_files(
+    paths: Iterable[Path],
+    score_column: str = "probability_bad",
+    outcome_column: str = TARGET_COL,
+    positive_label: str = "bad",
+    chunk_size: int = 500_000,
+    n_bins: int = DEFAULT_N_BINS,
+) -> StreamingEvaluator:
+    """Évalue des fichiers CSV / Parquet scorés, lus par blocs (2 colonnes)."""
+    evaluator = StreamingEvaluator(n_bins=n_bins)
+    columns = [score_column, outcome_column]
+    for path in paths:
+        for chunk in iter_chunks(path, chunk_size, columns=columns):
+            evaluator.update(
+                chunk[score_column].to_numpy(dtype=float, na_value=np.nan),
+                outcome_to_bad(chunk[outcome_column], positive_label),
+            )
+    return evaluator
+
+
+def plot_evaluation(
+    report: Dict[str, Any], output_dir: Path, prefix: str = "streaming"
+) -> List[Path]:
+    """Trace la courbe ROC et la calibration d'un rapport dans des PNG.
+
+    Rendu sans interface graphique (pas de pyplot) : utilisable en batch.
+    Retourne les chemins écrits.
+    """
+    from matplotlib.figure import Figure
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+
+    fig = Figure(figsize=(5, 5))
+    ax = fig.subplots()
+    roc = report["roc_curve"]
+    ax.plot(roc["fpr"], roc["tpr"], label=f"AUC = {report['roc_auc']:.4f}")
+    ax.plot([0, 1], [0, 1], linestyle="--", color="grey")
+    ax.set(xlabel="Taux de faux positifs", ylabel="Taux de vrais positifs")
+    ax.set_title(f"ROC ({report['n_rows']:,} lignes)")
+    ax.legend(loc="lower right")
+    paths.append(output_dir / f"{prefix}_roc_curve.png")
+    fig.savefig(paths[-1], bbox_inches="tight")
+
+    fig = Figure(figsize=(5, 5))
+    ax = fig.subplots()
+    calibration = report["calibration"]
+    ax.plot(
+        [c["mean_predicted"] for c in calibration],
+        [c["observed_rate"] for c in calibration],
+        marker="o",
+        label=f"Brier = {report['brier']:.4f}",
+    )
+    ax.plot([0, 1], [0, 1], linestyle="--", color="grey")
+    ax.set(xlabel="p(bad) moyen prédit", ylabel="Taux de bad observé")
+    ax.set_title("Calibration")
+    ax.legend(loc="upper left")
+    paths.append(output_dir / f"{prefix}_calibration.png")
+    fig.savefig(paths[-1], bbox_inches="tight")
+    return paths
+
+
+def write_streaming_report(report: Dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
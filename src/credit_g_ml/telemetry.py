@@ -0,0 +1,257 @@
+"""Instrumentation légère (histogrammes, compteurs, jauges) au format Prometheus.
+
+Les chronomètres `stage_timer(stage)` entourent chaque étape du chemin de
+prédiction (parsing JSON, validation, construction du DataFrame,
+préprocessing, modèle). Désactivés (`METRICS_ENABLED=0` ou `set_enabled(False)`),
+ils renvoient un contexte vide partagé : le coût se limite à un appel de
+fonction.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Bornes (en secondes) adaptées à des étapes de la µs à la seconde
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+_enabled = os.getenv("METRICS_ENABLED", "1") == "1"
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...], extra: str = "") -> str:
+        parts = [
+            f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key, strict=True)
+        ]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._labels(k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Par série : [compteurs par bucket (+Inf inclus), somme, total]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, (list(s[0]), s[1], s[2])) for k, s in self._series.items()]
+        lines = []
+        for key, (counts, total, n) in items:
+            cumulative = 0
+            for bound, count in zip(
+                self.buckets + (float("inf"),), counts, strict=True
+            ):
+                cumulative += count
+                le = 'le="' + _fmt(bound) + '"'
+                lines.append(f"{self.name}_bucket{self._labels(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_fmt(total)}")
+            lines.append(f"{self.name}_count{self._labels(key)} {n}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self, extra_lines: Iterable[str] = ()) -> str:
+        """Exposition au format texte Prometheus (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        lines.extend(extra_lines)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "credit_risk_stage_duration_seconds",
+    "Durée de chaque étape du chemin de prédiction.",
+    labelnames=("stage",),
+)
+
+# Micro-batching (`credit_g_ml.batching`) : taille des lots et attente en file
+MICRO_BATCH_SIZE_BUCKETS: Tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+MICRO_BATCH_SIZE = REGISTRY.histogram(
+    "credit_risk_micro_batch_size",
+    "Taille des lots scorés par le micro-batcher.",
+    buckets=MICRO_BATCH_SIZE_BUCKETS,
+)
+MICRO_BATCH_QUEUE_DELAY = REGISTRY.histogram(
+    "credit_risk_micro_batch_queue_delay_seconds",
+    "Attente en file de chaque prédiction avant le scoring de son lot.",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+
+class _StageTimer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+
+    def __enter__(self) -> "_StageTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        STAGE_DURATION.observe(time.perf_counter() - self.start, stage=self.stage)
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopTimer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NOOP = _NoopTimer()
+
+
+def stage_timer(stage: str):
+    """Chronomètre une étape (contexte vide si l'instrumentation est désactivée)."""
+    return _StageTimer(stage) if _enabled else _NOOP
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_value(name: str, help_text: str, value: float, kind: str = "gauge") -> list:
+    """Lignes d'exposition d'une valeur calculée à la demande (stats existantes)."""
+    return [
+        f"# HELP {name} {help_text}",
+        f"# TYPE {name} {kind}",
+        f"{name} {_fmt(value)}",
+    ]
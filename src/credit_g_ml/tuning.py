@@ -0,0 +1,120 @@
+"""Recherche d'hyperparamètres pour le projet credit_g_ml.
+
+Validation croisée stratifiée sur une grille (force de régularisation,
+pénalité, solveur). Candidats et folds sont évalués en parallèle sur tous les
+cœurs (`n_jobs=-1`), et le préprocessing ajusté est mis en cache par fold
+(`Pipeline(memory=...)`) : il n'est calculé qu'une fois par fold, quel que soit
+le nombre de candidats.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import joblib
+import pandas as pd
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+
+from .config import RANDOM_STATE
+from .modeling import build_logistic_regression_pipeline
+
+# l1_ratio : 0 = L2, 1 = L1, 0.5 = elastic-net (solveurs compatibles uniquement)
+C_VALUES = [0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0]
+DEFAULT_PARAM_GRID: List[Dict[str, list]] = [
+    {"C": C_VALUES, "l1_ratio": [0.0], "solver": ["lbfgs", "liblinear"]},
+    {"C": C_VALUES, "l1_ratio": [1.0], "solver": ["liblinear", "saga"]},
+    {"C": C_VALUES, "l1_ratio": [0.5], "solver": ["saga"]},
+]
+
+_MODEL_PREFIX = "model__"
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    best_params: Dict[str, Any]  # arguments de build_logistic_regression_pipeline
+    best_score: float
+    leaderboard: pd.DataFrame
+    wall_time_s: float
+
+
+def search_logistic_regression(
+    X: pd.DataFrame,
+    y: pd.Series,
+    param_grid: List[Dict[str, list]] | None = None,
+    cv: int = 5,
+    scoring: str = "roc_auc",
+    n_jobs: int | None = -1,
+    cache_dir: Path | None = None,
+) -> SearchResult:
+    """Évalue chaque configuration de `param_grid` en validation croisée.
+
+    Retourne les meilleurs paramètres (à passer à
+    `build_logistic_regression_pipeline`) et le classement complet. Le modèle
+    final n'est pas réajusté ici : c'est au script d'entraînement de le faire.
+    """
+    grid = [
+        {_MODEL_PREFIX + key: values for key, values in candidate.items()}
+        for candidate in (param_grid or DEFAULT_PARAM_GRID)
+    ]
+
+    tmp_dir = None
+    if cache_dir is None:
+        tmp_dir = cache_dir = Path(tempfile.mkdtemp(prefix="credit_g_search_"))
+    try:
+        pipeline = build_logistic_regression_pipeline(
+            memory=joblib.Memory(cache_dir, verbose=0)
+        )
+        search = GridSearchCV(
+            pipeline,
+            grid,
+            scoring=scoring,
+            cv=StratifiedKFold(n_splits=cv, shuffle=True, random_state=RANDOM_STATE),
+            n_jobs=n_jobs,
+            refit=False,
+        )
+        start = time.perf_counter()
+        search.fit(X, y)
+        wall_time_s = time.perf_counter() - start
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return SearchResult(
+        best_params={
+            key.removeprefix(_MODEL_PREFIX): value
+            for key, value in search.best_params_.items()
+        },
+        best_score=float(search.best_score_),
+        leaderboard=_leaderboard(search.cv_results_),
+        wall_time_s=wall_time_s,
+    )
+
+
+def _leaderboard(cv_results: Dict[str, Any]) -> pd.DataFrame:
+    results = pd.DataFrame(cv_results)
+    params = pd.DataFrame(list(results["params"])).rename(
+        columns=lambda c: c.removeprefix(_MODEL_PREFIX)
+    )
+    columns = [
+        "rank_test_score",
+        "mean_test_score",
+        "std_test_score",
+        "mean_fit_time",
+        "std_fit_time",
+        "mean_score_time",
+    ]
+    leaderboard = pd.concat([results[columns], params], axis=1)
+    return leaderboard.sort_values(
+        ["rank_test_score", "mean_fit_time"], ignore_index=True
+    )
+
+
+def write_leaderboard(leaderboard: pd.DataFrame, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    leaderboard.to_csv(path, index=False)
+    return path
@@ -0,0 +1,120 @@
+"""Fixtures partagées : données synthétiques au format credit-g et pipeline entraîné."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from credit_g_ml.config import RANDOM_STATE, TARGET_COL
+from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.preprocessing import split_features_target
+
+# Vocabulaires réels du dataset credit-g (OpenML)
+CREDIT_G_CATEGORIES = {
+    "checking_status": ["<0", "0<=X<200", ">=200", "no checking"],
+    "credit_history": [
+        "no credits/all paid",
+        "all paid",
+        "existing paid",
+        "delayed previously",
+        "critical/other existing credit",
+    ],
+    "purpose": [
+        "new car",
+        "used car",
+        "furniture/equipment",
+        "radio/tv",
+        "domestic appliance",
+        "repairs",
+        "education",
+        "vacation",
+        "retraining",
+        "business",
+        "other",
+    ],
+    "savings_status": [
+        "<100",
+        "100<=X<500",
+        "500<=X<1000",
+        ">=1000",
+        "no known savings",
+    ],
+    "employment": ["unemployed", "<1", "1<=X<4", "4<=X<7", ">=7"],
+    "personal_status": [
+        "male div/sep",
+        "female div/dep/mar",
+        "male single",
+        "male mar/wid",
+    ],
+    "other_parties": ["none", "co applicant", "guarantor"],
+    "property_magnitude": [
+        "real estate",
+        "life insurance",
+        "car",
+        "no known property",
+    ],
+    "other_payment_plans": ["bank", "stores", "none"],
+    "housing": ["rent", "own", "for free"],
+    "job": [
+        "unemp/unskilled non res",
+        "unskilled resident",
+        "skilled",
+        "high qualif/self emp/mgmt",
+    ],
+    "own_telephone": ["none", "yes"],
+    "foreign_worker": ["yes", "no"],
+}
+
+
+def make_synthetic_credit_g(
+    n_rows: int = 400, seed: int = RANDOM_STATE
+) -> pd.DataFrame:
+    """Génère un DataFrame synthétique avec la structure de credit-g."""
+    rng = np.random.default_rng(seed)
+    data = {
+        "duration": rng.integers(4, 72, n_rows),
+        "credit_amount": rng.uniform(250, 18000, n_rows).round(0),
+        "installment_commitment": rng.integers(1, 5, n_rows),
+        "residence_since": rng.integers(1, 5, n_rows),
+        "age": rng.integers(19, 75, n_rows),
+        "existing_credits": rng.integers(1, 5, n_rows),
+        "num_dependents": rng.integers(1, 3, n_rows),
+    }
+    for col, values in CREDIT_G_CATEGORIES.items():
+        data[col] = rng.choice(values, n_rows)
+
+    df = pd.DataFrame(data)
+
+    # Cible corrélée à quelques features pour que le modèle apprenne un signal
+    logit = (
+        0.04 * (df["duration"] - 24)
+        + 0.8 * (df["checking_status"] == "<0")
+        - 0.8 * (df["checking_status"] == "no checking")
+        - 0.02 * (df["age"] - 35)
+    )
+    p_bad = 1.0 / (1.0 + np.exp(-(logit - 0.8)))
+    df[TARGET_COL] = np.where(rng.uniform(size=n_rows) < p_bad, "bad", "good")
+    return df
+
+
+@pytest.fixture(scope="session")
+def synthetic_df() -> pd.DataFrame:
+    return make_synthetic_credit_g()
+
+
+@pytest.fixture(scope="session")
+def fitted_pipeline(synthetic_df):
+    X, y = split_features_target(synthetic_df)
+    pipeline = build_logistic_regression_pipeline()
+    pipeline.fit(X, y)
+    return pipeline
+
+
+@pytest.fixture()
+def valid_payload(synthetic_df) -> dict:
+    X, _ = split_features_target(synthetic_df)
+    # Passage par JSON pour obtenir des types Python natifs (comme une requête HTTP)
+    return json.loads(X.iloc[[0]].to_json(orient="records"))[0]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import joblib
 import pytest
 
 # Ajoute src/ et api/ au path pour importer app
@@ -10,7 +11,20 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(PROJECT_ROOT / "src"))
 sys.path.append(str(PROJECT_ROOT))
 
+import api.app as app_module  # noqa: E402
 from api.app import app  # noqa: E402
+from api.model_store import ModelStore  # noqa: E402
+from credit_g_ml.batching import (  # noqa: E402
+    BatcherOverloadedError,
+    MicroBatcher,
+)
+from credit_g_ml.drift import (  # noqa: E402
+    build_reference_profile,
+    save_reference_profile,
+)
+from credit_g_ml.inference import predict_batch  # noqa: E402
+from credit_g_ml.modeling import build_logistic_regression_pipeline  # noqa: E402
+from credit_g_ml.preprocessing import split_features_target  # noqa: E402
 
 
 @pytest.fixture()
@@ -20,6 +34,19 @@ def client():
         yield c
 
 
+@pytest.fixture()
+def loaded_pipeline(monkeypatch, tmp_path, fitted_pipeline):
+    model_path = tmp_path / "model.joblib"
+    store = ModelStore(model_path)
+    store.install(fitted_pipeline, version="test-model")
+    monkeypatch.setattr(app_module, "MODEL_PATH", model_path)
+    monkeypatch.setattr(app_module, "model_store", store)
+    monkeypatch.setattr(app_module, "_categories_state", None)
+    monkeypatch.setattr(app_module, "_pages_state", None)
+    app_module.prediction_cache.clear()
+    return fitted_pipeline
+
+
 def test_health(client):
     resp = client.get("/health")
     assert resp.status_code == 200
@@ -31,3 +58,287 @@ def test_predict_validation_error(client):
     assert resp.status_code == 422
     body = resp.get_json()
     assert body["error"] == "validation_error"
+
+
+def test_predict_batch(client, loaded_pipeline, valid_payload):
+    invalid = dict(valid_payload, age=12)
+    resp = client.post("/predict/batch", json=[valid_payload, invalid, valid_payload])
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["n_rows"] == 3
+    assert [r["index"] for r in body["results"]] == [0, 2]
+    assert body["results"][0]["risk_level"] in {"low", "medium", "high"}
+    assert [e["index"] for e in body["errors"]] == [1]
+    assert body["errors"][0]["details"][0]["loc"] == ["age"]
+
+
+def test_predict_batch_non_object_row(client, loaded_pipeline, valid_payload):
+    body = client.post("/predict/batch", json=[valid_payload, 42]).get_json()
+    assert [r["index"] for r in body["results"]] == [0]
+    (error,) = body["errors"][0]["details"]
+    assert error["loc"] == [] and error["input"] == 42
+
+
+def test_predict_batch_requires_list(client):
+    resp = client.post("/predict/batch", json={"foo": "bar"})
+    assert resp.status_code == 400
+
+
+def test_home_does_not_read_raw_data(client, loaded_pipeline, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("data/raw ne doit pas être lu par le serveur")
+
+    monkeypatch.setattr("credit_g_ml.data_loading.load_local_credit_g", fail)
+    resp = client.get("/")
+    assert resp.status_code == 200
+    assert b"no checking" in resp.data
+
+
+def test_predict_repeat_served_from_cache(client, loaded_pipeline, valid_payload):
+    first = client.post("/predict", json=valid_payload).get_json()
+    hits_before = app_module.prediction_cache.stats()["hits"]
+
+    reordered = dict(reversed(list(valid_payload.items())))
+    second = client.post("/predict", json=reordered).get_json()
+
+    assert second == first
+    assert app_module.prediction_cache.stats()["hits"] == hits_before + 1
+    assert client.get("/cache/stats").get_json()["model_version"] == "test-model"
+
+
+def test_predict_with_micro_batching(
+    client, loaded_pipeline, valid_payload, monkeypatch
+):
+    batcher = MicroBatcher(
+        lambda payloads: predict_batch(loaded_pipeline, payloads), max_wait_ms=1
+    )
+    monkeypatch.setattr(app_module, "micro_batcher", batcher)
+
+    resp = client.post("/predict", json=valid_payload)
+
+    assert resp.status_code == 200
+    assert client.get("/batching/stats").get_json()["items"] == 1
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'credit_risk_micro_batch_size_bucket{le="1"}' in text
+    assert "credit_risk_micro_batch_queue_delay_seconds_count" in text
+
+    def overloaded(payload, timeout=None):
+        raise BatcherOverloadedError("file pleine")
+
+    monkeypatch.setattr(batcher, "predict", overloaded)
+    resp = client.post("/predict", json=dict(valid_payload, duration=7))
+    assert resp.status_code == 503
+    assert resp.get_json()["error"] == "overloaded"
+    batcher.stop()
+
+
+def test_eager_startup_builds_model_state(
+    loaded_pipeline, synthetic_df, tmp_path, monkeypatch
+):
+    model_path = tmp_path / "eager.joblib"
+    joblib.dump(loaded_pipeline, model_path)
+    X, _ = split_features_target(synthetic_df)
+    save_reference_profile(build_reference_profile(X), model_path)
+    monkeypatch.setattr(app_module, "MODEL_PATH", model_path)
+    monkeypatch.setattr(app_module, "model_store", ModelStore(model_path))
+    monkeypatch.setattr(app_module, "EAGER_MODEL_LOAD", True)
+    monkeypatch.setattr(app_module, "MODEL_WATCH_INTERVAL", 0)
+    monkeypatch.setattr(app_module, "_drift_state", None)
+
+    app_module._startup()
+
+    # Construits avant le fork des workers, pas à leur première requête
+    version = app_module.model_store.current().version
+    assert app_module._categories_state[0] == version
+    assert app_module._categories_state[1] is not None
+    assert app_module._drift_state[0] == version
+    assert app_module._drift_state[1] is not None
+
+
+def test_ready_requires_loaded_model(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module, "model_store", ModelStore(tmp_path / "none.joblib"))
+    assert client.get("/health").status_code == 200
+    assert client.get("/ready").status_code == 503
+
+
+def test_admin_reload_swaps_model(client, loaded_pipeline, valid_payload, tmp_path):
+    joblib.dump(loaded_pipeline, tmp_path / "model.joblib")
+
+    resp = client.post("/admin/reload")
+
+    assert resp.status_code == 200
+    new_version = resp.get_json()["model_version"]
+    assert new_version != "test-model"
+    ready = client.get("/ready").get_json()
+    assert ready["status"] == "ready"
+    assert ready["model_version"] == new_version
+    assert client.post("/predict", json=valid_payload).status_code == 200
+
+
+def test_metrics_endpoint(client, loaded_pipeline, valid_payload):
+    client.post("/predict", json=valid_payload)
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    text = resp.get_data(as_text=True)
+    assert 'credit_risk_stage_duration_seconds_count{stage="validation"}' in text
+    assert 'credit_risk_stage_duration_seconds_count{stage="model"}' in text
+    assert (
+        'credit_risk_http_requests_total{endpoint="/predict",method="POST",status="200"}'
+        in text
+    )
+    assert 'credit_risk_http_requests_in_flight{endpoint="/predict"} 0' in text
+    assert "credit_risk_prediction_cache_misses_total" in text
+
+
+def test_portfolio_thresholds_from_rows(client, loaded_pipeline, valid_payload):
+    rows = [valid_payload, dict(valid_payload, duration=60, credit_amount=15000)]
+    resp = client.post(
+        "/portfolio/thresholds",
+        json={"rows": rows, "labels": ["good", "bad"], "grid_size": 11},
+    )
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["n_rows"] == 2 and body["observed"] is True
+    assert len(body["curve"]) == 11
+    assert sum(body["risk_levels"].values()) == 2
+    assert 0.0 <= body["optimal"]["approval_rate"] <= 1.0
+
+    invalid = dict(valid_payload, age=12)
+    resp = client.post("/portfolio/thresholds", json={"rows": [*rows, invalid, 7]})
+    assert resp.status_code == 422
+    errors = resp.get_json()["errors"]
+    assert [e["index"] for e in errors] == [2, 3]
+    assert errors[0]["details"][0]["loc"] == ["age"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"scores": "nope"},
+        {"scores": [0.2, 1.5]},
+        {"scores": [0.2, 0.7], "labels": ["good", "Bad"]},
+        {"scores": [0.2, 0.7], "labels": ["good", 1]},
+        {"scores": [0.2, 0.7], "labels": "gb"},
+    ],
+)
+def test_portfolio_thresholds_invalid_input(client, body):
+    resp = client.post("/portfolio/thresholds", json=body)
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == "invalid_portfolio"
+
+
+def test_predict_with_explanation(client, loaded_pipeline, valid_payload):
+    plain = client.post("/predict", json=valid_payload).get_json()
+    assert "explanation" not in plain
+
+    resp = client.post("/predict?explain=true&top_k=3", json=valid_payload)
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["probability_bad"] == plain["probability_bad"]
+    assert len(body["explanation"]) == 3
+    first = body["explanation"][0]
+    assert first["value"] == valid_payload[first["feature"]]
+
+    resp = client.post("/predict?explain=maybe", json=valid_payload)
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == "invalid_explain"
+
+
+def test_predict_batch_with_explanation(client, loaded_pipeline, valid_payload):
+    invalid = dict(valid_payload, age=12)
+    resp = client.post(
+        "/predict/batch?explain=1&top_k=2", json=[valid_payload, invalid]
+    )
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert [len(r["explanation"]) for r in body["results"]] == [2]
+
+
+@pytest.mark.parametrize("policy", ["count", "other", "reject"])
+def test_drift_endpoint(
+    client, loaded_pipeline, valid_payload, synthetic_df, monkeypatch, policy
+):
+    monkeypatch.setattr(app_module, "CATEGORY_UNKNOWN_POLICY", policy)
+    monkeypatch.setattr(app_module, "_drift_state", None)
+    assert client.get("/drift").status_code == 404
+
+    X, _ = split_features_target(synthetic_df)
+    save_reference_profile(build_reference_profile(X), app_module.MODEL_PATH)
+    monkeypatch.setattr(app_module, "_drift_state", None)
+
+    # Mesurée sur la valeur reçue (API et UI), même remplacée ou refusée
+    client.post("/predict", json=dict(valid_payload, purpose="crypto"))
+    client.post("/predict/batch", json=[dict(valid_payload, purpose="crypto")])
+    form = dict(valid_payload, purpose="crypto", threshold="0.5")
+    client.post("/ui/predict", data={k: str(v) for k, v in form.items()})
+    body = client.get("/drift?refresh=1").get_json()
+    assert body["n_observed"] == 3
+    assert body["features"]["purpose"]["unseen_rate"] == 1.0
+
+
+def test_unknown_category_policies(client, loaded_pipeline, valid_payload, monkeypatch):
+    unknown = dict(valid_payload, purpose="car (new)")
+
+    counter = app_module.UNKNOWN_CATEGORIES
+    before = counter.value(feature="purpose")
+    assert client.post("/predict", json=unknown).status_code == 200
+    assert counter.value(feature="purpose") == before + 1
+
+    form = {k: str(v) for k, v in unknown.items()}
+    assert client.post("/ui/predict", data=form).status_code == 200
+    assert counter.value(feature="purpose") == before + 2
+
+    monkeypatch.setattr(app_module, "CATEGORY_UNKNOWN_POLICY", "reject")
+    resp = client.post("/ui/predict", data=form)
+    assert resp.status_code == 422
+    assert "literal_error" in resp.get_data(as_text=True)
+    resp = client.post("/predict", json=unknown)
+    assert resp.status_code == 422
+    (error,) = resp.get_json()["details"]
+    assert error["type"] == "literal_error" and error["loc"] == ["purpose"]
+
+    body = client.post("/predict/batch", json=[unknown, valid_payload]).get_json()
+    assert [r["index"] for r in body["results"]] == [1]
+    assert [e["index"] for e in body["errors"]] == [0]
+
+    monkeypatch.setattr(app_module, "CATEGORY_UNKNOWN_POLICY", "other")
+    other = client.post("/predict", json=unknown).get_json()
+    expected = client.post("/predict", json=dict(valid_payload, purpose="other"))
+    assert other == expected.get_json()
+
+
+def test_demo_profiles_use_dataset_vocabulary():
+    from conftest import CREDIT_G_CATEGORIES
+
+    for profile in app_module.DEMO_PROFILES.values():
+        for feature, values in CREDIT_G_CATEGORIES.items():
+            assert profile[feature] in values, (feature, profile[feature])
+
+
+def test_demo_pages_cached_per_model_version(
+    client, loaded_pipeline, synthetic_df, monkeypatch
+):
+    calls = []
+    score = app_module._score
+    monkeypatch.setattr(app_module, "_score", lambda p: calls.append(p) or score(p))
+
+    first = client.get("/demo/high")
+    assert first.status_code == 200 and first.headers["ETag"]
+    assert client.get("/demo/high").data == first.data
+    assert len(calls) == 1
+
+    # Le client renvoie l'ETag : 304 sans corps
+    resp = client.get("/demo/high", headers={"If-None-Match": first.headers["ETag"]})
+    assert resp.status_code == 304 and resp.data == b""
+    assert client.get("/").headers["ETag"] != first.headers["ETag"]
+
+    # Nouveau modèle : page recalculée, nouvel ETag
+    X, y = split_features_target(synthetic_df.iloc[:200])
+    app_module.model_store.install(
+        build_logistic_regression_pipeline(C=0.01).fit(X, y), version="other-model"
+    )
+    resp = client.get("/demo/high", headers={"If-None-Match": first.headers["ETag"]})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != first.headers["ETag"]
+    assert len(calls) == 2
@@ -0,0 +1,97 @@
+"""Tests pour le module batching (micro-batching des prédictions)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from credit_g_ml.batching import BatcherOverloadedError, MicroBatcher
+from credit_g_ml.inference import predict_batch, predict_single
+from credit_g_ml.telemetry import MICRO_BATCH_QUEUE_DELAY, MICRO_BATCH_SIZE
+
+
+def test_concurrent_calls_are_coalesced() -> None:
+    batch_sizes = []
+    release = threading.Event()
+
+    def score_batch(items):
+        release.wait(1.0)
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    sizes_before = MICRO_BATCH_SIZE.count()
+    delays_before = MICRO_BATCH_QUEUE_DELAY.count()
+    batcher = MicroBatcher(score_batch, max_batch_size=8, max_wait_ms=50)
+    futures = [batcher.submit(i) for i in range(20)]
+    release.set()
+
+    assert [f.result(timeout=5) for f in futures] == [i * 2 for i in range(20)]
+    assert sum(batch_sizes) == 20
+    assert max(batch_sizes) <= 8
+    assert len(batch_sizes) < 20
+
+    stats = batcher.stats()
+    assert stats["items"] == 20
+    assert stats["batches"] == len(batch_sizes)
+    assert sum(stats["batch_size_histogram"].values()) == len(batch_sizes)
+    # Mêmes distributions exposées à Prometheus
+    assert MICRO_BATCH_SIZE.count() - sizes_before == len(batch_sizes)
+    assert MICRO_BATCH_QUEUE_DELAY.count() - delays_before == 20
+    batcher.stop()
+
+
+def test_errors_are_propagated_to_callers() -> None:
+    def score_batch(items):
+        raise ValueError("boom")
+
+    batcher = MicroBatcher(score_batch, max_wait_ms=1)
+    with pytest.raises(ValueError, match="boom"):
+        batcher.predict(1, timeout=5)
+    assert batcher.stats()["errors"] == 1
+    batcher.stop()
+
+
+def test_full_queue_sheds_load() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def score_batch(items):
+        started.set()
+        release.wait(5.0)
+        return items
+
+    batcher = MicroBatcher(
+        score_batch, max_batch_size=1, max_queue_size=2, enqueue_timeout_ms=20
+    )
+    futures = [batcher.submit(0)]
+    assert started.wait(5.0)  # répartiteur bloqué dans score_batch
+    futures += [batcher.submit(1), batcher.submit(2)]
+
+    before = time.perf_counter()
+    with pytest.raises(BatcherOverloadedError):
+        batcher.submit(3)
+    assert time.perf_counter() - before >= 0.015
+    assert batcher.stats()["rejected"] == 1
+
+    release.set()
+    assert [f.result(timeout=5) for f in futures] == [0, 1, 2]
+    batcher.stop()
+
+
+def test_matches_predict_single(synthetic_df, fitted_pipeline) -> None:
+    payloads = synthetic_df.drop(columns="class").head(30).to_dict(orient="records")
+    batcher = MicroBatcher(
+        lambda items: predict_batch(fitted_pipeline, items), max_wait_ms=5
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda p: batcher.predict(p, timeout=5), payloads))
+
+    for payload, result in zip(payloads, results, strict=True):
+        expected = predict_single(fitted_pipeline, payload)
+        assert result.label == expected.label
+        assert result.probability_bad == pytest.approx(expected.probability_bad)
+    batcher.stop()
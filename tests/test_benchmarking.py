@@ -0,0 +1,50 @@
+"""Tests pour le module benchmarking (mesures et détection de régressions)."""
+
+from __future__ import annotations
+
+from credit_g_ml.benchmarking import (
+    build_report,
+    compare_to_baseline,
+    load_report,
+    measure,
+    write_report,
+)
+
+
+def test_measure_reports_percentiles_and_throughput() -> None:
+    result = measure("sum", lambda: sum(range(1000)), n_calls=50, rows_per_call=10)
+
+    assert result.n_calls == 50
+    assert 0 < result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert result.rows_per_s > 0
+    assert result.peak_mem_mb >= 0
+
+
+def test_report_roundtrip(tmp_path) -> None:
+    report = build_report([measure("noop", lambda: None, n_calls=5)])
+    path = write_report(report, tmp_path / "bench.json")
+    assert load_report(path)["results"]["noop"]["n_calls"] == 5
+
+
+def _report(p50: float, p95: float, rows_per_s: float) -> dict:
+    return {
+        "results": {
+            "predict_single": {"p50_ms": p50, "p95_ms": p95, "rows_per_s": rows_per_s}
+        }
+    }
+
+
+def test_compare_to_baseline() -> None:
+    baseline = _report(p50=1.0, p95=2.0, rows_per_s=1000)
+
+    assert compare_to_baseline(_report(1.1, 2.2, 950), baseline, tolerance=0.2) == []
+
+    regressions = compare_to_baseline(_report(1.5, 2.0, 700), baseline, tolerance=0.2)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("predict_single.p50_ms")
+    assert regressions[1].startswith("predict_single.rows_per_s")
+
+
+def test_compare_ignores_unknown_benchmarks() -> None:
+    baseline = _report(p50=1.0, p95=2.0, rows_per_s=1000)
+    assert compare_to_baseline({"results": {}}, baseline) == []
@@ -0,0 +1,212 @@
+"""Tests pour le module bulk_scoring (scoring de fichiers par blocs)."""
+
+from __future__ import annotations
+
+import copy
+import tracemalloc
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+import credit_g_ml.bulk_scoring as bulk_scoring
+from credit_g_ml.bulk_scoring import iter_chunks, read_checkpoint, score_file
+from credit_g_ml.inference import predict_frame
+
+
+@pytest.fixture()
+def scoring_inputs(tmp_path, synthetic_df, fitted_pipeline):
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(fitted_pipeline, model_path)
+    input_path = tmp_path / "input.csv"
+    synthetic_df.to_csv(input_path, index=False)
+    return input_path, model_path
+
+
+def _expected(fitted_pipeline, input_path) -> pd.DataFrame:
+    df = pd.read_csv(input_path)
+    return predict_frame(fitted_pipeline, df)
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_score_file_matches_predict_frame(
+    tmp_path, scoring_inputs, fitted_pipeline, n_workers
+) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+
+    summary = score_file(
+        input_path, output_path, model_path, chunk_size=64, n_workers=n_workers
+    )
+
+    scored = pd.read_csv(output_path)
+    expected = _expected(fitted_pipeline, input_path)
+    assert summary.rows_total == len(expected)
+    assert scored["row_id"].tolist() == list(range(len(expected)))
+    assert scored["label"].tolist() == expected["label"].tolist()
+    np.testing.assert_allclose(scored["probability_bad"], expected["probability_bad"])
+    assert read_checkpoint(output_path).completed
+
+
+def test_score_file_resumes_after_failure(
+    tmp_path, scoring_inputs, fitted_pipeline, monkeypatch
+) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+    original = bulk_scoring._score_chunk
+    calls = []
+
+    def failing_score_chunk(chunk, first_row, id_column):
+        calls.append(first_row)
+        if len(calls) == 3:
+            raise RuntimeError("panne simulée")
+        return original(chunk, first_row, id_column)
+
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", failing_score_chunk)
+    with pytest.raises(RuntimeError):
+        score_file(input_path, output_path, model_path, chunk_size=64, n_workers=1)
+    assert read_checkpoint(output_path).rows_done == 128
+
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", original)
+    summary = score_file(
+        input_path, output_path, model_path, chunk_size=64, n_workers=1
+    )
+
+    assert summary.resumed_from == 128
+    scored = pd.read_csv(output_path)
+    expected = _expected(fitted_pipeline, input_path)
+    assert scored["row_id"].tolist() == list(range(len(expected)))
+    np.testing.assert_allclose(scored["probability_bad"], expected["probability_bad"])
+
+
+@pytest.mark.parametrize("damage", ["delete", "shorten"])
+def test_resume_restarts_when_output_is_damaged(
+    tmp_path, scoring_inputs, fitted_pipeline, monkeypatch, damage
+) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+    original = bulk_scoring._score_chunk
+
+    def failing_score_chunk(chunk, first_row, id_column):
+        if first_row >= 128:
+            raise RuntimeError("panne simulée")
+        return original(chunk, first_row, id_column)
+
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", failing_score_chunk)
+    with pytest.raises(RuntimeError):
+        score_file(input_path, output_path, model_path, chunk_size=64, n_workers=1)
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", original)
+
+    if damage == "delete":
+        output_path.unlink()
+    else:
+        content = output_path.read_bytes()
+        output_path.write_bytes(content[: len(content) // 2])
+    summary = score_file(
+        input_path, output_path, model_path, chunk_size=64, n_workers=1
+    )
+
+    assert summary.resumed_from == 0
+    assert b"\0" not in output_path.read_bytes()
+    scored = pd.read_csv(output_path)
+    expected = _expected(fitted_pipeline, input_path)
+    assert scored["row_id"].tolist() == list(range(len(expected)))
+    np.testing.assert_allclose(scored["probability_bad"], expected["probability_bad"])
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [{"threshold": 0.3}, {"explain_top_k": 1}, {"id_column": "purpose"}],
+)
+def test_resume_refuses_changed_scoring_settings(
+    tmp_path, scoring_inputs, monkeypatch, changed
+) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+    original = bulk_scoring._score_chunk
+
+    def failing_score_chunk(chunk, first_row, id_column):
+        if first_row >= 64:
+            raise RuntimeError("panne simulée")
+        return original(chunk, first_row, id_column)
+
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", failing_score_chunk)
+    with pytest.raises(RuntimeError):
+        score_file(input_path, output_path, model_path, chunk_size=64, n_workers=1)
+    monkeypatch.setattr(bulk_scoring, "_score_chunk", original)
+
+    with pytest.raises(ValueError, match="Paramètres de scoring modifiés"):
+        score_file(
+            input_path, output_path, model_path, chunk_size=64, n_workers=1, **changed
+        )
+
+
+def test_resume_refuses_changed_model(
+    tmp_path, scoring_inputs, fitted_pipeline
+) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+    score_file(input_path, output_path, model_path, chunk_size=64, n_workers=1)
+
+    retrained = copy.deepcopy(fitted_pipeline)
+    retrained[-1].intercept_ = retrained[-1].intercept_ + 1.0
+    joblib.dump(retrained, model_path)
+    with pytest.raises(ValueError, match="produit par le modèle"):
+        score_file(input_path, output_path, model_path, chunk_size=64, n_workers=1)
+
+
+def test_score_parquet_with_id_column(tmp_path, scoring_inputs, synthetic_df) -> None:
+    pytest.importorskip("pyarrow")
+    _, model_path = scoring_inputs
+    df = synthetic_df.assign(
+        application_id=[f"app-{i}" for i in range(len(synthetic_df))]
+    )
+    input_path = tmp_path / "input.parquet"
+    df.to_parquet(input_path, row_group_size=50)
+    output_path = tmp_path / "scores.csv"
+
+    score_file(
+        input_path,
+        output_path,
+        model_path,
+        chunk_size=64,
+        n_workers=1,
+        id_column="application_id",
+    )
+
+    scored = pd.read_csv(output_path)
+    assert scored["application_id"].tolist() == df["application_id"].tolist()
+
+
+def test_score_file_with_reasons(tmp_path, scoring_inputs) -> None:
+    input_path, model_path = scoring_inputs
+    output_path = tmp_path / "scores.csv"
+
+    score_file(
+        input_path, output_path, model_path, chunk_size=64, n_workers=1, explain_top_k=2
+    )
+
+    scored = pd.read_csv(output_path)
+    assert {"reason_1", "reason_1_contribution", "reason_2"} <= set(scored.columns)
+    assert (
+        scored["reason_1_contribution"].abs() >= scored["reason_2_contribution"].abs()
+    ).all()
+
+
+def test_csv_resume_from_large_offset_keeps_memory_flat(tmp_path) -> None:
+    input_path = tmp_path / "big.csv"
+    n = 200_000
+    pd.DataFrame({"row": np.arange(n), "value": 0.5}).to_csv(input_path, index=False)
+
+    tracemalloc.start()
+    try:
+        chunks = list(iter_chunks(input_path, 1_000, skip_rows=n - 1_500))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert [len(c) for c in chunks] == [1_000, 500]
+    assert chunks[0]["row"].iloc[0] == n - 1_500
+    # Avec un ensemble des 198 500 indices sautés, le pic dépassait 17 Mo
+    assert peak < 3_000_000
@@ -0,0 +1,75 @@
+"""Tests pour le module caching (cache LRU/TTL des prédictions)."""
+
+from __future__ import annotations
+
+from credit_g_ml.caching import PredictionCache, canonical_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_canonical_key_ignores_key_order() -> None:
+    assert canonical_key({"a": 1, "b": "x"}, "v1") == canonical_key(
+        {"b": "x", "a": 1}, "v1"
+    )
+    assert canonical_key({"a": 1}, "v1") != canonical_key({"a": 1}, "v2")
+
+
+def test_hits_and_misses() -> None:
+    cache: PredictionCache[str] = PredictionCache(maxsize=10)
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return "result"
+
+    assert cache.get_or_compute("v1", {"a": 1}, compute) == "result"
+    assert cache.get_or_compute("v1", {"a": 1}, compute) == "result"
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction() -> None:
+    cache: PredictionCache[int] = PredictionCache(maxsize=2)
+    cache.put("v1", {"a": 1}, 1)
+    cache.put("v1", {"a": 2}, 2)
+    cache.get("v1", {"a": 1})  # {"a": 1} devient le plus récent
+    cache.put("v1", {"a": 3}, 3)
+
+    assert cache.get("v1", {"a": 2}) is None
+    assert cache.get("v1", {"a": 1}) == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry() -> None:
+    clock = FakeClock()
+    cache: PredictionCache[int] = PredictionCache(ttl_seconds=10, clock=clock)
+    cache.put("v1", {"a": 1}, 1)
+
+    clock.now = 9.0
+    assert cache.get("v1", {"a": 1}) == 1
+    clock.now = 11.0
+    assert cache.get("v1", {"a": 1}) is None
+
+
+def test_invalidated_when_model_changes() -> None:
+    cache: PredictionCache[int] = PredictionCache()
+    cache.put("v1", {"a": 1}, 1)
+
+    assert cache.get("v2", {"a": 1}) is None
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["model_version"] == "v2"
+
+
+def test_disabled_cache() -> None:
+    cache: PredictionCache[int] = PredictionCache(maxsize=0)
+    cache.put("v1", {"a": 1}, 1)
+    assert cache.get("v1", {"a": 1}) is None
@@ -0,0 +1,116 @@
+"""Tests pour le module categories (dictionnaire des codes catégoriels)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from conftest import CREDIT_G_CATEGORIES
+
+from credit_g_ml.categories import (
+    CategoryDictionary,
+    UnknownCategoryError,
+    build_category_dictionary,
+)
+from credit_g_ml.compiled import compile_pipeline
+from credit_g_ml.inference import predict_batch
+from credit_g_ml.metadata import (
+    compute_categorical_values,
+    load_category_dictionary,
+    save_categorical_values,
+)
+from credit_g_ml.preprocessing import split_features_target
+from credit_g_ml.schemas import CATEGORICAL_FEATURES
+
+
+def test_build_and_encode_roundtrip(synthetic_df) -> None:
+    dictionary = build_category_dictionary(synthetic_df)
+    assert dictionary.features == tuple(CATEGORICAL_FEATURES)
+    # "other" existe pour purpose ; sinon repli sur la modalité la plus fréquente
+    assert dictionary.other[dictionary.features.index("purpose")] == "other"
+    housing = synthetic_df["housing"].value_counts()
+    assert dictionary.other[dictionary.features.index("housing")] == housing.idxmax()
+
+    columns = {c: synthetic_df[c].tolist() for c in CATEGORICAL_FEATURES}
+    encoded = dictionary.encode(columns)
+    assert encoded.codes.dtype == np.int16
+    assert encoded.codes.shape == (len(synthetic_df), len(CATEGORICAL_FEATURES))
+    assert not encoded.unknown.any()
+    assert dictionary.decode(encoded.codes) == columns
+
+
+def test_unknown_policies(synthetic_df) -> None:
+    dictionary = build_category_dictionary(synthetic_df)
+    j = dictionary.features.index("purpose")
+    columns = {c: [CREDIT_G_CATEGORIES[c][0]] * 3 for c in CATEGORICAL_FEATURES}
+    columns["purpose"] = ["new car", "car (new)", "crypto"]
+
+    counted = dictionary.encode(columns, policy="count")
+    assert counted.unknown[:, j].tolist() == [False, True, True]
+    assert counted.codes[1, j] == len(dictionary.values[j])
+    assert counted.unknown_counts(dictionary.features) == {"purpose": 2}
+
+    other = dictionary.encode(columns, policy="other")
+    assert other.codes[2, j] == dictionary.codes_for("purpose")["other"]
+
+    with pytest.raises(UnknownCategoryError) as excinfo:
+        dictionary.encode(columns, policy="reject")
+    assert excinfo.value.unknown == [
+        (1, "purpose", "car (new)"),
+        (2, "purpose", "crypto"),
+    ]
+
+    payload = {c: values[1] for c, values in columns.items()}
+    assert dictionary.find_unknown(payload) == [("purpose", "car (new)")]
+    payloads = [{c: values[i] for c, values in columns.items()} for i in range(3)]
+    assert dictionary.find_unknown_rows(payloads) == excinfo.value.unknown
+    with pytest.raises(ValueError):
+        dictionary.encode(columns, policy="ignore")
+
+
+def test_build_rejects_empty_column(synthetic_df) -> None:
+    df = synthetic_df.assign(purpose=None)
+    with pytest.raises(ValueError, match="purpose"):
+        build_category_dictionary(df)
+
+
+def test_version_depends_on_vocabulary() -> None:
+    a = CategoryDictionary.from_values({"housing": ["rent", "own"]})
+    b = CategoryDictionary.from_values({"housing": ["own", "rent"]})
+    c = CategoryDictionary.from_values({"housing": ["own", "rent", "for free"]})
+    assert a.version == b.version != c.version
+    with pytest.raises(ValueError):
+        CategoryDictionary.from_values({"housing": ["own"]}, {"housing": "rent"})
+
+
+def test_sidecar_stores_dictionary(tmp_path, synthetic_df) -> None:
+    model_path = tmp_path / "model.joblib"
+    model_path.write_bytes(b"model")
+    dictionary = build_category_dictionary(synthetic_df)
+    save_categorical_values(
+        compute_categorical_values(synthetic_df), model_path, dictionary=dictionary
+    )
+
+    loaded = load_category_dictionary(model_path)
+    assert loaded.version == dictionary.version
+    assert loaded.other == dictionary.other
+
+
+def test_compiled_scoring_from_codes(synthetic_df, fitted_pipeline) -> None:
+    scorer = compile_pipeline(fitted_pipeline)
+    dictionary = build_category_dictionary(synthetic_df)
+    X, _ = split_features_target(synthetic_df)
+    payloads = X.head(50).to_dict(orient="records")
+    payloads[0] = dict(payloads[0], purpose="crypto")
+
+    expected = predict_batch(scorer, payloads)
+    actual = predict_batch(scorer, payloads, categories=dictionary)
+    np.testing.assert_allclose(
+        [r.probability_bad for r in actual],
+        [r.probability_bad for r in expected],
+        atol=1e-12,
+    )
+
+    # Valeur manquante : pas de code, repli sur le chemin DataFrame (imputation)
+    payloads[1] = dict(payloads[1], housing=None)
+    with_missing = predict_batch(scorer, payloads, categories=dictionary)
+    assert with_missing[1] == predict_batch(scorer, payloads)[1]
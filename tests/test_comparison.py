@@ -0,0 +1,68 @@
+"""Tests pour la comparaison de familles de modèles."""
+
+import json
+
+import pytest
+
+from credit_g_ml.comparison import (
+    ModelComparison,
+    build_comparison_report,
+    compare_model,
+    select_model,
+    write_comparison_report,
+)
+from credit_g_ml.modeling import build_hist_gradient_boosting_pipeline
+from credit_g_ml.preprocessing import train_test_split_credit_g
+
+
+def _result(name: str, roc_auc: float, p95: float) -> ModelComparison:
+    return ModelComparison(
+        name=name,
+        roc_auc=roc_auc,
+        train_time_s=1.0,
+        single_p50_ms=p95 / 2,
+        single_p95_ms=p95,
+        batch_rows_per_s=1000.0,
+        artifact_bytes=1024,
+    )
+
+
+def test_compare_model_measures_accuracy_and_cost(synthetic_df) -> None:
+    X_train, X_test, y_train, y_test = train_test_split_credit_g(synthetic_df)
+    result = compare_model(
+        "hgb",
+        build_hist_gradient_boosting_pipeline(max_iter=10),
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        n_calls=5,
+        batch_size=50,
+    )
+    assert 0.0 <= result.roc_auc <= 1.0
+    assert result.train_time_s > 0
+    assert result.single_p95_ms >= result.single_p50_ms > 0
+    assert result.batch_rows_per_s > 0
+    assert result.artifact_bytes > 0
+
+
+def test_select_model_respects_latency_budget() -> None:
+    fast = _result("logistic_regression", roc_auc=0.78, p95=1.0)
+    slow = _result("hist_gradient_boosting", roc_auc=0.80, p95=8.0)
+
+    assert select_model([fast, slow]).name == "hist_gradient_boosting"
+    assert select_model([fast, slow], max_p95_ms=5.0).name == "logistic_regression"
+    # Aucun candidat dans le budget : le plus rapide
+    assert select_model([fast, slow], max_p95_ms=0.1).name == "logistic_regression"
+    with pytest.raises(ValueError):
+        select_model([])
+
+
+def test_write_comparison_report(tmp_path) -> None:
+    results = [_result("a", 0.7, 1.0), _result("b", 0.8, 2.0)]
+    report = build_comparison_report(results, results[1], metadata={"n_rows": 10})
+    path = write_comparison_report(report, tmp_path / "out" / "comparison.json")
+
+    content = json.loads(path.read_text(encoding="utf-8"))
+    assert content["recommended"] == "b"
+    assert content["models"]["a"]["roc_auc"] == 0.7
@@ -0,0 +1,100 @@
+"""Tests pour le module compiled : parité stricte avec le pipeline scikit-learn."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from credit_g_ml.compiled import (
+    compile_pipeline,
+    export_pipeline,
+    load_compiled_scorer,
+    save_compiled_scorer,
+    verify_compiled_scorer,
+)
+from credit_g_ml.inference import load_scorer, predict_single
+from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.preprocessing import split_features_target
+from credit_g_ml.schemas import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+
+ATOL = 1e-9
+
+
+def _perturbed_features(synthetic_df, seed: int = 0):
+    """Features avec valeurs numériques manquantes et modalités inconnues."""
+    rng = np.random.default_rng(seed)
+    X, _ = split_features_target(synthetic_df)
+    X = X.copy()
+    X["credit_amount"] = X["credit_amount"].astype(float)
+    X.loc[rng.uniform(size=len(X)) < 0.1, "credit_amount"] = np.nan
+    X.loc[rng.uniform(size=len(X)) < 0.1, "purpose"] = "car (new)"
+    return X
+
+
+def test_compiled_matches_pipeline(synthetic_df, fitted_pipeline) -> None:
+    scorer = compile_pipeline(fitted_pipeline)
+    X = _perturbed_features(synthetic_df)
+
+    verify_compiled_scorer(fitted_pipeline, scorer, X, atol=ATOL)
+    np.testing.assert_array_equal(scorer.predict(X), fitted_pipeline.predict(X))
+
+
+def test_compiled_single_row_matches_pipeline(synthetic_df, fitted_pipeline) -> None:
+    scorer = compile_pipeline(fitted_pipeline)
+    X = _perturbed_features(synthetic_df).head(50)
+
+    expected = fitted_pipeline.predict_proba(X)
+    for i, payload in enumerate(X.to_dict(orient="records")):
+        np.testing.assert_allclose(
+            scorer.predict_proba_one(payload), expected[i], rtol=0, atol=ATOL
+        )
+
+
+def test_compiled_arrays(synthetic_df, fitted_pipeline) -> None:
+    scorer = compile_pipeline(fitted_pipeline)
+    X = _perturbed_features(synthetic_df)
+
+    z = scorer.decision_function_arrays(
+        X[NUMERIC_FEATURES].to_numpy(dtype=float),
+        X[CATEGORICAL_FEATURES].to_numpy(dtype=object),
+    )
+    np.testing.assert_allclose(
+        z, fitted_pipeline.decision_function(X), rtol=0, atol=ATOL
+    )
+
+
+def test_predict_single_with_compiled_scorer(fitted_pipeline, valid_payload) -> None:
+    scorer = compile_pipeline(fitted_pipeline)
+
+    fast = predict_single(scorer, valid_payload)
+    reference = predict_single(fitted_pipeline, valid_payload)
+
+    assert fast.label == reference.label
+    assert fast.probability_bad == pytest.approx(reference.probability_bad, abs=ATOL)
+
+
+def test_compile_requires_fitted_pipeline() -> None:
+    with pytest.raises(ValueError):
+        compile_pipeline(build_logistic_regression_pipeline())
+
+
+def test_exported_artifact_matches_pipeline(tmp_path, synthetic_df, fitted_pipeline):
+    X = _perturbed_features(synthetic_df)
+    path, max_diff = export_pipeline(
+        fitted_pipeline, tmp_path / "scorer.json", X, metadata={"source": "test"}
+    )
+
+    assert max_diff <= ATOL
+    scorer = load_scorer(path)
+    verify_compiled_scorer(fitted_pipeline, scorer, X, atol=ATOL)
+    assert scorer.category_weights == compile_pipeline(fitted_pipeline).category_weights
+
+
+def test_load_rejects_unknown_artifact_version(tmp_path, fitted_pipeline) -> None:
+    path = save_compiled_scorer(compile_pipeline(fitted_pipeline), tmp_path / "s.json")
+    path.write_text(
+        path.read_text().replace('"format_version": 1', '"format_version": 99')
+    )
+
+    with pytest.raises(ValueError, match="non supporté"):
+        load_compiled_scorer(path)
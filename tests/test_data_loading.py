@@ -0,0 +1,56 @@
+"""Tests pour le module data_loading (cache Parquet typé)."""
+
+import pandas as pd
+import pytest
+
+from credit_g_ml import data_loading
+from credit_g_ml.config import TARGET_COL
+from credit_g_ml.schemas import ALL_FEATURES, CATEGORICAL_FEATURES
+
+
+@pytest.fixture()
+def data_dirs(monkeypatch, tmp_path, synthetic_df):
+    raw_dir, processed_dir = tmp_path / "raw", tmp_path / "processed"
+    raw_dir.mkdir()
+    synthetic_df.to_csv(raw_dir / "credit_g_raw.csv", index=False)
+    monkeypatch.setattr(data_loading, "RAW_DATA_DIR", raw_dir)
+    monkeypatch.setattr(data_loading, "PROCESSED_DATA_DIR", processed_dir)
+    return raw_dir, processed_dir
+
+
+def test_load_builds_typed_parquet(data_dirs, synthetic_df):
+    _, processed_dir = data_dirs
+
+    df = data_loading.load_local_credit_g()
+
+    assert (processed_dir / "credit_g.parquet").exists()
+    assert all(
+        isinstance(df[c].dtype, pd.CategoricalDtype) for c in CATEGORICAL_FEATURES
+    )
+    assert df["duration"].dtype.itemsize < 8
+    # Mêmes valeurs que le CSV lu sans cache
+    raw = data_loading.load_local_credit_g(use_processed=False)
+    pd.testing.assert_frame_equal(df, raw)
+    assert (
+        df[ALL_FEATURES + [TARGET_COL]]
+        .astype(object)
+        .equals(synthetic_df[ALL_FEATURES + [TARGET_COL]].astype(object))
+    )
+
+
+def test_load_with_column_projection(data_dirs):
+    df = data_loading.load_local_credit_g(columns=["age", "purpose"])
+    assert list(df.columns) == ["age", "purpose"]
+
+
+def test_processed_file_is_rebuilt_when_raw_changes(data_dirs, synthetic_df):
+    raw_dir, _ = data_dirs
+    path = data_loading.build_processed_credit_g()
+    built_at = path.stat().st_mtime_ns
+
+    # Simple touch : le hash est identique, pas de reconstruction
+    (raw_dir / "credit_g_raw.csv").touch()
+    assert data_loading.build_processed_credit_g().stat().st_mtime_ns == built_at
+
+    synthetic_df.head(10).to_csv(raw_dir / "credit_g_raw.csv", index=False)
+    assert len(data_loading.load_local_credit_g()) == 10
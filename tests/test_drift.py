@@ -0,0 +1,131 @@
+"""Tests pour la surveillance de dérive (profil, PSI, modalités inconnues)."""
+
+import threading
+
+import pytest
+
+from credit_g_ml.drift import (
+    DriftMonitor,
+    build_reference_profile,
+    load_reference_profile,
+    population_stability_index,
+    save_reference_profile,
+)
+from credit_g_ml.preprocessing import split_features_target
+
+
+@pytest.fixture(scope="module")
+def features(synthetic_df):
+    X, _ = split_features_target(synthetic_df)
+    return X
+
+
+@pytest.fixture(scope="module")
+def profile(features):
+    return build_reference_profile(features)
+
+
+def _payloads(X):
+    return X.astype(object).to_dict(orient="records")
+
+
+def test_profile_roundtrip(tmp_path, profile) -> None:
+    model_path = tmp_path / "model.joblib"
+    path = save_reference_profile(profile, model_path)
+    assert path.name == "model.drift.json"
+
+    loaded = load_reference_profile(model_path)
+    assert loaded == profile
+    for proportions in loaded.numeric_proportions.values():
+        assert sum(proportions) == pytest.approx(1.0)
+
+    with pytest.raises(FileNotFoundError):
+        load_reference_profile(tmp_path / "other.joblib")
+
+
+def test_psi_is_zero_for_identical_distributions() -> None:
+    assert population_stability_index([0.5, 0.5], [0.5, 0.5]) == 0.0
+    assert population_stability_index([0.5, 0.5], [0.9, 0.1]) > 0.25
+
+
+def test_training_like_traffic_is_stable(profile, features) -> None:
+    monitor = DriftMonitor(profile)
+    monitor.observe_batch(_payloads(features))
+
+    report = monitor.report()
+    assert report["n_observed"] == len(features)
+    assert report["max_psi"] < 1e-6
+    assert report["unseen_rate"] == 0.0
+
+
+def test_shifted_traffic_and_unseen_categories(profile, features) -> None:
+    shifted = features.assign(age=features["age"] + 40, purpose="crypto")
+    monitor = DriftMonitor(profile)
+    for payload in _payloads(shifted):
+        monitor.observe(payload)
+
+    report = monitor.report()
+    assert report["features"]["age"]["status"] == "significant"
+    assert report["features"]["purpose"]["unseen_rate"] == 1.0
+    assert report["features"]["housing"]["unseen_rate"] == 0.0
+    assert report["features"]["duration"]["status"] == "stable"
+
+
+def test_single_and_batch_updates_agree(profile, features) -> None:
+    payloads = _payloads(features.head(100))
+    one_by_one, batched = DriftMonitor(profile), DriftMonitor(profile)
+    for payload in payloads:
+        one_by_one.observe(payload)
+    batched.observe_batch(payloads)
+
+    assert one_by_one.report()["features"] == batched.report()["features"]
+
+
+def test_concurrent_updates_are_not_lost(profile, features) -> None:
+    payload = _payloads(features.head(1))[0]
+    monitor = DriftMonitor(profile, n_shards=4)
+
+    def worker() -> None:
+        for _ in range(500):
+            monitor.observe(payload)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert monitor.report()["n_observed"] == 4000
+
+
+def test_threads_record_into_different_shards(profile, features) -> None:
+    payload = _payloads(features.head(1))[0]
+    monitor = DriftMonitor(profile, n_shards=4)
+    # Tous vivants en même temps : identifiants de thread distincts
+    barrier = threading.Barrier(2)
+
+    def worker() -> None:
+        barrier.wait()
+        monitor.observe(payload)
+        barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(shard.n for shard in monitor._shards) == [0, 0, 1, 1]
+
+
+def test_report_is_refreshed_periodically(profile, features) -> None:
+    now = [0.0]
+    monitor = DriftMonitor(profile, refresh_interval_s=60, clock=lambda: now[0])
+    payload = _payloads(features.head(1))[0]
+
+    monitor.observe(payload)
+    assert monitor.report()["n_observed"] == 1
+    monitor.observe(payload)
+    assert monitor.report()["n_observed"] == 1  # rapport en cache
+    now[0] = 61.0
+    assert monitor.report()["n_observed"] == 2
+    monitor.reset()
+    assert monitor.report()["n_observed"] == 0
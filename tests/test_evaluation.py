@@ -0,0 +1,97 @@
+"""Tests pour le module evaluation (métriques, bootstrap, validation croisée)."""
+
+import json
+
+import numpy as np
+import pytest
+from sklearn.metrics import brier_score_loss, roc_auc_score, roc_curve
+
+from credit_g_ml.evaluation import (
+    METRIC_NAMES,
+    HoldoutScores,
+    _bootstrap_block_sizes,
+    binary_metrics,
+    bootstrap_metrics,
+    build_evaluation_report,
+    confusion_counts,
+    cross_validate_metrics,
+    score_holdout,
+    write_evaluation_report,
+)
+from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.preprocessing import train_test_split_credit_g
+
+
+def _scores(n: int = 300, seed: int = 0) -> HoldoutScores:
+    rng = np.random.default_rng(seed)
+    y_bad = rng.uniform(size=n) < 0.3
+    # Arrondi : beaucoup d'ex aequo
+    p_bad = np.round(np.clip(0.3 + 0.3 * y_bad + rng.normal(0, 0.25, n), 0, 1), 2)
+    return HoldoutScores(y_bad=y_bad, p_bad=p_bad)
+
+
+def test_metrics_match_sklearn() -> None:
+    scores = _scores()
+    metrics = binary_metrics(scores, threshold=0.5)
+    fpr, tpr, _ = roc_curve(scores.y_bad, scores.p_bad)
+
+    assert metrics["roc_auc"] == pytest.approx(
+        roc_auc_score(scores.y_bad, scores.p_bad)
+    )
+    assert metrics["ks"] == pytest.approx(np.max(tpr - fpr))
+    assert metrics["brier"] == pytest.approx(
+        brier_score_loss(scores.y_bad, scores.p_bad)
+    )
+
+    counts = confusion_counts(scores, threshold=0.5)
+    assert metrics["recall"] == pytest.approx(counts["tp"] / scores.y_bad.sum())
+    assert metrics["precision"] == pytest.approx(
+        counts["tp"] / (counts["tp"] + counts["fp"])
+    )
+
+    # Lift : taux de "bad" des 30 dossiers les mieux notés / taux global
+    order = np.argsort(-scores.p_bad, kind="stable")
+    expected_lift = scores.y_bad[order[:30]].mean() / scores.y_bad.mean()
+    assert metrics["lift_top_decile"] == pytest.approx(expected_lift)
+
+
+def test_bootstrap_intervals_are_reproducible() -> None:
+    scores = _scores()
+    intervals = bootstrap_metrics(scores, n_resamples=500, n_jobs=1)
+    assert set(intervals) == set(METRIC_NAMES)
+
+    point = binary_metrics(scores)
+    for name, (low, high) in intervals.items():
+        assert low <= point[name] <= high, name
+    assert bootstrap_metrics(scores, n_resamples=500, n_jobs=1) == intervals
+
+
+def test_bootstrap_is_split_across_workers() -> None:
+    # Jeu de test de 200 lignes : la borne mémoire seule ferait un bloc unique
+    assert _bootstrap_block_sizes(2000, 200, 4) == [500] * 4
+    assert _bootstrap_block_sizes(10, 200, 4) == [3, 3, 3, 1]
+    assert _bootstrap_block_sizes(2000, 1_000_000, 4) == [2] * 1000
+    assert _bootstrap_block_sizes(2000, 200, 1) == [2000]
+
+
+def test_evaluation_report(tmp_path, synthetic_df) -> None:
+    X_train, X_test, y_train, y_test = train_test_split_credit_g(synthetic_df)
+    pipeline = build_logistic_regression_pipeline().fit(X_train, y_train)
+    scores = score_holdout(pipeline, X_test, y_test)
+    assert len(scores.p_bad) == len(X_test)
+    np.testing.assert_allclose(
+        scores.p_bad, pipeline.predict_proba(X_test)[:, 0]  # classes : bad, good
+    )
+
+    cv = cross_validate_metrics(
+        pipeline, X_train, y_train, n_splits=3, n_repeats=2, n_jobs=1
+    )
+    report = build_evaluation_report(
+        scores, n_resamples=200, n_jobs=1, cross_validation=cv
+    )
+    path = write_evaluation_report(report, tmp_path / "evaluation.json")
+
+    loaded = json.loads(path.read_text(encoding="utf-8"))
+    assert set(loaded["holdout"]["metrics"]) == set(METRIC_NAMES)
+    assert sum(loaded["holdout"]["confusion"].values()) == len(X_test)
+    assert loaded["cross_validation"]["metrics"]["roc_auc"]["mean"] > 0.5
@@ -0,0 +1,63 @@
+"""Tests des explications par feature (modèles linéaires)."""
+
+import numpy as np
+import pytest
+
+from credit_g_ml.compiled import (
+    compile_pipeline,
+    load_compiled_scorer,
+    save_compiled_scorer,
+)
+from credit_g_ml.explain import explain_batch, explain_frame, explain_single
+from credit_g_ml.modeling import build_hist_gradient_boosting_pipeline
+from credit_g_ml.preprocessing import split_features_target
+from credit_g_ml.schemas import ALL_FEATURES
+
+
+def test_contributions_sum_to_logit(fitted_pipeline, synthetic_df) -> None:
+    X, _ = split_features_target(synthetic_df)
+    explanation = explain_frame(fitted_pipeline, X)
+
+    assert explanation.contributions.shape == (len(X), len(ALL_FEATURES))
+    p_bad = 1.0 / (1.0 + np.exp(-explanation.logit_bad()))
+    expected = fitted_pipeline.predict_proba(X)[
+        :, list(fitted_pipeline.classes_).index("bad")
+    ]
+    np.testing.assert_allclose(p_bad, expected, atol=1e-12)
+
+
+def test_compiled_artifact_gives_same_explanation(
+    fitted_pipeline, synthetic_df, tmp_path
+) -> None:
+    X, _ = split_features_target(synthetic_df)
+    path = save_compiled_scorer(compile_pipeline(fitted_pipeline), tmp_path / "s.json")
+    scorer = load_compiled_scorer(path)
+
+    expected = explain_frame(fitted_pipeline, X)
+    actual = explain_frame(scorer, X)
+    np.testing.assert_allclose(actual.contributions, expected.contributions)
+    assert actual.base_value == pytest.approx(expected.base_value)
+
+
+def test_top_contributions_sorted_by_magnitude(fitted_pipeline, synthetic_df) -> None:
+    X, _ = split_features_target(synthetic_df)
+    payloads = X.astype(object).to_dict(orient="records")[:50]
+
+    explanations = explain_batch(fitted_pipeline, payloads, top_k=4)
+    assert len(explanations) == 50
+    for payload, top in zip(payloads, explanations, strict=True):
+        magnitudes = [abs(c.contribution) for c in top]
+        assert magnitudes == sorted(magnitudes, reverse=True)
+        assert all(c.value == payload[c.feature] for c in top)
+
+    # Une modalité inconnue ne contribue pas (comme handle_unknown="ignore")
+    unknown = dict(payloads[0], purpose="inconnu")
+    contributions = explain_single(fitted_pipeline, unknown, top_k=len(ALL_FEATURES))
+    assert {c.feature: c.contribution for c in contributions}["purpose"] == 0.0
+
+
+def test_non_linear_model_is_rejected(synthetic_df) -> None:
+    X, y = split_features_target(synthetic_df)
+    pipeline = build_hist_gradient_boosting_pipeline(max_iter=5).fit(X, y)
+    with pytest.raises(ValueError, match="linéaires"):
+        explain_frame(pipeline, X)
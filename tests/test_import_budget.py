@@ -0,0 +1,63 @@
+"""Budget de démarrage à froid : import léger de l'API de serving.
+
+L'import de `api.app` ne doit charger ni les dépendances d'entraînement
+(openml), ni celles de visualisation (matplotlib, seaborn), ni pandas /
+scikit-learn (chargés avec le premier modèle). Les budgets de temps et de
+mémoire sont ajustables via IMPORT_TIME_BUDGET_S et IMPORT_RSS_BUDGET_MB.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+FORBIDDEN_SERVING_MODULES = ["openml", "matplotlib", "seaborn", "sklearn", "pandas"]
+IMPORT_TIME_BUDGET_S = float(os.getenv("IMPORT_TIME_BUDGET_S", "2.0"))
+IMPORT_RSS_BUDGET_MB = float(os.getenv("IMPORT_RSS_BUDGET_MB", "100"))
+
+# Pic de RSS : VmHWM sous Linux (ru_maxrss hérite du pic du processus parent)
+_PROBE = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import api.app
+elapsed = time.perf_counter() - start
+if os.path.exists("/proc/self/status"):
+    with open("/proc/self/status") as f:
+        hwm = next(line for line in f if line.startswith("VmHWM:"))
+    rss_mb = int(hwm.split()[1]) / 2**10
+else:
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+modules = [m for m in {forbidden!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "rss_mb": rss_mb, "modules": modules}}))
+"""
+
+
+def _probe_import(tmp_path: Path) -> dict:
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(PROJECT_ROOT / "src"),
+        MODEL_PATH=str(tmp_path / "absent.joblib"),
+        EAGER_MODEL_LOAD="0",
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(forbidden=FORBIDDEN_SERVING_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_serving_import_is_lean(tmp_path) -> None:
+    # Meilleur de 3 mesures pour limiter le bruit de la machine de CI
+    probes = [_probe_import(tmp_path) for _ in range(3)]
+
+    assert probes[0]["modules"] == []
+    assert min(p["elapsed"] for p in probes) < IMPORT_TIME_BUDGET_S
+    assert min(p["rss_mb"] for p in probes) < IMPORT_RSS_BUDGET_MB
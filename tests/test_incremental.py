@@ -0,0 +1,66 @@
+"""Tests pour le module incremental (entraînement hors mémoire)."""
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from credit_g_ml.compiled import compile_pipeline, verify_compiled_scorer
+from credit_g_ml.config import TARGET_COL
+from credit_g_ml.incremental import fit_streaming_stats, train_incremental
+from credit_g_ml.inference import load_model, predict_single
+from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.schemas import ALL_FEATURES, CATEGORICAL_FEATURES
+
+
+@pytest.fixture()
+def training_file(tmp_path, synthetic_df):
+    df = synthetic_df.copy()
+    df["credit_amount"] = df["credit_amount"].astype(float)
+    df.loc[df.index[::17], "credit_amount"] = np.nan
+    df.loc[df.index[::23], "purpose"] = np.nan
+    path = tmp_path / "train.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+def test_streaming_stats_match_in_memory_preprocessor(training_file):
+    path, df = training_file
+    stats = fit_streaming_stats(path, chunk_size=37)
+
+    reference = build_logistic_regression_pipeline().fit(
+        df[ALL_FEATURES], df[TARGET_COL]
+    )
+    preprocessor = reference.named_steps["preprocessor"]
+    numeric = preprocessor.named_transformers_["num"]
+    categorical = preprocessor.named_transformers_["cat"]
+
+    np.testing.assert_allclose(
+        stats.numeric_medians, numeric.named_steps["imputer"].statistics_
+    )
+    np.testing.assert_allclose(stats.numeric_mean, numeric.named_steps["scaler"].mean_)
+    np.testing.assert_allclose(stats.numeric_var, numeric.named_steps["scaler"].var_)
+    assert [stats.categorical_values[c] for c in CATEGORICAL_FEATURES] == [
+        list(c) for c in categorical.named_steps["encoder"].categories_
+    ]
+    assert [stats.categorical_modes[c] for c in CATEGORICAL_FEATURES] == list(
+        categorical.named_steps["imputer"].statistics_
+    )
+    assert stats.n_rows == len(df)
+
+
+def test_incremental_pipeline_is_servable(training_file, tmp_path, valid_payload):
+    path, df = training_file
+    pipeline = train_incremental(path, chunk_size=50, n_epochs=5)
+
+    auc = roc_auc_score(
+        df[TARGET_COL] == "good", pipeline.predict_proba(df[ALL_FEATURES])[:, 1]
+    )
+    assert auc > 0.6
+
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(pipeline, model_path)
+    result = predict_single(load_model(model_path), valid_payload)
+    assert 0.0 <= result.probability_bad <= 1.0
+
+    verify_compiled_scorer(pipeline, compile_pipeline(pipeline), df[ALL_FEATURES])
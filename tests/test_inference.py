@@ -0,0 +1,83 @@
+"""Tests pour le module inference."""
+
+from __future__ import annotations
+
+import pytest
+
+from credit_g_ml.inference import (
+    predict_batch,
+    predict_single,
+    resolve_class_index,
+)
+from credit_g_ml.preprocessing import split_features_target
+
+
+def test_predict_batch_matches_predict_single(synthetic_df, fitted_pipeline) -> None:
+    X, _ = split_features_target(synthetic_df.head(25))
+    payloads = X.to_dict(orient="records")
+
+    batch = predict_batch(fitted_pipeline, payloads)
+
+    assert len(batch) == len(payloads)
+    for payload, result in zip(payloads, batch, strict=True):
+        single = predict_single(fitted_pipeline, payload)
+        assert result.label == single.label
+        assert result.probability_bad == pytest.approx(single.probability_bad)
+        assert result.probability_good == pytest.approx(single.probability_good)
+
+
+def test_predict_batch_empty(fitted_pipeline) -> None:
+    assert predict_batch(fitted_pipeline, []) == []
+
+
+def test_predict_batch_missing_feature(fitted_pipeline, valid_payload) -> None:
+    incomplete = dict(valid_payload)
+    del incomplete["age"]
+    with pytest.raises(ValueError, match="ligne 1"):
+        predict_batch(fitted_pipeline, [valid_payload, incomplete])
+
+
+def test_predict_single_label_matches_predict(synthetic_df, fitted_pipeline) -> None:
+    X, _ = split_features_target(synthetic_df.head(40))
+    expected = fitted_pipeline.predict(X)
+
+    for payload, label in zip(X.to_dict(orient="records"), expected, strict=True):
+        assert predict_single(fitted_pipeline, payload).label == label
+
+
+def test_predict_single_calls_model_once(fitted_pipeline, valid_payload) -> None:
+    calls = []
+
+    class CountingPipeline:
+        classes_ = fitted_pipeline.classes_
+
+        def predict_proba(self, X):
+            calls.append("predict_proba")
+            return fitted_pipeline.predict_proba(X)
+
+        def predict(self, X):  # pragma: no cover - ne doit pas être appelé
+            calls.append("predict")
+            return fitted_pipeline.predict(X)
+
+    predict_single(CountingPipeline(), valid_payload)
+    assert calls == ["predict_proba"]
+
+
+def test_predict_single_explicit_threshold(fitted_pipeline, valid_payload) -> None:
+    result = predict_single(fitted_pipeline, valid_payload)
+
+    assert predict_single(fitted_pipeline, valid_payload, threshold=0.0).label == "bad"
+    assert predict_single(fitted_pipeline, valid_payload, threshold=1.01).label == (
+        "good"
+    )
+    at_score = predict_single(
+        fitted_pipeline, valid_payload, threshold=result.probability_bad
+    )
+    assert at_score.label == "bad"
+
+
+def test_class_index_resolved_once(fitted_pipeline) -> None:
+    first = resolve_class_index(fitted_pipeline)
+    assert resolve_class_index(fitted_pipeline) is first
+    assert first.classes[first.bad] == "bad"
+    assert first.classes[first.good] == "good"
@@ -0,0 +1,55 @@
+"""Tests pour le module metadata (vocabulaires catégoriels du modèle)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from credit_g_ml.metadata import (
+    categorical_values_from_pipeline,
+    compute_categorical_values,
+    load_categorical_values,
+    metadata_path_for,
+    save_categorical_values,
+)
+from credit_g_ml.schemas import CATEGORICAL_FEATURES
+
+
+def test_sidecar_roundtrip(tmp_path, synthetic_df) -> None:
+    model_path = tmp_path / "model.joblib"
+    model_path.write_bytes(b"model")
+    values = compute_categorical_values(synthetic_df)
+
+    path = save_categorical_values(values, model_path)
+
+    assert path == metadata_path_for(model_path)
+    assert load_categorical_values(model_path) == values
+    assert list(values) == CATEGORICAL_FEATURES
+
+
+def test_cache_invalidated_when_model_changes(tmp_path, synthetic_df) -> None:
+    model_path = tmp_path / "model.joblib"
+    model_path.write_bytes(b"model")
+    values = compute_categorical_values(synthetic_df)
+    save_categorical_values(values, model_path)
+    assert load_categorical_values(model_path) is load_categorical_values(model_path)
+
+    # Nouveau modèle : nouvelles métadonnées, mtime différent
+    new_values = dict(values, housing=["own"])
+    save_categorical_values(new_values, model_path)
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_categorical_values(model_path)["housing"] == ["own"]
+
+
+def test_fallback_to_pipeline(tmp_path, synthetic_df, fitted_pipeline) -> None:
+    model_path = tmp_path / "model.joblib"
+
+    with pytest.raises(FileNotFoundError):
+        load_categorical_values(model_path)
+
+    values = load_categorical_values(model_path, pipeline=fitted_pipeline)
+    assert values == categorical_values_from_pipeline(fitted_pipeline)
+    assert values == compute_categorical_values(synthetic_df)
@@ -0,0 +1,101 @@
+"""Tests pour api.model_store (chargement, préchauffage, rechargement à chaud)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import joblib
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT / "src"))
+
+from api.model_store import ModelStore  # noqa: E402
+from credit_g_ml.compiled import (  # noqa: E402
+    CompiledLogisticScorer,
+    compile_pipeline,
+    save_compiled_scorer,
+)
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_concurrent_first_access_loads_once(tmp_path, fitted_pipeline, monkeypatch):
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(fitted_pipeline, model_path)
+    store = ModelStore(model_path)
+    loads = []
+    original = store._load
+
+    def counting_load():
+        loads.append(1)
+        return original()
+
+    monkeypatch.setattr(store, "_load", counting_load)
+    threads = [threading.Thread(target=store.current) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 1
+    assert store.ready
+
+
+def test_reload_if_changed(tmp_path, fitted_pipeline, valid_payload):
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(fitted_pipeline, model_path)
+    store = ModelStore(model_path, warmup_payload=valid_payload)
+    first = store.load()
+
+    assert store.reload_if_changed() is False
+
+    _bump_mtime(model_path)
+    assert store.reload_if_changed() is True
+    assert store.current() is not first
+    assert store.status()["reloads"] == 1
+
+
+def test_serves_compiled_artifact(tmp_path, fitted_pipeline, valid_payload):
+    model_path = save_compiled_scorer(
+        compile_pipeline(fitted_pipeline), tmp_path / "scorer.json"
+    )
+    store = ModelStore(model_path, warmup_payload=valid_payload)
+
+    assert isinstance(store.load().scorer, CompiledLogisticScorer)
+
+
+def test_after_fork_resets_lock_and_restarts_watcher(tmp_path, fitted_pipeline):
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(fitted_pipeline, model_path)
+    store = ModelStore(model_path)
+    store.start_watching(60.0)
+    # État hérité d'un fork : verrou pris par un thread du parent, thread absent
+    store._load_lock.acquire()
+
+    store.after_fork()
+    try:
+        assert store.load() is store.current()
+        assert store._watcher is not None and store._watcher.is_alive()
+    finally:
+        store.stop_watching()
+
+
+def test_failed_reload_keeps_previous_model(tmp_path, fitted_pipeline):
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(fitted_pipeline, model_path)
+    store = ModelStore(model_path)
+    first = store.load()
+
+    model_path.unlink()
+    with pytest.raises(FileNotFoundError):
+        store.load()
+
+    assert store.current() is first
+    assert store.status()["reload_failures"] == 1
@@ -1,9 +1,42 @@
 """Tests pour le module modeling."""
 
-from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.inference import predict_single
+from credit_g_ml.metadata import categorical_values_from_pipeline
+from credit_g_ml.modeling import (
+    MODEL_BUILDERS,
+    build_hist_gradient_boosting_pipeline,
+    build_logistic_regression_pipeline,
+)
+from credit_g_ml.preprocessing import split_features_target
+from credit_g_ml.schemas import CATEGORICAL_FEATURES
 
 
 def test_build_logistic_pipeline() -> None:
     pipeline = build_logistic_regression_pipeline()
     assert "preprocessor" in pipeline.named_steps
     assert "model" in pipeline.named_steps
+
+
+def test_hist_gradient_boosting_native_categoricals(synthetic_df) -> None:
+    pipeline = build_hist_gradient_boosting_pipeline(max_iter=20)
+    X, y = split_features_target(synthetic_df)
+    pipeline.fit(X, y)
+
+    # Catégorielles encodées en codes ordinaux et déclarées natives au modèle
+    model = pipeline.named_steps["model"]
+    assert model.is_categorical_ is not None
+    assert model.is_categorical_.sum() == len(CATEGORICAL_FEATURES)
+
+    payload = X.iloc[0].to_dict()
+    payload["purpose"] = "modalité jamais vue"
+    result = predict_single(pipeline, payload)
+    assert result.label in {"bad", "good"}
+    assert abs(result.probability_bad + result.probability_good - 1) < 1e-9
+
+    values = categorical_values_from_pipeline(pipeline)
+    assert set(values) == set(CATEGORICAL_FEATURES)
+    assert all(isinstance(v, str) for col in values.values() for v in col)
+
+
+def test_model_builders_registry() -> None:
+    assert set(MODEL_BUILDERS) == {"logistic_regression", "hist_gradient_boosting"}
@@ -0,0 +1,76 @@
+"""Tests pour l'évaluation en flux de fichiers scorés."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import brier_score_loss, roc_auc_score, roc_curve
+
+from credit_g_ml.streaming_evaluation import (
+    StreamingEvaluator,
+    evaluate_scored_files,
+    plot_evaluation,
+)
+
+
+def _scored(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    bad = rng.uniform(size=n) < 0.3
+    p_bad = 1 / (1 + np.exp(-(-1 + 1.2 * bad + rng.normal(0, 1, n))))
+    return pd.DataFrame(
+        {"probability_bad": p_bad, "class": np.where(bad, "bad", "good")}
+    )
+
+
+def test_metrics_within_error_bounds() -> None:
+    df = _scored(20_000)
+    y, p = (df["class"] == "bad").to_numpy(), df["probability_bad"].to_numpy()
+
+    evaluator = StreamingEvaluator(n_bins=1000)
+    for start in range(0, len(df), 3000):
+        evaluator.update(p[start : start + 3000], y[start : start + 3000])
+
+    assert evaluator.n_rows == len(df)
+    exact_auc = roc_auc_score(y, p)
+    assert abs(evaluator.roc_auc() - exact_auc) <= evaluator.auc_error_bound()
+    assert evaluator.auc_error_bound() < 1e-3
+    fpr, tpr, _ = roc_curve(y, p)
+    assert abs(evaluator.ks()[0] - np.max(tpr - fpr)) <= evaluator.ks_error_bound()
+    assert evaluator.brier() == pytest.approx(brier_score_loss(y, p))
+
+    calibration = evaluator.calibration_curve(10)
+    assert sum(c["n_rows"] for c in calibration) == len(df)
+    for c in calibration:
+        assert c["bin_low"] <= c["mean_predicted"] <= c["bin_high"]
+
+
+def test_merge_equals_single_pass() -> None:
+    df = _scored(5000)
+    y, p = (df["class"] == "bad").to_numpy(), df["probability_bad"].to_numpy()
+    whole, first, second = (StreamingEvaluator(n_bins=100) for _ in range(3))
+    whole.update(p, y)
+    first.update(p[:2000], y[:2000])
+    second.update(p[2000:], y[2000:])
+
+    merged = first.merge(second)
+    np.testing.assert_array_equal(merged.bad, whole.bad)
+    assert merged.roc_auc() == pytest.approx(whole.roc_auc())
+
+
+def test_scored_files_and_headless_plots(tmp_path) -> None:
+    df = _scored(3000)
+    df.loc[0, "class"] = None  # issue inconnue : ignorée
+    df.iloc[:1500].to_csv(tmp_path / "2024.csv", index=False)
+    df.iloc[1500:].to_parquet(tmp_path / "2025.parquet", index=False)
+
+    evaluator = evaluate_scored_files(
+        [tmp_path / "2024.csv", tmp_path / "2025.parquet"], chunk_size=400
+    )
+    assert evaluator.n_rows == 2999 and evaluator.n_skipped == 1
+
+    report = evaluator.report()
+    paths = plot_evaluation(report, tmp_path / "plots")
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert report["roc_curve"]["fpr"][-1] == 1.0
+
+    with pytest.raises(ValueError):
+        evaluator.update([1.5], [True])
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT / "src"))
+
+from credit_g_ml import telemetry  # noqa: E402
+from credit_g_ml.inference import _predict_proba  # noqa: E402
+from credit_g_ml.schemas import ALL_FEATURES  # noqa: E402
+
+
+@pytest.fixture()
+def enabled():
+    previous = telemetry.is_enabled()
+    telemetry.set_enabled(True)
+    yield
+    telemetry.set_enabled(previous)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = telemetry.Registry()
+    hist = registry.histogram("t_seconds", "Test.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        hist.observe(value, stage="a")
+
+    text = registry.render()
+    assert "# TYPE t_seconds histogram" in text
+    assert 't_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 't_seconds_bucket{stage="a",le="1"} 2' in text
+    assert 't_seconds_bucket{stage="a",le="+Inf"} 3' in text
+    assert 't_seconds_count{stage="a"} 3' in text
+
+
+def test_stage_timer_disabled_records_nothing(enabled):
+    telemetry.set_enabled(False)
+    before = telemetry.STAGE_DURATION.count(stage="noop-test")
+    with telemetry.stage_timer("noop-test"):
+        pass
+    assert telemetry.STAGE_DURATION.count(stage="noop-test") == before
+
+
+def test_predict_proba_by_stage_matches_pipeline(
+    enabled, fitted_pipeline, synthetic_df
+):
+    X = synthetic_df[ALL_FEATURES].head(20)
+    before = telemetry.STAGE_DURATION.count(stage="preprocess")
+
+    proba = _predict_proba(fitted_pipeline, X)
+
+    np.testing.assert_allclose(proba, fitted_pipeline.predict_proba(X))
+    assert telemetry.STAGE_DURATION.count(stage="preprocess") == before + 1
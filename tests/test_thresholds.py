@@ -0,0 +1,81 @@
+"""Tests pour le module thresholds (balayage vectorisé des seuils)."""
+
+import numpy as np
+import pytest
+
+from credit_g_ml.thresholds import (
+    CostMatrix,
+    risk_level,
+    risk_level_counts,
+    sweep_thresholds,
+)
+
+
+def _brute_force(scores, bad, exposures, threshold, costs):
+    rejected = scores >= threshold
+    fp = np.sum(rejected & ~bad)
+    fn = np.sum(~rejected & bad)
+    return {
+        "approval_rate": np.mean(~rejected),
+        "true_positive": np.sum(rejected & bad),
+        "false_positive": fp,
+        "false_negative": fn,
+        "true_negative": np.sum(~rejected & ~bad),
+        "expected_loss": np.sum((scores * exposures)[~rejected]),
+        "cost": costs.false_positive * fp + costs.false_negative * fn,
+    }
+
+
+def test_sweep_matches_brute_force_with_ties():
+    rng = np.random.default_rng(0)
+    # Scores arrondis : beaucoup d'ex aequo
+    scores = np.round(rng.uniform(size=500), 2)
+    bad = rng.uniform(size=500) < scores
+    exposures = rng.uniform(100, 1000, size=500)
+    costs = CostMatrix(false_positive=1.0, false_negative=5.0)
+
+    sweep = sweep_thresholds(scores, bad, exposures, costs=costs)
+
+    assert len(sweep.thresholds) == len(np.unique(scores)) + 1
+    for i in range(len(sweep.thresholds)):
+        expected = _brute_force(scores, bad, exposures, sweep.thresholds[i], costs)
+        row = sweep.row(i)
+        for key, value in expected.items():
+            assert row[key] == pytest.approx(value), (i, key)
+
+    brute_costs = [
+        _brute_force(scores, bad, exposures, t, costs)["cost"] for t in sweep.thresholds
+    ]
+    assert sweep.cost[sweep.optimal_index] == pytest.approx(min(brute_costs))
+
+
+def test_sweep_endpoints_and_grid_lookup():
+    scores = np.array([0.1, 0.5, 0.5, 0.9])
+    sweep = sweep_thresholds(scores)
+
+    assert sweep.row(0)["approval_rate"] == 1.0
+    assert sweep.row(len(sweep.thresholds) - 1)["approval_rate"] == 0.0
+    # Sans labels : effectifs espérés (somme des p(bad) refusés)
+    assert not sweep.observed
+    assert sweep.row(sweep.index_at(0.5))["true_positive"] == pytest.approx(1.9)
+    assert [r["n_rejected"] for r in sweep.at([0.0, 0.5, 0.6, 1.0])] == [4, 3, 1, 0]
+
+
+def test_sweep_rejects_empty_portfolio():
+    with pytest.raises(ValueError):
+        sweep_thresholds([])
+
+
+@pytest.mark.parametrize("scores", [[0.2, 1.5], [-0.1, 0.3], [0.2, float("nan")]])
+def test_sweep_rejects_invalid_scores(scores):
+    with pytest.raises(ValueError):
+        sweep_thresholds(scores)
+
+
+def test_risk_levels():
+    assert [risk_level(p) for p in (0.1, 0.4, 0.7)] == ["low", "medium", "high"]
+    assert risk_level_counts(np.array([0.1, 0.4, 0.7, 0.8])) == {
+        "low": 1,
+        "medium": 1,
+        "high": 2,
+    }
@@ -0,0 +1,32 @@
+"""Tests pour le module tuning."""
+
+from credit_g_ml.config import TARGET_COL
+from credit_g_ml.modeling import build_logistic_regression_pipeline
+from credit_g_ml.schemas import ALL_FEATURES
+from credit_g_ml.tuning import search_logistic_regression, write_leaderboard
+
+
+def test_search_returns_leaderboard_and_buildable_params(synthetic_df, tmp_path):
+    X, y = synthetic_df[ALL_FEATURES], synthetic_df[TARGET_COL]
+    grid = [
+        {"C": [0.1, 1.0], "l1_ratio": [0.0], "solver": ["lbfgs"]},
+        {"C": [1.0], "l1_ratio": [1.0], "solver": ["liblinear"]},
+    ]
+
+    result = search_logistic_regression(
+        X, y, param_grid=grid, cv=3, n_jobs=2, cache_dir=tmp_path / "cache"
+    )
+
+    assert len(result.leaderboard) == 3
+    assert list(result.leaderboard["rank_test_score"])[0] == 1
+    assert {"C", "l1_ratio", "solver", "mean_fit_time"} <= set(
+        result.leaderboard.columns
+    )
+    # Préprocessing mis en cache (un ajustement par fold, partagé par les candidats)
+    assert any((tmp_path / "cache").rglob("output.pkl"))
+
+    pipeline = build_logistic_regression_pipeline(**result.best_params)
+    assert pipeline.fit(X, y).predict_proba(X).shape == (len(X), 2)
+
+    path = write_leaderboard(result.leaderboard, tmp_path / "leaderboard.csv")
+    assert path.read_text().startswith("rank_test_score")
@@ -0,0 +1,105 @@
+"""Parité de la validation colonnaire avec le modèle pydantic CreditRiskRequest."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT / "src"))
+
+from api.schemas import CreditRiskRequest  # noqa: E402
+from api.validation import credit_risk_validator  # noqa: E402
+
+# Valeurs candidates : valides, hors bornes, à convertir ou de mauvais type
+NUMERIC_CANDIDATES = [
+    0,
+    1,
+    3,
+    4,
+    5,
+    11,
+    17,
+    18,
+    45,
+    120,
+    121,
+    -1,
+    2.0,
+    2.5,
+    0.0,
+    1e9,
+    float("nan"),
+    float("inf"),
+    "3",
+    " 30 ",
+    "abc",
+    "2.5",
+    True,
+    False,
+    None,
+    [1],
+    {"a": 1},
+]
+STRING_CANDIDATES = ["no checking", "<0", "", "inconnu", 3, 1.5, None, True, ["x"]]
+
+
+def _random_payload(rng: np.random.Generator, base: dict) -> dict:
+    payload = dict(base)
+    for name in rng.choice(list(base), size=rng.integers(0, 4), replace=False):
+        roll = rng.random()
+        if roll < 0.1:
+            del payload[name]
+        elif isinstance(base[name], str):
+            payload[name] = STRING_CANDIDATES[rng.integers(len(STRING_CANDIDATES))]
+        else:
+            payload[name] = NUMERIC_CANDIDATES[rng.integers(len(NUMERIC_CANDIDATES))]
+    if rng.random() < 0.1:
+        payload["extra_field"] = "ignoré"
+    return payload
+
+
+def _pydantic(payload):
+    try:
+        return CreditRiskRequest(**payload).model_dump(), None
+    except ValidationError as e:
+        return None, e.errors()
+
+
+def _same(a, b) -> bool:
+    # NaN != NaN : on compare les représentations
+    return repr(a) == repr(b)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parity_with_pydantic_on_random_inputs(valid_payload, seed) -> None:
+    rng = np.random.default_rng(seed)
+    payloads = [_random_payload(rng, valid_payload) for _ in range(300)]
+
+    result = credit_risk_validator.validate(payloads)
+
+    rows = dict(zip(result.valid_indices, result.rows, strict=True))
+    for i, payload in enumerate(payloads):
+        expected_row, expected_errors = _pydantic(payload)
+        if expected_errors is None:
+            assert i in rows and rows[i] == expected_row, payload
+        else:
+            assert i not in rows
+            assert _same(result.errors[i], expected_errors), payload
+
+
+def test_non_dict_rows_and_order(valid_payload) -> None:
+    result = credit_risk_validator.validate(
+        [valid_payload, "pas un objet", dict(valid_payload, age=12)]
+    )
+    assert result.valid_indices == [0]
+    assert list(result.errors) == [1, 2]
+    (error,) = result.errors[1]
+    assert error["type"] == "model_type"
+    assert error["loc"] == () and error["input"] == "pas un objet"
+    assert result.errors[2][0]["loc"] == ("age",)
+    assert isinstance(result.rows[0]["credit_amount"], float)